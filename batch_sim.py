@@ -0,0 +1,228 @@
+"""Struct-of-arrays survival ticks: one array slot per game, NumPy for the math.
+
+Covers the per-day rules of engine.GameEngine for whole batches at once,
+in the engine's order: turn start (the day-3 illness and the Easter egg
+roll), the day's action, check_end_conditions, then the night up to the
+next dawn. The night runs the one-off clock events (the visitor, the
+helicopter) before next_day, which ticks the status effects (poison,
+illness, well_fed) after the hunger and health costs. Warmth comes from
+``warm_bed``. All changes use the modify_stats clamps.
+
+Location events, hired workers and the menus are not modelled: a
+policy's (health, hunger) deltas stand in for the day's action.
+
+    python batch_sim.py -n 1000000 --action rest
+"""
+import argparse
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from clock import DAWN, HOURS_PER_DAY
+from engine import EASTER_EGGS, ENDINGS, LOCATIONS, GameEngine
+
+ONGOING = -1
+ENDING_CODES = {name: code for code, name in enumerate(ENDINGS)}
+VILLAGE = LOCATIONS.index("village")
+RUINS = LOCATIONS.index("ruins")
+EGG_BITS = {name: 1 << bit for bit, (_, name, _) in enumerate(EASTER_EGGS.bands)}
+AT_RUINS = 1 << len(EGG_BITS)  # Extra key bit: the lake egg only fires in the ruins
+
+
+def night_of(time):
+    """The day whose night (the run from its action to the next dawn) reaches clock ``time``"""
+    return (time - DAWN - 1) // HOURS_PER_DAY + 1
+
+# One-off clock events of a new game: name -> the day after which they fire
+NIGHT_EVENTS = {name: night_of(time) for time, name, every in GameEngine(seed=0).clock.entries() if every is None}
+ILLNESS_DAY = 3
+ILLNESS_LEVEL = 5  # Per-dawn health loss and hunger gain, for 2 days, unless medicine is taken
+WELL_FED_LEVEL = 3  # Per-dawn health gain, for 2 days, after a proper meal
+
+# Stat changes of the simple menu actions, as (health, hunger)
+ACTIONS = {
+    "idle": (0, 0),
+    "rest": (10, 5),
+}
+
+
+class BatchSimulator:
+    """Daily survival ticks for many games at once, one array slot per game"""
+    def __init__(self, size, seed=None):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+
+        self.health = np.full(size, 100, dtype=np.int16)
+        self.hunger = np.full(size, 50, dtype=np.int16)
+        self.poison = np.zeros(size, dtype=np.int16)
+        self.day = np.ones(size, dtype=np.int16)
+        self.gold = np.zeros(size, dtype=np.int32)
+        self.location = np.zeros(size, dtype=np.int8)  # Index into engine.LOCATIONS
+        self.warm_bed = np.zeros(size, dtype=bool)
+        self.know_rescue = np.zeros(size, dtype=bool)
+        self.rep_villagers = np.zeros(size, dtype=np.int16)
+        self.rep_hermit = np.zeros(size, dtype=np.int16)
+        self.eggs = np.zeros(size, dtype=np.uint8)  # Bit per EGG_BITS entry
+        self.eggs_found = np.zeros(size, dtype=np.int8)
+        self.ending = np.full(size, ONGOING, dtype=np.int8)  # Index into engine.ENDINGS
+        self.medicine = np.zeros(size, dtype=bool)
+        self.had_illness = np.zeros(size, dtype=bool)  # The secret_illness flag
+        self.illness = np.zeros(size, dtype=np.int16)  # Effect level, 0 = not ill
+        self.illness_until = np.zeros(size, dtype=np.int16)  # Last day it ticks
+        self.well_fed = np.zeros(size, dtype=np.int16)
+        self.well_fed_until = np.zeros(size, dtype=np.int16)
+        self.visitor = np.zeros(size, dtype=bool)  # The secret_visitor flag
+        self.helicopter_gone = np.zeros(size, dtype=bool)
+
+    def active(self):
+        return self.ending == ONGOING
+
+    def modify_stats(self, health=0, hunger=0, mask=None):
+        """Add health/hunger deltas (scalars or arrays) to active games and clamp to 0-100"""
+        live = self.active() if mask is None else mask & self.active()
+        np.clip(self.health + np.where(live, health, 0), 0, 100, out=self.health, casting="unsafe")
+        np.clip(self.hunger + np.where(live, hunger, 0), 0, 100, out=self.hunger, casting="unsafe")
+
+    def apply_poison_damage(self):
+        """Damage = poison * 0.5 (rounded down), then the poison decays by 10"""
+        poisoned = (self.poison > 0) & self.active()
+        self.modify_stats(health=-(self.poison // 2), mask=poisoned)
+        np.maximum(self.poison - np.where(poisoned, 10, 0), 0, out=self.poison, casting="unsafe")
+
+    def roll_illness(self):
+        """Day 3: a 39% fever (-20 health, +15 hunger); medicine is used up, otherwise it lingers 2 days"""
+        live = self.active()
+        sick = live & (self.day == ILLNESS_DAY) & ~self.had_illness
+        sick &= self.rng.integers(1, 101, self.size) < 40
+        self.modify_stats(health=-20, hunger=15, mask=sick)
+        self.had_illness |= sick
+        lingers = sick & ~self.medicine
+        self.medicine &= ~sick
+        self.add_effect(self.illness, self.illness_until, ILLNESS_LEVEL, lingers)
+
+    def add_well_fed(self, mask, level=WELL_FED_LEVEL):
+        """A proper meal today (cooked meat, venison): +level health at each of the next 2 dawns"""
+        self.add_effect(self.well_fed, self.well_fed_until, level, mask & self.active())
+
+    def add_effect(self, level, until, amount, mask):
+        """StatusEffects.add for 2 days from tomorrow: levels stack and the end day extends"""
+        level += np.where(mask, amount, 0).astype(level.dtype)
+        np.copyto(until, np.maximum(until, self.day + 2), where=mask)
+
+    def tick_effect(self, level, until, health_sign, hunger_sign, live):
+        """One dawn of a 2-day effect, which ends after its last day"""
+        on = live & (level > 0)
+        self.modify_stats(health=health_sign * level, hunger=hunger_sign * level, mask=on)
+        level[on & (self.day >= until)] = 0
+
+    def run_night(self):
+        """From the end of the action to the next dawn: one-off clock events, then next_day"""
+        live = self.active()
+        if (self.day[live] == NIGHT_EVENTS["visitor"]).any():
+            # A stranger leaves a gift (29%); no stat changes
+            self.visitor |= live & (self.day == NIGHT_EVENTS["visitor"]) & (self.rng.integers(1, 101, self.size) < 30)
+        # The helicopter only announces itself; rescue is decided by check_end_conditions
+        self.helicopter_gone |= live & (self.day == NIGHT_EVENTS["helicopter"])
+        self.next_day()
+
+    def roll_easter_eggs(self):
+        """The engine's per-turn Easter egg roll, as one batched alias draw per eligible set"""
+        live = self.active()
+        keys = self.eggs.astype(np.int32) | np.where(self.location == RUINS, AT_RUINS, 0)
+        for key in np.unique(keys[live]):
+            group = np.flatnonzero(live & (keys == key))
+            found = {name for name, bit in EGG_BITS.items() if key & bit}
+            view = SimpleNamespace(easter_eggs_found=found, location="ruins" if key & AT_RUINS else "forest")
+            table = EASTER_EGGS.table(view)
+            bits = np.array([EGG_BITS.get(outcome, 0) for outcome in table.outcomes], dtype=np.uint8)
+            new = bits[table.sample_indices(self.rng, len(group))]
+            self.eggs[group] |= new
+            self.eggs_found[group] += new != 0
+            artifact = np.zeros(self.size, dtype=bool)
+            artifact[group] = new == EGG_BITS["easter_artifact"]
+            self.modify_stats(health=5, mask=artifact)
+
+    def next_day(self):
+        """Advance the day: hunger +5..15, health -1..5 without warmth, then the status effect ticks"""
+        live = self.active()
+        self.day += live
+        self.modify_stats(hunger=self.rng.integers(5, 16, self.size, dtype=np.int16), mask=live)
+        self.modify_stats(health=-self.rng.integers(1, 6, self.size, dtype=np.int16), mask=live & ~self.warm_bed)
+        # Effects tick in a fixed order here; the engine ticks them in the order they were gained
+        self.apply_poison_damage()
+        self.tick_effect(self.illness, self.illness_until, -1, 1, live)
+        self.tick_effect(self.well_fed, self.well_fed_until, 1, 0, live)
+
+    def check_end_conditions(self):
+        """Set ``ending`` for every active game that just finished, in the engine's priority order"""
+        live = self.active()
+        rescued = (self.day >= 7) & (self.location == VILLAGE) & self.know_rescue
+        conditions = [
+            self.health <= 0,
+            self.hunger >= 90,
+            rescued & (self.rep_hermit > 15) & (self.rep_villagers > 15),
+            rescued & (self.eggs_found >= 4),
+            rescued & (self.health > 80),
+            rescued & (self.rep_villagers > 10),
+            rescued,
+            self.day >= 8,
+        ]
+        codes = [
+            ENDING_CODES["death"],
+            ENDING_CODES["starvation"],
+            ENDING_CODES["harmony"],
+            ENDING_CODES["enlightenment"],
+            ENDING_CODES["healthy_escape"],
+            ENDING_CODES["hero"],
+            ENDING_CODES["bare_escape"],
+            ENDING_CODES["timeout"],
+        ]
+        finished = np.select(conditions, codes, default=ONGOING)
+        np.copyto(self.ending, finished, where=live, casting="unsafe")
+
+    def step_day(self, health=0, hunger=0, mask=None):
+        """One full turn: illness and Easter eggs at turn start, the action's stat change, end check, then the night"""
+        self.roll_illness()
+        self.roll_easter_eggs()
+        self.modify_stats(health, hunger, mask)
+        self.check_end_conditions()
+        self.run_night()
+
+    def run(self, max_days=30, policy=None):
+        """Step until every game has ended; ``policy(sim)`` returns (health, hunger) deltas per day"""
+        for _ in range(max_days):
+            if not self.active().any():
+                break
+            health, hunger = policy(self) if policy else (0, 0)
+            self.step_day(health, hunger)
+        return self.tally()
+
+    def tally(self):
+        """Games per ending, plus "ongoing" for games that have not finished"""
+        counts = np.bincount(self.ending.astype(np.int64) + 1, minlength=len(ENDINGS) + 1)
+        result = {"ongoing": int(counts[0])}
+        for code, name in enumerate(ENDINGS):
+            result[name] = int(counts[code + 1])
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run daily survival ticks for a batch of games")
+    parser.add_argument("-n", "--games", type=int, default=1000000, help="number of games in the batch")
+    parser.add_argument("--action", choices=sorted(ACTIONS), default="rest", help="action taken every day")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    sim = BatchSimulator(args.games, args.seed)
+    health, hunger = ACTIONS[args.action]
+    started = time.perf_counter()
+    tally = sim.run(policy=lambda s: (health, hunger))
+    elapsed = time.perf_counter() - started
+
+    for name, count in tally.items():
+        print(f"{name:<16}{count:>12}")
+    print(f"\n{args.games} games in {elapsed:.3f}s")
+
+if __name__ == "__main__":
+    main()
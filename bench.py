@@ -0,0 +1,195 @@
+"""Micro-benchmarks for the engine's hot spots.
+
+    python bench.py npcs -n 100000
+    python bench.py clone -n 10000
+    python bench.py search -n 5000
+    python bench.py render -n 20
+"""
+import argparse
+import gc
+import os
+import random
+import time
+import tracemalloc
+
+from engine import NPC, HiredNPC, Quest
+
+
+def measure(build):
+    """Run ``build()`` and return (result, bytes still allocated by it, seconds)"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+def bench_npcs(args):
+    rng = random.Random(args.seed)
+    types = ["hermit", "villager", "merchant"]
+    hire_types = ["hunter", "gatherer", "scout", "cook"]
+    cases = [
+        ("NPC", lambda: [NPC(types[i % 3], rng) for i in range(args.count)]),
+        ("HiredNPC", lambda: [HiredNPC(hire_types[i % 4], "Worker", rng) for i in range(args.count)]),
+        ("Quest", lambda: [Quest(f"q{i}", "Title", "Description", [], 0) for i in range(args.count)]),
+    ]
+    print(f"{'Record':<12}{'Count':>10}{'Total':>12}{'Per object':>14}{'Build':>10}")
+    for label, build in cases:
+        objects, size, elapsed = measure(build)
+        print(f"{label:<12}{len(objects):>10}{size / 2**20:>10.1f}MB{size / len(objects):>12.0f} B"
+              f"{elapsed:>9.2f}s")
+        del objects
+
+def mid_game(seed, days=3):
+    """A game played with the cautious policy until ``days`` days have passed"""
+    from engine import GameEngine
+    from simulate import cautious_policy
+
+    rng = random.Random(seed)
+    game = GameEngine(seed=seed)
+    outcome = game.start("Bot")
+    while game.day <= days and not outcome.game_over:
+        outcome = game.step(cautious_policy(game, outcome, rng))
+    return game
+
+def bench_clone(args):
+    import copy
+    import snapshot
+    from engine import GameEngine
+
+    game = mid_game(args.seed)
+    cases = [
+        ("fork()", game.fork),
+        ("snapshot dump+load", lambda: snapshot.load(snapshot.dump(game), GameEngine())),
+        ("copy.deepcopy", lambda: copy.deepcopy(game)),
+    ]
+    print(f"Cloning a day-{game.day} game")
+    for label, clone in cases:
+        started = time.perf_counter()
+        for _ in range(args.count):
+            clone()
+        elapsed = time.perf_counter() - started
+        print(f"{label:<24}{args.count / elapsed:>12,.0f}/s{elapsed / args.count * 1e6:>10.1f} us")
+
+def bench_search(args):
+    from engine import GameEngine
+    from mcts import MCTS
+
+    game = GameEngine(seed=args.seed)
+    game.start("Bot")
+    for rollout in ("cautious", "random"):
+        search = MCTS(playouts=args.playouts, rollout=rollout, seed=args.seed)
+        search.choose(game)
+        print(f"{'MCTS, ' + rollout + ' rollouts':<24}{search.playouts_per_second():>12,.0f} playouts/s"
+              f"{search.steps / search.search_time:>12,.0f} steps/s{len(search.table):>10,} nodes")
+
+def bench_render(args):
+    """Per-input latency of the terminal game on a pseudo-terminal: os.system clears and
+    line-by-line writes against terminal.Screen"""
+    import pty
+    import statistics
+    import sys
+    import threading
+    from game import Game
+    from simulate import cautious_policy
+    from terminal import Screen
+
+    class LegacyScreen(Screen):
+        """The old output path: a write per line and a shell spawned for every clear"""
+        def write(self, text):
+            sys.stdout.write(text)
+
+        def clear(self):
+            os.system('cls' if os.name == 'nt' else 'clear')
+
+    class Bot(Game):
+        """Answers its own prompts with the cautious policy, timing answer -> next prompt drawn"""
+        def start_timing(self, rng, latencies):
+            self.rng_bot, self.latencies, self.answered = rng, latencies, None
+
+        def show_outcome(self, outcome):
+            self.last = outcome
+            super().show_outcome(outcome)
+
+        def read_line(self, prompt):
+            self.screen.write(prompt)
+            self.screen.flush()
+            if self.answered is not None:
+                self.latencies.append(time.perf_counter() - self.answered)
+            if "name" in prompt:
+                line = "Bot"
+            elif "Enter" in prompt:
+                line = ""
+            else:
+                line = cautious_policy(self, self.last, self.rng_bot)
+            self.answered = time.perf_counter()
+            return line
+
+    master, slave = pty.openpty()
+    drain = threading.Thread(target=lambda: _drain(master), daemon=True)
+    drain.start()
+    os.environ.setdefault("TERM", "xterm")
+    saved_fd, saved_stdout = os.dup(1), sys.stdout
+    os.dup2(slave, 1)  # os.system's clear writes to fd 1 too
+    sys.stdout = open(1, "w", encoding="utf-8", buffering=1, closefd=False)
+    results = []
+    try:
+        for label, screen in (("os.system + print", LegacyScreen), ("terminal.Screen", Screen)):
+            latencies = []
+            for i in range(args.games):
+                game = Bot(seed=args.seed + i)
+                game.screen = screen()
+                game.start_timing(random.Random(args.seed + i), latencies)
+                game.run()
+            results.append((label, latencies))
+    finally:
+        sys.stdout.close()
+        sys.stdout = saved_stdout
+        os.dup2(saved_fd, 1)
+        os.close(saved_fd)
+        os.close(slave)
+    print(f"{'Output path':<24}{'Inputs':>8}{'Mean':>10}{'Median':>10}{'p95':>10}")
+    for label, latencies in results:
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"{label:<24}{len(latencies):>8}{statistics.mean(latencies) * 1000:>8.2f}ms"
+              f"{statistics.median(latencies) * 1000:>8.2f}ms{p95 * 1000:>8.2f}ms")
+
+def _drain(fd):
+    """Read and drop everything written to a pseudo-terminal, like a terminal emulator would"""
+    try:
+        while os.read(fd, 65536):
+            pass
+    except OSError:
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description="Engine micro-benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    npcs_cmd = commands.add_parser("npcs", help="memory and build time of NPC, HiredNPC and Quest records")
+    npcs_cmd.add_argument("-n", "--count", type=int, default=100000)
+    npcs_cmd.add_argument("--seed", type=int, default=0)
+    npcs_cmd.set_defaults(run=bench_npcs)
+
+    clone_cmd = commands.add_parser("clone", help="fork() against snapshot round trips and deepcopy")
+    clone_cmd.add_argument("-n", "--count", type=int, default=10000)
+    clone_cmd.add_argument("--seed", type=int, default=0)
+    clone_cmd.set_defaults(run=bench_clone)
+
+    search_cmd = commands.add_parser("search", help="MCTS playouts per second from the opening")
+    search_cmd.add_argument("-n", "--playouts", type=int, default=5000)
+    search_cmd.add_argument("--seed", type=int, default=0)
+    search_cmd.set_defaults(run=bench_search)
+
+    render_cmd = commands.add_parser("render", help="per-input latency of the terminal game's output path")
+    render_cmd.add_argument("-n", "--games", type=int, default=20)
+    render_cmd.add_argument("--seed", type=int, default=0)
+    render_cmd.set_defaults(run=bench_render)
+
+    args = parser.parse_args()
+    args.run(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Hour-granularity game clock driven by a heap of scheduled events.
+
+Time is counted in hours since midnight before day 1, and days start at
+dawn. Nothing happens between scheduled events, so advancing the clock
+jumps from one due event to the next instead of stepping through hours:
+sleeping until the helicopter costs one heap pop per event on the way,
+not one step per hour. Handlers are looked up on the game by name, as
+``game.on_<name>()``, so the queue holds only plain data and can be saved.
+"""
+import heapq
+from itertools import count
+
+HOURS_PER_DAY = 24
+DAWN = 6
+
+
+def at(day, hour=DAWN):
+    """Clock time of ``hour`` o'clock on ``day``"""
+    return (day - 1) * HOURS_PER_DAY + hour
+
+
+class Clock:
+    """Current time plus a heap of (time, order, name, repeat every N hours or None)"""
+    def __init__(self, now=at(1)):
+        self.now = now
+        self.queue = []
+        self._order = count()
+
+    @property
+    def day(self):
+        return self.now // HOURS_PER_DAY + 1
+
+    @property
+    def hour(self):
+        return self.now % HOURS_PER_DAY
+
+    def schedule(self, name, time, every=None):
+        heapq.heappush(self.queue, (time, next(self._order), name, every))
+
+    def cancel(self, name):
+        self.queue = [entry for entry in self.queue if entry[2] != name]
+        heapq.heapify(self.queue)
+
+    def next_time(self, name=None):
+        """When ``name`` (or any event) is next due, or None if it is not scheduled"""
+        if name is None:
+            return self.queue[0][0] if self.queue else None
+        times = [time for time, _, event, _ in self.queue if event == name]
+        return min(times) if times else None
+
+    def advance_to(self, time, game):
+        """Run every event due up to ``time`` in order, then set the clock to ``time``"""
+        fired = 0
+        while self.queue and self.queue[0][0] <= time:
+            due, _, name, every = heapq.heappop(self.queue)
+            self.now = due
+            if every:
+                self.schedule(name, due + every, every)
+            getattr(game, "on_" + name)()
+            fired += 1
+            if getattr(game, "game_over", False):
+                return fired
+        self.now = max(self.now, time)
+        return fired
+
+    def advance(self, hours, game):
+        return self.advance_to(self.now + hours, game)
+
+    def fast_forward(self, name, game):
+        """Jump to the next ``name`` event, running everything due on the way; False if none is scheduled"""
+        time = self.next_time(name)
+        if time is None:
+            return False
+        self.advance_to(time, game)
+        return True
+
+    def copy(self):
+        other = Clock(self.now)
+        other.queue = list(self.queue)
+        other._order = count(next(self._order))
+        return other
+
+    def entries(self):
+        return sorted((time, name, every) for time, _, name, every in self.queue)
+
+    def restore(self, now, entries):
+        self.now = now
+        self.queue = []
+        for time, name, every in entries:
+            self.schedule(name, time, every)
@@ -0,0 +1,108 @@
+from collections import Counter
+
+# Recipe name -> {ingredient: count needed}
+RECIPES = {}
+# Ingredient -> names of the recipes that use it
+USED_IN = {}
+# Bumped by register_recipe; trackers built before it catch up the next time they are used
+REGISTERED = 0
+
+
+def register_recipe(name, ingredients):
+    """Compile a recipe's ingredient list into counts and index it by ingredient.
+
+    Trackers that already exist, e.g. those of games in progress, pick the
+    recipe up the next time they are used.
+    """
+    global REGISTERED
+    required = dict(Counter(ingredients))
+    for item in RECIPES.get(name, ()):
+        USED_IN[item].discard(name)  # Re-registered: drop the old ingredients from the index
+    RECIPES[name] = required
+    for item in required:
+        USED_IN.setdefault(item, set()).add(name)
+    REGISTERED += 1
+    return required
+
+for _name, _ingredients in [
+    ("bow", ["wooden_branch", "vine"]),
+    ("spear", ["wooden_branch", "sharp_stone"]),
+    ("medicine", ["herbs", "honey"]),
+    ("rope", ["vine", "vine"]),
+    ("fire_kit", ["dry_wood", "flint"]),
+    ("water_bottle", ["leather", "clay"]),
+]:
+    register_recipe(_name, _ingredients)
+
+
+class CraftingTracker:
+    """Keeps the set of recipes an inventory can craft right now.
+
+    Each recipe tracks how many of its ingredients are still short; an
+    inventory change only revisits the recipes that use the changed item.
+    """
+    def __init__(self, inventory):
+        self.inventory = inventory
+        self.sync()
+        inventory.listeners.append(self.on_change)
+
+    def sync(self):
+        """Recount every registered recipe against the inventory"""
+        inventory = self.inventory
+        self.short = {}
+        self._craftable = set()
+        for name, required in RECIPES.items():
+            short = sum(1 for item, need in required.items() if inventory.count(item) < need)
+            self.short[name] = short
+            if short == 0:
+                self._craftable.add(name)
+        self.counts = {item: inventory.count(item) for item in USED_IN}
+        self.registered = REGISTERED
+
+    @property
+    def craftable(self):
+        """Names of the recipes the inventory can craft right now"""
+        if self.registered != REGISTERED:
+            self.sync()
+        return self._craftable
+
+    def on_change(self, item, count):
+        if self.registered != REGISTERED:
+            self.sync()  # The inventory already holds this change
+            return
+        recipes = USED_IN.get(item)
+        if not recipes:
+            return
+        before = self.counts[item]
+        self.counts[item] = count
+        for name in recipes:
+            need = RECIPES[name][item]
+            if before >= need > count:
+                if self.short[name] == 0:
+                    self._craftable.discard(name)
+                self.short[name] += 1
+            elif count >= need > before:
+                self.short[name] -= 1
+                if self.short[name] == 0:
+                    self._craftable.add(name)
+
+    def copy(self, inventory):
+        """Tracker for ``inventory``, a copy of the one this tracker follows"""
+        other = CraftingTracker.__new__(CraftingTracker)
+        other.inventory = inventory
+        other._craftable = set(self.craftable)
+        other.short = dict(self.short)
+        other.counts = dict(self.counts)
+        other.registered = self.registered
+        inventory.listeners.append(other.on_change)
+        return other
+
+    def can_craft(self, name):
+        return name in self.craftable
+
+    def missing(self, name):
+        """First ingredient the inventory is short of, or None"""
+        for item, need in RECIPES[name].items():
+            if self.inventory.count(item) < need:
+                return item
+        return None
@@ -0,0 +1,836 @@
+import hashlib
+import random
+
+import events
+import workers
+from clock import DAWN, HOURS_PER_DAY, Clock, at
+from crafting import RECIPES, CraftingTracker
+from inventory import Inventory
+from quests import Flags, Quest, QuestTracker
+from roster import Roster
+from sampling import CascadeSampler
+from status import StatusEffects
+
+LOCATIONS = ["forest", "mountain", "village", "river", "cabin", "ruins", "hermit_cave"]
+HIRE_COSTS = {"hunter": 10, "gatherer": 5, "scout": 8, "cook": 7}
+ENDINGS = ["harmony", "enlightenment", "healthy_escape", "hero", "bare_escape", "death", "starvation", "timeout"]
+
+SEED_LIMIT = 2**63  # Seeds are saved as signed 64-bit integers (snapshot.HEADER)
+
+
+def game_seed(seed=None):
+    """``seed``, or a fresh random one; raises ValueError for seeds a save file cannot hold"""
+    if seed is None:
+        return random.randrange(SEED_LIMIT)
+    if not -SEED_LIMIT <= seed < SEED_LIMIT:
+        raise ValueError(f"seed must be between {-SEED_LIMIT} and {SEED_LIMIT - 1}, got {seed}")
+    return seed
+
+
+MENU_OPTIONS = [
+    ("1", "Explore"),
+    ("2", "Rest (reduces hunger by 5, minor health recovery)"),
+    ("3", "Forage (search for food)"),
+    ("4", "Check inventory"),
+    ("5", "Build shelter (if you have materials)"),
+    ("6", "Craft items"),
+    ("7", "Move to another location"),
+    ("8", "Manage Hired NPCs"),
+    ("9", "Eat food/Cook raw meat"),
+    ("10", "Wait for the helicopter (skip ahead)"),
+]
+MENU_WITHOUT_WAIT = MENU_OPTIONS[:-1]  # Once the helicopter has come and gone
+
+CRAFT_OPTIONS = [
+    ("1", "Bow (needs: wooden_branch, vine)"),
+    ("2", "Spear (needs: wooden_branch, sharp_stone)"),
+    ("3", "Medicine (needs: herbs, honey)"),
+    ("4", "Rope (needs: vine, vine)"),
+    ("5", "Fire Kit (needs: dry_wood, flint)"),
+    ("6", "Back"),
+]
+CRAFT_MAP = {"1": "bow", "2": "spear", "3": "medicine", "4": "rope", "5": "fire_kit"}
+
+TRAVEL_OPTIONS = [
+    ("1", "Forest"),
+    ("2", "Mountain"),
+    ("3", "Village"),
+    ("4", "River"),
+    ("5", "Cabin"),
+    ("6", "Ruins"),
+    ("7", "Hermit Cave"),
+    ("8", "Cancel"),
+]
+TRAVEL_MAP = {
+    "1": "forest", "2": "mountain", "3": "village",
+    "4": "river", "5": "cabin", "6": "ruins", "7": "hermit_cave"
+}
+
+HIRE_OPTIONS = [
+    ("1", "Hire a Hunter (10 gold/day)"),
+    ("2", "Hire a Gatherer (5 gold/day)"),
+    ("3", "Hire a Scout (8 gold/day)"),
+    ("4", "Hire a Cook (7 gold/day)"),
+]
+HIRE_MAP = {"1": "hunter", "2": "gatherer", "3": "scout", "4": "cook"}
+
+# Per-turn Easter egg roll (1-1000): an egg fires below its threshold if not already found
+EASTER_EGGS = CascadeSampler(1000, [
+    (5, "easter_camp", lambda game: "easter_camp" not in game.easter_eggs_found),
+    (10, "easter_artifact", lambda game: "easter_artifact" not in game.easter_eggs_found),
+    (15, "easter_lake", lambda game: "easter_lake" not in game.easter_eggs_found and game.location == "ruins"),
+    (20, "easter_loop", lambda game: "easter_loop" not in game.easter_eggs_found),
+    (25, "easter_message", lambda game: "easter_message" not in game.easter_eggs_found),
+], key=lambda game: game.location == "ruins")
+
+
+class NPC:
+    """Dynamic NPC with personality and backstory"""
+    __slots__ = ("type", "name", "personality", "backstory", "likes")
+
+    # Shared content tables; instances only hold their own picks
+    NAMES = {
+        "hermit": ("Marcus", "Jacob", "Solomon", "Thomas"),
+        "villager": ("Emma", "James", "Sarah", "David", "Alice"),
+        "merchant": ("Zeke", "Petra", "Silas", "Iris"),
+    }
+    PERSONALITIES = ("kind", "gruff", "mysterious", "cheerful")
+    LIKES = (("honey", "fresh_fish"), ("berries", "herbs"), ("tools", "crafted_items"))
+    BACKSTORIES = {
+        "hermit": (
+            "{name} retreated here 20 years ago seeking peace.",
+            "{name} is hiding from a painful past in the city.",
+            "{name} came here searching for enlightenment and stayed.",
+        ),
+        "villager": (
+            "{name} was born and raised in this village.",
+            "{name} found refuge here after escaping hardship.",
+            "{name} leads the village with wisdom and care.",
+        ),
+        "merchant": (
+            "{name} travels between settlements trading goods.",
+            "{name} knows secrets from everywhere they've been.",
+            "{name} seeks rare items to expand their collection.",
+        ),
+    }
+    GREETINGS = {
+        "kind": "{name} smiles warmly at you.",
+        "gruff": "{name} grunts in acknowledgment.",
+        "mysterious": "{name} studies you with an unreadable expression.",
+        "cheerful": "{name} greets you enthusiastically!",
+    }
+
+    def __init__(self, npc_type, rng=random):
+        self.type = npc_type
+        self.name = rng.choice(self.NAMES.get(npc_type, ("Stranger",)))
+        self.personality = rng.choice(self.PERSONALITIES)
+        self.backstory = self.generate_backstory(rng)
+        self.likes = rng.choice(self.LIKES)
+
+    def generate_backstory(self, rng=random):
+        template = rng.choice(self.BACKSTORIES.get(self.type, ("Their past is a mystery.",)))
+        return template.format(name=self.name)
+
+    def greet(self):
+        return self.GREETINGS.get(self.personality, "{name} nods at you.").format(name=self.name)
+
+class HiredNPC:
+    """Hired NPC worker with skills and effectiveness"""
+    __slots__ = ("type", "name", "effectiveness", "loyalty", "cost_per_day", "morale")
+
+    def __init__(self, npc_type, name, rng=random):
+        self.type = npc_type  # "hunter", "gatherer", "scout", "cook"
+        self.name = name
+        self.effectiveness = rng.randint(60, 100)  # 60-100% success rate
+        self.loyalty = 50  # Starts neutral, affected by treatment
+        self.cost_per_day = HIRE_COSTS.get(npc_type, 5)
+        self.morale = 100
+
+    def copy(self):
+        other = HiredNPC.__new__(HiredNPC)
+        for name in HiredNPC.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+
+    def get_description(self):
+        mood = "happy" if self.morale >= 70 else "neutral" if self.morale >= 40 else "unhappy"
+        return f"{self.name} ({self.type.title()}) - Effectiveness: {self.effectiveness}% | Mood: {mood} | Loyalty: {self.loyalty}"
+
+class Outcome:
+    """Record of one engine step: what happened and what is asked next"""
+    def __init__(self, messages, prompt, prompt_text, options, pause_at=None, status_at=None,
+                 game_over=False, won=False, ending_type=None):
+        self.messages = messages      # Lines produced by this step, in order
+        self.prompt = prompt          # Key of the pending prompt (None once the game is over)
+        self.prompt_text = prompt_text
+        self.options = options        # [(action, label), ...] accepted by the pending prompt
+        self.pause_at = pause_at      # Index in messages where the day ended, if it did
+        self.status_at = status_at    # Index in messages where a new turn started, if one did
+        self.game_over = game_over
+        self.won = won
+        self.ending_type = ending_type
+
+    def actions(self):
+        return [key for key, _ in self.options]
+
+class GameEngine:
+    """Headless survival rules: actions go in as data, Outcome records come out.
+
+    The engine is a state machine over prompts. Every prompt has a key
+    ("menu", "forest_wolf", "eat", ...) resolved by the matching
+    ``resolve_<key>`` method, which either opens another prompt or finishes
+    the action and rolls the day over.
+    """
+    def __init__(self, seed=None):
+        # Every roll comes from this game's own RNG, so a seed plus the
+        # action log reproduces a run exactly
+        self.seed = game_seed(seed)
+        self.rng = random.Random(self.seed)
+        self.actions = []
+
+        self.player_name = ""
+        self.health = 100
+        self.hunger = 50
+        self.inventory = Inventory()
+        self.crafting = CraftingTracker(self.inventory)
+        self.location = "forest"
+        self.day = 1
+        self.game_over = False
+        self.won = False
+        self.events_triggered = Flags()
+        self.reputation = {"villagers": 0, "hermit": 0}
+        self.crafted_items = set()
+        self.visited_locations = set()
+        self.npcs = {}
+        self.quests = {}
+        self.active_quests = []
+        self.completed_quests = []
+        self.quest_tracker = QuestTracker(self)
+        self.easter_eggs_found = Flags()
+        self.ending_type = None
+        self.hired_npcs = Roster()
+        self.effects = StatusEffects()
+        self.effects.watch(self.inventory)
+        self.clock = Clock()
+        self.clock.schedule("dawn", at(2), every=HOURS_PER_DAY)
+        self.clock.schedule("visitor", at(5, 2))
+        self.clock.schedule("helicopter", at(7, DAWN + 1))
+        self.available_gold = 0
+        self.sampler_tables = {}  # Event and egg tables drawn from last, see sampling.CascadeSampler
+        self.required_held = set()  # Items in events.REQUIRED_ITEMS held right now
+        self.watch_tables()
+
+        # State machine
+        self.messages = []
+        self.prompt = None
+        self.prompt_text = ""
+        self.options = []
+        self.context = None
+        self._pause_at = None
+        self._status_at = None
+
+    def watch_tables(self):
+        """Drop the remembered event tables whenever a flag, egg or required item changes"""
+        self.events_triggered.listeners.append(self.forget_tables)
+        self.easter_eggs_found.listeners.append(self.forget_tables)
+        self.inventory.listeners.append(self.on_item_change)
+
+    def forget_tables(self, *changed):
+        self.sampler_tables.clear()
+
+    def on_item_change(self, item, count):
+        # Only coming or going matters, however many copies arrive or leave at once
+        if item in events.REQUIRED_ITEMS and (count > 0) != (item in self.required_held):
+            if count > 0:
+                self.required_held.add(item)
+            else:
+                self.required_held.discard(item)
+            self.sampler_tables.clear()
+
+    @property
+    def poison_counter(self):
+        return self.effects.level("poison")
+
+    @poison_counter.setter
+    def poison_counter(self, value):
+        # Poison taken today first bites at the start of the next turn
+        self.effects.set_level("poison", value, start=self.day + 1)
+
+    def say(self, message):
+        self.messages.append(message)
+
+    def ask(self, prompt, prompt_text, options, context=None):
+        self.prompt = prompt
+        self.prompt_text = prompt_text
+        self.options = options
+        self.context = context
+
+    def outcome(self):
+        return Outcome(self.messages, self.prompt, self.prompt_text, self.options,
+                       self._pause_at, self._status_at, self.game_over, self.won, self.ending_type)
+
+    def start(self, player_name="Survivor"):
+        """Set up NPCs and quests and open the first turn"""
+        self.player_name = player_name
+
+        self.npcs["hermit"] = NPC("hermit", self.rng)
+        self.npcs["villager_1"] = NPC("villager", self.rng)
+        self.npcs["merchant"] = NPC("merchant", self.rng)
+
+        self.quest_tracker.start()
+
+        self.messages = []
+        self._pause_at = None
+        self._status_at = None
+        self.begin_turn()
+        return self.outcome()
+
+    def step(self, action):
+        """Answer the pending prompt with ``action`` and return the Outcome"""
+        self.apply(action)
+        return self.outcome()
+
+    def apply(self, action):
+        """Answer the pending prompt without building an Outcome (for bulk stepping)"""
+        if self.game_over:
+            raise ValueError("game is over")
+        self.messages = []
+        self._pause_at = None
+        self._status_at = None
+        action = str(action).strip()
+        self.actions.append(action)
+        prompt, context = self.prompt, self.context
+        self.prompt = None
+        self.context = None
+        getattr(self, "resolve_" + prompt)(action, context)
+
+    def fork(self):
+        """Independent copy of the game for lookahead.
+
+        NPCs, prompt options, content tables and every other value the game
+        only ever replaces are shared; the quest records are shared until
+        either game advances a quest. Everything else that changes in place
+        is copied. Attributes a front end adds (its undo history, its
+        display) stay with this game.
+        """
+        game = GameEngine.__new__(GameEngine)
+        state = game.__dict__
+        state.update(self.__dict__)
+        if len(state) != len(ENGINE_FIELDS):
+            for name in state.keys() - ENGINE_FIELDS:
+                del state[name]
+        game.rng = random.Random.__new__(random.Random)  # Skips seeding from the OS
+        game.rng.setstate(self.rng.getstate())
+        game.actions = list(self.actions)
+        game.messages = []
+        game.inventory = self.inventory.copy()
+        game.crafting = self.crafting.copy(game.inventory)
+        game.events_triggered = Flags(self.events_triggered)
+        game.reputation = dict(self.reputation)
+        game.crafted_items = set(self.crafted_items)
+        game.visited_locations = set(self.visited_locations)
+        game.easter_eggs_found = Flags(self.easter_eggs_found)
+        game.active_quests = list(self.active_quests)
+        game.completed_quests = list(self.completed_quests)
+        game.quest_tracker = self.quest_tracker.fork(game)
+        game.hired_npcs = self.hired_npcs.copy()
+        game.effects = self.effects.copy(game.inventory)
+        game.clock = self.clock.copy()
+        game.sampler_tables = dict(self.sampler_tables)
+        game.required_held = set(self.required_held)
+        game.watch_tables()
+        return game
+
+    def legal_actions(self):
+        return [key for key, _ in self.options]
+
+    def state_hash(self):
+        """Digest of the full game state, for checking that a replay ended where the original did"""
+        state = (
+            self.player_name, self.day, self.health, self.hunger, self.location,
+            self.available_gold, self.game_over, self.won, self.ending_type, self.clock.now,
+            sorted((e.name, e.level, e.due, e.expires) for e in self.effects),
+            sorted(self.inventory.counts.items()), sorted(self.events_triggered),
+            sorted(self.easter_eggs_found), sorted(self.reputation.items()),
+            sorted(self.crafted_items), sorted(self.visited_locations), self.completed_quests,
+            sorted((quest.id, quest.progress) for quest in self.quests.values()),
+            [(npc.type, npc.name, npc.effectiveness, npc.loyalty, npc.morale) for npc in self.hired_npcs],
+            self.prompt,
+        )
+        return hashlib.sha256(repr(state).encode()).hexdigest()[:16]
+
+    # --- Turn flow ---
+
+    def begin_turn(self):
+        """Start-of-turn upkeep, then the main menu"""
+        self._status_at = len(self.messages)
+        self.check_secret_events("turn")
+        if self.prompt is None:
+            self.after_secret_events()
+
+    def after_secret_events(self):
+        self.check_easter_eggs()
+        self.show_menu()
+
+    def show_menu(self):
+        can_wait = self.clock.next_time("helicopter") is not None
+        self.ask("menu", "What do you do?", MENU_OPTIONS if can_wait else MENU_WITHOUT_WAIT)
+
+    def end_action(self):
+        """Finish the chosen action: check endings, then run the clock to the next dawn"""
+        self.check_end_conditions()
+        if not self.game_over:
+            self._pause_at = len(self.messages)
+            self.clock.fast_forward("dawn", self)
+            self.begin_turn()
+
+    def wait_for(self, name):
+        """Skip turns until clock event ``name``, living through each dawn on the way"""
+        target = self.clock.next_time(name)
+        if target is None:
+            self.say("There is nothing left to wait for.")
+            self.show_menu()  # No time passed, so the turn is not rolled again
+            return
+        while not self.game_over and self.clock.now < target:
+            self._pause_at = len(self.messages)
+            self.clock.advance_to(min(self.clock.next_time("dawn"), target), self)
+            self.check_end_conditions()
+        if not self.game_over:
+            self.begin_turn()
+
+    def finish_event(self):
+        if self.prompt is None:
+            self.end_action()
+
+    # --- Inventory and stats ---
+
+    def add_item(self, item):
+        if self.inventory.accepts(item):
+            self.inventory.add(item)
+            self.say(f"✓ Added {item} to inventory.")
+        else:
+            self.say(f"{item} already in inventory.")
+
+    def has_item(self, item):
+        return item in self.inventory
+
+    def remove_item(self, item):
+        return self.inventory.remove(item)
+
+    def modify_stats(self, health=0, hunger=0):
+        self.health = max(0, min(100, self.health + health))
+        self.hunger = max(0, min(100, self.hunger + hunger))
+
+    def food_items(self):
+        return self.inventory.category("food")
+
+    # --- Workers ---
+
+    def hire_npc(self, npc_type):
+        """Hire an NPC worker"""
+        available_names = {
+            "hunter": ["Garrett", "Helena", "Quinn", "Roan"],
+            "gatherer": ["Felix", "Iris", "Milo", "Nina"],
+            "scout": ["Axel", "Sage", "Kai", "Scout"],
+            "cook": ["Bruno", "Rosa", "Claude", "Mira"]
+        }
+        hired_npc = HiredNPC(npc_type, self.rng.choice(available_names.get(npc_type, ["Worker"])), self.rng)
+        self.hired_npcs.hire(hired_npc)
+        self.forget_tables()
+        self.say(f"✓ Hired {hired_npc.name} the {npc_type}! (Effectiveness: {hired_npc.effectiveness}%)")
+        return hired_npc
+
+    def pay_workers(self):
+        """Pay daily wages to hired NPCs"""
+        total_cost = self.hired_npcs.payroll
+        if self.available_gold >= total_cost:
+            self.available_gold -= total_cost
+            self.say(f"Paid workers {total_cost} gold. Remaining: {self.available_gold}")
+            return True
+        else:
+            if len(self.hired_npcs) > 0:
+                self.say(f"⚠ Cannot afford to pay workers! Need {total_cost}, have {self.available_gold}")
+                self.say("Workers are getting angry...")
+                self.hired_npcs.adjust(morale=-20)
+            return False
+
+    def hunt_with_hired(self, hunter):
+        """Use a hired hunter to help hunt"""
+        success_rate = hunter.effectiveness + (10 if hunter.morale >= 70 else -10 if hunter.morale < 40 else 0)
+        if self.rng.randint(1, 100) <= success_rate:
+            self.add_item("venison")
+            self.say(f"{hunter.name}: 'Got one! Fresh meat for the group!'")
+            hunter.loyalty += 5
+            hunter.morale = min(100, hunter.morale + 10)
+            return True
+        else:
+            self.say(f"{hunter.name}: 'It got away. These beasts are wily.'")
+            hunter.morale = max(0, hunter.morale - 5)
+            return False
+
+    def cook_with_hired(self, cook, item):
+        """Use a hired cook to prepare food"""
+        if item == "raw_meat":
+            self.remove_item(item)
+            self.add_item("cooked_meat")
+            self.say(f"{cook.name}: 'Let me fix that up for you. Nothing worse than raw meat.'")
+            cook.loyalty += 3
+            cook.morale = min(100, cook.morale + 5)
+            return True
+        return False
+
+    def craft_item(self, recipe_name):
+        """Craft items from inventory"""
+        if recipe_name not in RECIPES:
+            self.say(f"Unknown recipe: {recipe_name}")
+            return False
+
+        if not self.crafting.can_craft(recipe_name):
+            self.say(f"Missing: {self.crafting.missing(recipe_name)}")
+            return False
+
+        for item, count in RECIPES[recipe_name].items():
+            for _ in range(count):
+                self.remove_item(item)
+
+        self.add_item(recipe_name)
+        self.crafted_items.add(recipe_name)
+        self.say(f"✓ Crafted {recipe_name}!")
+        return True
+
+    def craft_menu_text(self):
+        craftable = [name for name in CRAFT_MAP.values() if self.crafting.can_craft(name)]
+        if craftable:
+            return f"Available recipes (craftable now: {', '.join(craftable)}):"
+        return "Available recipes:"
+
+    # --- Main menu ---
+
+    def resolve_menu(self, choice, context):
+        if choice == "1":
+            self.explore()
+            self.finish_event()
+
+        elif choice == "2":
+            self.modify_stats(health=10, hunger=5)
+            self.say("You rest and recover.")
+            self.end_action()
+
+        elif choice == "3":
+            if self.rng.randint(1, 100) > 60:
+                self.add_item("foraged_berries")
+                self.say("You find some edible berries and nuts.")
+            else:
+                self.say("Your search yields nothing of value.")
+            self.end_action()
+
+        elif choice == "4":
+            if self.inventory:
+                self.say(f"You have: {', '.join(self.inventory)}")
+            else:
+                self.say("Your inventory is empty.")
+            self.end_action()
+
+        elif choice == "5":
+            if self.has_item("shelter_materials"):
+                self.remove_item("shelter_materials")
+                self.add_item("shelter")
+                self.say("You build a shelter.")
+            else:
+                self.say("You need shelter materials to build a shelter.")
+            self.end_action()
+
+        elif choice == "6":
+            self.ask("craft", self.craft_menu_text(), CRAFT_OPTIONS)
+
+        elif choice == "7":
+            self.ask("travel", "Where do you want to go?", TRAVEL_OPTIONS)
+
+        elif choice == "8":
+            self.manage_hired_npcs()
+
+        elif choice == "9":
+            self.eat_or_cook()
+
+        elif choice == "10":
+            self.say("You settle in and wait for the helicopter...")
+            self.wait_for("helicopter")
+
+        else:
+            self.say("Invalid choice.")
+            self.begin_turn()
+
+    def explore(self):
+        if self.location == "hermit_cave":
+            self.check_secret_events("explore")
+        else:
+            self.begin_event(events.select(self, self.location), "event")
+
+    def resolve_craft(self, choice, context):
+        if choice in CRAFT_MAP:
+            self.craft_item(CRAFT_MAP[choice])
+        self.end_action()
+
+    def resolve_travel(self, choice, context):
+        if choice in TRAVEL_MAP:
+            self.location = TRAVEL_MAP[choice]
+            self.visited_locations.add(self.location)
+            self.say(f"You travel to {self.location.title()}...")
+            self.quest_tracker.emit("location_visited", self.location)
+        self.end_action()
+
+    # --- Location events (content lives in events.py) ---
+
+    def begin_event(self, event, prompt):
+        """Show an event and ask its choices; ``prompt`` picks what happens once it resolves"""
+        options = events.begin(self, event)
+        if options:
+            self.ask(prompt, "", options, event.id)
+
+    def resolve_event(self, choice, event_id):
+        events.resolve(self, event_id, choice)
+        self.end_action()
+
+    def resolve_turn_event(self, choice, event_id):
+        events.resolve(self, event_id, choice)
+        self.after_secret_events()
+
+    def check_easter_eggs(self):
+        """Random Easter eggs hidden throughout the game"""
+        egg = EASTER_EGGS.draw(self.rng, self)
+
+        if egg == "easter_camp":
+            self.say("\n✦ You stumble upon an old survivor camp with faded writing on a tree...")
+            self.say("'If you're reading this, you made it. - John, Day 47'")
+            self.say("Someone was here much longer than 7 days...")
+            self.easter_eggs_found.add("easter_camp")
+            self.add_item("john_journal")
+
+        elif egg == "easter_artifact":
+            self.say("\n✦ You find a strange glowing stone. It hums softly.")
+            self.say("'The ancient ones left their marks,' you think.")
+            self.easter_eggs_found.add("easter_artifact")
+            self.add_item("mysterious_stone")
+            self.modify_stats(health=5)
+
+        elif egg == "easter_lake":
+            self.say("\n✦ Behind a hidden wall, you discover an underground lake with glowing fish!")
+            self.say("You fill your bottle with luminescent water.")
+            self.easter_eggs_found.add("easter_lake")
+            self.add_item("glowing_water")
+
+        elif egg == "easter_loop":
+            self.say("\n✦ You find a calendar scratched into a rock: Day 1, Day 1, Day 1, Day 1...")
+            self.say("Someone was trapped in a loop. Or were they?")
+            self.easter_eggs_found.add("easter_loop")
+
+        elif egg == "easter_message":
+            self.say("\n✦ Carved into a tree: 'TRUST THE HERMIT'")
+            self.say("Someone left a warning or a guide.")
+            self.easter_eggs_found.add("easter_message")
+
+    def check_secret_events(self, then="turn"):
+        """Trigger special hidden story events"""
+        if self.day == 3 and "secret_illness" not in self.events_triggered and self.rng.randint(1, 100) < 40:
+            self.say("\n⚠ You feel a strange illness coming on. Your head spins...")
+            self.say("A fever overtakes you. Was it the water? The food?")
+            self.modify_stats(health=-20, hunger=15)
+            self.events_triggered.add("secret_illness")
+            if self.has_item("medicine"):
+                self.remove_item("medicine")
+                self.say("You take your medicine. The fever should pass quickly.")
+            else:
+                self.effects.add("illness", level=5, start=self.day + 1, duration=2)
+                if self.reputation["hermit"] > 5:
+                    self.say("(You remember the hermit's medicine could have helped...)")
+
+        else:
+            self.begin_event(events.select(self, "hermit_cave"), "turn_event" if then == "turn" else "event")
+
+    # --- Endings and day cycle ---
+
+    def check_end_conditions(self):
+        """Check if game should end with different ending types"""
+        if self.health <= 0:
+            self.game_over = True
+            self.won = False
+            self.ending_type = "death"
+
+        elif self.hunger >= 90:
+            self.game_over = True
+            self.won = False
+            self.ending_type = "starvation"
+
+        elif self.day >= 7 and self.location == "village" and "know_rescue" in self.events_triggered:
+            self.game_over = True
+            self.won = True
+
+            if self.reputation["hermit"] > 15 and self.reputation["villagers"] > 15:
+                self.ending_type = "harmony"
+            elif len(self.easter_eggs_found) >= 4:
+                self.ending_type = "enlightenment"
+            elif self.health > 80:
+                self.ending_type = "healthy_escape"
+            elif self.reputation["villagers"] > 10:
+                self.ending_type = "hero"
+            else:
+                self.ending_type = "bare_escape"
+            self.quest_tracker.emit("won", self.ending_type)
+
+        elif self.day >= 8:
+            self.game_over = True
+            self.won = False
+            self.ending_type = "timeout"
+
+    # --- Clock events (scheduled in __init__, run by self.clock) ---
+
+    def on_dawn(self):
+        self.next_day()
+
+    def next_day(self):
+        """Advance day and apply survival costs"""
+        self.day += 1
+        self.modify_stats(hunger=self.rng.randint(5, 15))
+
+        if not self.effects.has("warmth"):
+            self.modify_stats(health=self.rng.randint(-5, -1))
+
+        workers.run_jobs(self)
+        self.say(f"\nThe sun rises on Day {self.day}...\n")
+        self.effects.tick(self, self.day)
+        self.quest_tracker.emit("day_changed", self.day)
+
+    def on_visitor(self):
+        if self.rng.randint(1, 100) < 30:
+            self.say("\n✦ At night, you hear footsteps. Someone passes through your camp.")
+            self.say("In the morning, there's fresh meat and a carved wooden figure left behind.")
+            self.add_item("gift_from_stranger")
+            self.events_triggered.add("secret_visitor")
+
+    def on_helicopter(self):
+        self.say("\nThe thump of rotor blades echoes across the valley at dawn.")
+        if "know_rescue" in self.events_triggered and self.location != "village":
+            self.say("The helicopter is landing at the village airstrip - you need to be there!")
+
+    # --- Hired NPC menus ---
+
+    def manage_hired_npcs(self):
+        """Menu to manage hired NPCs"""
+        if len(self.hired_npcs) == 0:
+            self.say("\n=== Manage Hired NPCs ===")
+            self.say("You have no hired NPCs.")
+            self.ask("hire_empty", f"\nAvailable Gold: {self.available_gold}",
+                     HIRE_OPTIONS + [("5", "Back")])
+        else:
+            self.say("\n=== Manage Hired NPCs ===")
+            n = len(self.hired_npcs)
+            options = [(str(i), npc.get_description()) for i, npc in enumerate(self.hired_npcs, 1)]
+            options += [
+                (str(n + 1), "Hire new NPC"),
+                (str(n + 2), f"Pay workers (Cost: {self.hired_npcs.payroll} gold)"),
+                (str(n + 3), "Fire an NPC"),
+                (str(n + 4), "Back"),
+            ]
+            self.ask("hire_roster", f"\nAvailable Gold: {self.available_gold}", options)
+
+    def resolve_hire_empty(self, choice, context):
+        if choice == "5":
+            self.end_action()
+            return
+        if choice in HIRE_MAP:
+            if self.available_gold >= HIRE_COSTS[HIRE_MAP[choice]]:
+                self.hire_npc(HIRE_MAP[choice])
+            else:
+                self.say("Not enough gold!")
+        self.manage_hired_npcs()
+
+    def resolve_hire_roster(self, choice, context):
+        if choice.isdigit():
+            idx = int(choice) - 1
+            if 0 <= idx < len(self.hired_npcs):
+                npc = self.hired_npcs[idx]
+                self.say(f"\n{npc.get_description()}")
+                self.say(f"Backstory: {npc.name} is a {npc.type}")
+            elif idx == len(self.hired_npcs):
+                self.ask("hire_pick", "", HIRE_OPTIONS)
+                return
+            elif idx == len(self.hired_npcs) + 1:
+                self.pay_workers()
+            elif idx == len(self.hired_npcs) + 2:
+                self.say("\nWho do you want to fire?")
+                self.ask("fire_pick", "", [(str(j), npc.name) for j, npc in enumerate(self.hired_npcs, 1)])
+                return
+            elif idx == len(self.hired_npcs) + 3:
+                self.end_action()
+                return
+        self.manage_hired_npcs()
+
+    def resolve_hire_pick(self, choice, context):
+        if choice in HIRE_MAP:
+            if self.available_gold >= HIRE_COSTS[HIRE_MAP[choice]]:
+                self.hire_npc(HIRE_MAP[choice])
+            else:
+                self.say("Not enough gold!")
+        self.manage_hired_npcs()
+
+    def resolve_fire_pick(self, choice, context):
+        if choice.isdigit() and 0 <= int(choice) - 1 < len(self.hired_npcs):
+            fired = self.hired_npcs.fire(self.hired_npcs[int(choice) - 1])
+            self.forget_tables()
+            self.say(f"{fired.name} has been fired and left your group.")
+        self.manage_hired_npcs()
+
+    # --- Eating ---
+
+    def eat_or_cook(self):
+        """Eat food or cook raw meat"""
+        food_items = self.food_items()
+        if not food_items:
+            self.say("You have no food to eat.")
+            self.end_action()
+            return
+
+        options = [(str(i), item) for i, item in enumerate(food_items, 1)]
+        options.append((str(len(food_items) + 1), "Cancel"))
+        self.ask("eat", "\nWhat do you want to eat?", options, food_items)
+
+    def resolve_eat(self, choice, food_items):
+        if choice.isdigit():
+            idx = int(choice) - 1
+            if 0 <= idx < len(food_items):
+                item = food_items[idx]
+                self.remove_item(item)
+
+                if item == "raw_meat":
+                    cook = self.hired_npcs.best("cook")
+                    if cook:
+                        self.say(f"\n{cook.name}: 'Let me cook that for you!'")
+                        self.cook_with_hired(cook, item)
+                        self.modify_stats(hunger=-25, health=5)
+                        self.say(f"You eat the cooked meat. It's delicious!")
+                        self.effects.add("well_fed", level=3, start=self.day + 1, duration=2)
+                    else:
+                        self.say("\n⚠ You eat raw meat. It's unsafe, but satisfies hunger...")
+                        self.modify_stats(hunger=-20, health=-5)
+                        poison_increase = self.rng.randint(15, 35)
+                        self.poison_counter += poison_increase
+                        self.say(f"Poison level increased by {poison_increase}% (Total: {self.poison_counter}%)")
+                        self.say("You feel a bit queasy... eating raw meat is dangerous!")
+                elif item == "cooked_meat" or item == "venison":
+                    self.modify_stats(hunger=-25, health=10)
+                    self.say(f"You eat the {item}. It's delicious and nourishing!")
+                    self.effects.add("well_fed", level=3, start=self.day + 1, duration=2)
+                elif item == "fresh_fish":
+                    self.modify_stats(hunger=-20, health=8)
+                    self.say(f"You eat the fresh fish. Tasty and healthy!")
+                elif "berries" in item or "foraged" in item:
+                    self.modify_stats(hunger=-15, health=5)
+                    self.say(f"You eat the {item}. Sweet and refreshing!")
+                else:
+                    self.modify_stats(hunger=-15, health=5)
+                    self.say(f"You eat the {item}. Not bad!")
+        self.end_action()
+
+
+# Attributes GameEngine.__init__ sets; fork() copies only these
+ENGINE_FIELDS = frozenset(vars(GameEngine(seed=0)))
@@ -0,0 +1,593 @@
+"""Location events as content data, compiled once into per-location samplers.
+
+Each event belongs to a location and is described by:
+
+- ``below``: the event fires when the location's roll is below this value
+  (None = any roll). Events are listed in priority order, exactly like
+  the old ``if roll < 20 ... elif roll < 30 ...`` chains, so a roll falls
+  through to the next event when a precondition fails.
+- ``requires``: preconditions on flags, easter eggs, items or workers.
+- ``text``: lines shown when the event starts; ``effects`` run right away.
+- ``choices``: (label, effects) pairs for options "1", "2", ...; effects of
+  None mean "same as ``default``", which also covers unrecognised input.
+
+Effects and conditions are small tuples, e.g. ``("add_item", "honey")`` or
+``("chance", 60, then, otherwise)`` for ``rng.randint(1, 100) > 60``. Text
+may use {villager}, {hermit}, {hunter}, {gold} and {gold_found}.
+
+Both front ends drive any object that provides the game protocol: rng,
+say, add_item, remove_item, has_item, modify_stats, hunt_with_hired,
+events_triggered, easter_eggs_found, reputation, available_gold,
+location, npcs and hired_npcs. Quests advance on their own from the
+flags and items these effects hand out (see quests.py).
+"""
+from sampling import CascadeSampler
+
+# Location -> (roll range, effects run before rolling). No roll range means no roll is drawn.
+LOCATIONS = {
+    "forest": {"roll": 100},
+    "mountain": {"roll": 100, "before": [("chance", 50, [("location", "mountain")], [("location", "forest")])]},
+    "village": {"roll": 100},
+    "river": {"roll": 100},
+    "cabin": {"roll": None},
+    "ruins": {"roll": None},
+    "hermit_cave": {"roll": None},
+}
+
+RELEASE_WATER = [("add_item", "fresh_water"), ("say", "You fill up on fresh, clean water.")]
+DEER_ESCAPES = [("say", "The deer escapes easily. You should find better tools.")]
+LET_DEER_GO = [("say", "You let the deer go unharmed.")]
+WOLF_ATTACK = [("stats", -15, 0), ("say", "The wolf attacks! You manage to escape but take damage.")]
+BEAR_ATTACK = [("stats", -40, 0), ("say", "The bear attacks! You barely escape.")]
+
+EVENTS = [
+    # --- Forest ---
+    {
+        "id": "forest_stone", "location": "forest", "below": 20,
+        "requires": [("not_egg", "easter_artifact")],
+        "text": ["You find a strange glowing stone deep in the forest..."],
+        "choices": [
+            ("Take it", [("add_item", "mysterious_stone"), ("egg", "easter_artifact"),
+                         ("say", "The stone pulses with an ancient energy.")]),
+            ("Leave it", None),
+        ],
+    },
+    {
+        "id": "forest_berries", "location": "forest", "below": 30,
+        "text": ["You stumble upon berry bushes laden with ripe berries."],
+        "choices": [
+            ("Eat some berries (gain food)", [("add_item", "berries"), ("stats", 0, -20),
+                                              ("say", "You eat some berries. They're delicious and fill your stomach.")]),
+            ("Leave them (suspicious)", None),
+        ],
+        "default": [("say", "You wisely decide to move on.")],
+    },
+    {
+        "id": "forest_branches", "location": "forest", "below": 60,
+        "text": ["You find wooden branches and dry leaves."],
+        "choices": [
+            ("Gather materials for shelter", [("add_item", "shelter_materials"),
+                                              ("say", "You gather materials for a proper shelter.")]),
+            ("Keep moving", None),
+        ],
+        "default": [("say", "You continue on.")],
+    },
+    {
+        "id": "forest_deer_hunter", "location": "forest", "below": 85,
+        "requires": [("hired", "hunter")],
+        "text": ["A deer appears in the clearing ahead."],
+        "choices": [
+            ("Hunt with {hunter}'s help", [("hunt_with_hired", [("flag", "hunted_deer")])]),
+            ("Let it pass", None),
+        ],
+        "default": LET_DEER_GO,
+    },
+    {
+        "id": "forest_deer_bow", "location": "forest", "below": 85,
+        "requires": [("has", "bow")],
+        "text": ["A deer appears in the clearing ahead."],
+        "choices": [
+            ("Hunt it with your bow", [("chance", 30,
+                                        [("add_item", "venison"), ("say", "Success! You hunt the deer and gain fresh meat."),
+                                         ("flag", "hunted_deer")],
+                                        [("say", "You miss. The deer bounds away.")])]),
+            ("Let it pass", None),
+        ],
+        "default": LET_DEER_GO,
+    },
+    {
+        "id": "forest_deer", "location": "forest", "below": 85,
+        "text": ["A deer appears in the clearing ahead."],
+        "choices": [
+            ("Try to catch it (unlikely without tools)", [("chance", 70,
+                                                           [("say", "Miraculously, you catch the deer! But you need to process it..."),
+                                                            ("add_item", "raw_meat")],
+                                                           DEER_ESCAPES)]),
+            ("Watch it pass", None),
+        ],
+        "default": DEER_ESCAPES,
+    },
+    {
+        "id": "forest_wolf", "location": "forest",
+        "text": ["You hear a low growl... A wolf emerges from the trees!"],
+        "choices": [
+            ("Run away", [("chance", 40, [("say", "You run and hide. The wolf loses interest.")],
+                           [("stats", -25, 0), ("say", "The wolf catches you! You suffer wounds.")])]),
+            ("Stand your ground", [("say", "The wolf sizes you up and backs away. You're tougher than it thought.")]),
+            ("Offer food", [("if", ("has", "berries"),
+                             [("remove_item", "berries"), ("say", "You toss berries to the wolf. It eats them and wanders off."),
+                              ("flag", "fed_wolf")],
+                             WOLF_ATTACK)]),
+        ],
+        "default": WOLF_ATTACK,
+    },
+
+    # --- Mountain ---
+    {
+        "id": "mountain_cave", "location": "mountain", "below": 40,
+        "text": ["You discover a cave entrance."],
+        "choices": [
+            ("Enter the cave", [("chance", 60,
+                                 [("add_item", "cave_treasure"), ("say", "Inside, you find gold coins! Someone was here before..."),
+                                  ("flag", "found_treasure")],
+                                 [("say", "The cave is empty but sheltered. Good place to sleep."),
+                                  ("add_item", "shelter_materials")])]),
+            ("Pass by", None),
+        ],
+        "default": [("say", "You continue up the mountain.")],
+    },
+    {
+        "id": "mountain_storm_shelter", "location": "mountain", "below": 70,
+        "requires": [("has", "shelter_materials")],
+        "text": ["Dark clouds roll in. A storm is coming!"],
+        "choices": [
+            ("Build shelter (costs shelter_materials)", [("remove_item", "shelter_materials"),
+                                                         ("say", "You build a makeshift shelter. You stay dry and warm."),
+                                                         ("stats", 10, 0)]),
+            ("Keep moving", None),
+        ],
+        "default": [("stats", -20, 10), ("say", "You're caught in the storm. Cold, wet, and exhausted.")],
+    },
+    {
+        "id": "mountain_storm", "location": "mountain", "below": 70,
+        "text": ["Dark clouds roll in. A storm is coming!"],
+        "effects": [("say", "No shelter materials! The storm hammers you."), ("stats", -30, 20)],
+    },
+    {
+        "id": "mountain_smoke", "location": "mountain",
+        "text": ["You reach a high vantage point. In the distance, you see smoke..."],
+        "choices": [
+            ("Head toward the smoke (risky)", [("say", "You head toward the smoke. Hope rises!"), ("location", "village"),
+                                               ("flag", "found_village_smoke")]),
+            ("Stay safe in the mountains", None),
+        ],
+        "default": [("say", "You decide the safe route is best for now.")],
+    },
+
+    # --- Village ---
+    {
+        "id": "village_meet", "location": "village", "below": 50,
+        "requires": [("not_flag", "met_villagers")],
+        "text": ["You find a small village! Smoke rises from chimneys.",
+                 "You see {villager} approaching cautiously..."],
+        "choices": [
+            ("Approach the villagers", [
+                ("say", "{villager}: 'Are you alright? Where did you come from?'"),
+                ("say", "The villagers welcome you! They offer food and shelter."),
+                ("add_item", "fresh_food"), ("add_item", "warm_bed"), ("stats", 20, -30),
+                ("rep", "villagers", 10), ("flag", "met_villagers"),
+                ("say", "They tell you: 'A helicopter lands at the valley airstrip at dawn on day 7.'"),
+                ("say", "{villager}: 'But beware the forest. There are old things in those woods.'"),
+                ("flag", "know_rescue"),
+            ]),
+            ("Stay hidden and watch", [
+                ("say", "You watch the villagers go about their day. They seem kind and organized."),
+                ("say", "You learn that the helicopter comes at dawn."),
+                ("flag", "know_rescue"),
+            ]),
+            ("Ask about the hermit", [
+                ("say", "{villager} lowers their voice: 'The hermit? Few speak of him...'"),
+                ("say", "'He lives in the northern caves. They say he's been there for decades.'"),
+                ("flag", "heard_of_hermit"), ("flag", "know_rescue"),
+            ]),
+        ],
+    },
+    {
+        "id": "village_rest", "location": "village",
+        "text": ["You rest in the village."],
+        "effects": [("if", ("flag", "met_villagers"), [("say", "{villager} brings you hot soup.")], None),
+                    ("stats", 5, -10)],
+    },
+
+    # --- River ---
+    {
+        "id": "river_fish_hunter", "location": "river", "below": 35,
+        "requires": [("hired", "hunter")],
+        "text": ["You reach a crystal-clear river. Fish swim lazily in the shallows."],
+        "choices": [
+            ("Fish with {hunter}'s help", [("hunter_chance",
+                                            [("add_item", "fresh_fish"), ("say", "{hunter}: 'Got one! Beautiful catch!'"),
+                                             ("hunter_loyalty", 3), ("flag", "caught_fish")],
+                                            [("say", "{hunter}: 'They're too fast today.'")])]),
+            ("Collect water and move on", None),
+        ],
+        "default": RELEASE_WATER,
+    },
+    {
+        "id": "river_fish", "location": "river", "below": 35,
+        "text": ["You reach a crystal-clear river. Fish swim lazily in the shallows."],
+        "choices": [
+            ("Try to catch fish (risky)", [("chance", 40,
+                                            [("add_item", "fresh_fish"), ("say", "You manage to catch a fish! Fresh protein!"),
+                                             ("flag", "caught_fish")],
+                                            [("stats", -5, 0), ("say", "You slip on the rocks. You catch nothing but a bruise.")])]),
+            ("Collect water and move on", None),
+        ],
+        "default": RELEASE_WATER,
+    },
+    {
+        "id": "river_bank", "location": "river", "below": 70,
+        "text": ["Along the riverbank, you find useful items."],
+        "choices": [
+            ("Collect clay and leather", [("add_item", "clay"), ("add_item", "leather"),
+                                          ("say", "You gather clay and find animal hide. Useful for crafting!")]),
+            ("Keep moving", None),
+        ],
+        "default": [("say", "You continue along the river.")],
+    },
+    {
+        "id": "river_bear", "location": "river",
+        "text": ["A massive bear emerges from the forest, heading to the river to fish..."],
+        "choices": [
+            ("Hide and stay quiet", [("chance", 50, [("say", "You hide perfectly. The bear doesn't notice you.")],
+                                      [("stats", -30, 0), ("say", "The bear spots you! You take severe damage escaping.")])]),
+            ("Make noise and run", [("chance", 30, [("say", "You run and escape! Your heart pounds.")],
+                                     [("stats", -35, 0), ("say", "The bear is faster than you! You take a swipe.")])]),
+            ("Offer food (if you have any)", [("if", ("any", ("has", "fresh_fish"), ("has", "berries")),
+                                               [("if", ("has", "fresh_fish"), [("remove_item", "fresh_fish")],
+                                                 [("remove_item", "berries")]),
+                                                ("say", "The bear eats the food and wanders off, satisfied."),
+                                                ("flag", "fed_bear")],
+                                               BEAR_ATTACK)]),
+        ],
+        "default": BEAR_ATTACK,
+    },
+
+    # --- Cabin ---
+    {
+        "id": "cabin_return", "location": "cabin",
+        "requires": [("flag", "cabin_explored")],
+        "text": ["You return to the abandoned cabin. It's still quiet."],
+        "choices": [
+            ("Rest here", [("stats", 15, 5), ("say", "You sleep in the cabin. It's surprisingly comfortable.")]),
+            ("Check for gold", [("gold", 20, 50, "You find {gold_found} gold coins hidden in the cabin! Total: {gold}")]),
+            ("Leave", None),
+        ],
+    },
+    {
+        "id": "cabin_enter", "location": "cabin",
+        "text": ["You discover an abandoned cabin deep in the woods!", "The door creaks open..."],
+        "choices": [
+            ("Enter cautiously", [
+                ("chance", 40,
+                 [("say", "Inside, you find supplies: canned food, a map, and flint!"),
+                  ("add_item", "canned_food"), ("add_item", "map"), ("add_item", "flint"),
+                  ("chance", 60, [("gold", 30, 75, "You also find {gold_found} gold coins! Total: {gold}")], None),
+                  ("flag", "cabin_treasure")],
+                 [("say", "The cabin is mostly bare. You find some dry wood though."), ("add_item", "dry_wood")]),
+                ("flag", "cabin_explored"),
+            ]),
+            ("Walk away (bad omen)", None),
+        ],
+        "default": [("say", "You wisely turn back.")],
+    },
+
+    # --- Ruins ---
+    {
+        "id": "ruins_return", "location": "ruins",
+        "requires": [("flag", "ruins_explored")],
+        "text": ["You return to the ancient ruins. Strange stone carvings mark the walls."],
+        "choices": [
+            ("Investigate further", [("say", "You find a hidden chamber with ceremonial artifacts."),
+                                     ("if", ("not_has", "ruined_statue"),
+                                      [("add_item", "ruined_statue"), ("say", "You take a mysterious stone statue.")], None)]),
+            ("Leave", None),
+        ],
+    },
+    {
+        "id": "ruins_enter", "location": "ruins",
+        "text": ["You stumble upon ancient ruins overgrown with vines.", "Carved symbols cover crumbling stone walls..."],
+        "choices": [
+            ("Explore the ruins", [
+                ("say", "You carefully navigate the ruins."),
+                ("chance", 50,
+                 [("say", "You find honey stored in clay jars - perfectly preserved!"), ("add_item", "honey"),
+                  ("flag", "found_honey")],
+                 [("add_item", "herbs"), ("say", "You gather rare medicinal herbs.")]),
+                ("flag", "ruins_explored"),
+                ("chance", 70, [("say", "You also discover old writings mentioning a 'hermit in the north.'"),
+                                ("flag", "heard_of_hermit")], None),
+            ]),
+            ("Avoid them (eerie)", None),
+        ],
+        "default": [("say", "You back away slowly. Best not to disturb ancient places.")],
+    },
+
+    # --- Hermit cave ---
+    {
+        "id": "hermit_meet", "location": "hermit_cave",
+        "requires": [("not_flag", "met_hermit")],
+        "text": ["Deep in a cave, you find an old {hermit_personality} man tending a fire.",
+                 "{hermit_greeting}",
+                 "\nHermit {hermit}: \"{hermit_backstory}\""],
+        "choices": [
+            ("Greet him peacefully", [
+                ("say", "The hermit nods. '{hermit} does not see many visitors out here.'"),
+                ("rep", "hermit", 5), ("add_item", "hermit_bread"),
+                ("say", "He gives you some bread made from wild grains."),
+                ("flag", "met_hermit"),
+            ]),
+            ("Ask for help", [
+                ("say", "The hermit studies you carefully."),
+                ("if", ("flag", "heard_of_hermit"),
+                 [("say", "'{hermit}: Ah, you know of me from the old stones, I see.'"),
+                  ("say", "He teaches you to make fire. You gain flint and dry_wood knowledge."),
+                  ("rep", "hermit", 10), ("add_item", "flint"), ("add_item", "fire_knowledge")],
+                 [("say", "'{hermit}: Why should I help a stranger?'"), ("rep", "hermit", -5)]),
+                ("flag", "met_hermit"),
+            ]),
+            ("Leave quietly", None),
+        ],
+        "default": [("say", "You slip out silently. The hermit doesn't notice.")],
+    },
+    {
+        "id": "hermit_return", "location": "hermit_cave",
+        "text": ["You return to {hermit}'s cave.",
+                 "The {hermit_personality} man offers you more bread and wisdom."],
+        "effects": [("stats", 5, -15), ("say", "'{hermit}: Survive, and you'll find peace,' he says.")],
+    },
+]
+
+
+# --- Text placeholders ---
+
+def best_hunter(game):
+    return game.hired_npcs.best("hunter")
+
+class TextContext(dict):
+    """Placeholder values for event text, looked up from the game on first use"""
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def __missing__(self, key):
+        game = self.game
+        if key == "villager":
+            value = game.npcs["villager_1"].name
+        elif key == "hermit":
+            value = game.npcs["hermit"].name
+        elif key == "hermit_personality":
+            value = game.npcs["hermit"].personality
+        elif key == "hermit_greeting":
+            value = game.npcs["hermit"].greet()
+        elif key == "hermit_backstory":
+            value = getattr(game.npcs["hermit"], "backstory", "Their past is a mystery.")
+        elif key == "hunter":
+            value = best_hunter(game).name
+        elif key == "gold":
+            value = game.available_gold
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+
+# --- Effects: fn(game, ctx, *args) ---
+
+def _say(game, ctx, text):
+    game.say(text.format_map(ctx) if "{" in text else text)
+
+def _add_item(game, ctx, item):
+    game.add_item(item)
+
+def _remove_item(game, ctx, item):
+    game.remove_item(item)
+
+def _stats(game, ctx, health, hunger):
+    game.modify_stats(health=health, hunger=hunger)
+
+def _flag(game, ctx, name):
+    game.events_triggered.add(name)
+
+def _egg(game, ctx, name):
+    game.easter_eggs_found.add(name)
+
+def _rep(game, ctx, who, delta):
+    game.reputation[who] += delta
+
+def _location(game, ctx, location):
+    game.location = location
+
+def _chance(game, ctx, threshold, then, otherwise):
+    run(game, then if game.rng.randint(1, 100) > threshold else otherwise, ctx)
+
+def _if(game, ctx, condition, then, otherwise):
+    run(game, then if check(game, condition) else otherwise, ctx)
+
+def _gold(game, ctx, low, high, text):
+    found = game.rng.randint(low, high)
+    game.available_gold += found
+    ctx["gold_found"] = found
+    ctx["gold"] = game.available_gold
+    _say(game, ctx, text)
+
+def _hunt_with_hired(game, ctx, then):
+    if game.hunt_with_hired(best_hunter(game)):
+        run(game, then, ctx)
+
+def _hunter_chance(game, ctx, then, otherwise):
+    run(game, then if best_hunter(game).effectiveness > game.rng.randint(1, 100) else otherwise, ctx)
+
+def _hunter_loyalty(game, ctx, delta):
+    best_hunter(game).loyalty += delta
+
+EFFECTS = {
+    "say": _say,
+    "add_item": _add_item,
+    "remove_item": _remove_item,
+    "stats": _stats,
+    "flag": _flag,
+    "egg": _egg,
+    "rep": _rep,
+    "location": _location,
+    "chance": _chance,
+    "if": _if,
+    "gold": _gold,
+    "hunt_with_hired": _hunt_with_hired,
+    "hunter_chance": _hunter_chance,
+    "hunter_loyalty": _hunter_loyalty,
+}
+# Arguments of these effects (by position) are nested effect lists or conditions
+NESTED_EFFECTS = {"chance": (1, 2), "if": (1, 2), "hunt_with_hired": (0,), "hunter_chance": (0, 1)}
+NESTED_CONDITIONS = {"if": (0,)}
+
+
+# --- Conditions: fn(game, *args) -> bool ---
+
+CONDITIONS = {
+    "flag": lambda game, name: name in game.events_triggered,
+    "not_flag": lambda game, name: name not in game.events_triggered,
+    "egg": lambda game, name: name in game.easter_eggs_found,
+    "not_egg": lambda game, name: name not in game.easter_eggs_found,
+    "has": lambda game, item: game.has_item(item),
+    "not_has": lambda game, item: not game.has_item(item),
+    "hired": lambda game, npc_type: game.hired_npcs.has(npc_type),
+    "any": lambda game, *conditions: any(check(game, c) for c in conditions),
+}
+
+
+# --- Compilation ---
+
+# Items whose presence some event requires; games drop their remembered event tables when one comes or goes
+REQUIRED_ITEMS = set()
+
+def required_items(condition):
+    name, *args = condition
+    if name in ("has", "not_has"):
+        return {args[0]}
+    if name == "any":
+        return set().union(*(required_items(c) for c in args))
+    return set()
+
+def compile_condition(condition):
+    name, *args = condition
+    if name == "any":
+        args = [compile_condition(c) for c in args]
+    return (CONDITIONS[name], tuple(args))
+
+def compile_effects(effects):
+    """Turn effect tuples into (function, args) pairs, recursing into nested lists"""
+    if effects is None:
+        return ()
+    compiled = []
+    for effect in effects:
+        name, *args = effect
+        for i in NESTED_EFFECTS.get(name, ()):
+            args[i] = compile_effects(args[i])
+        for i in NESTED_CONDITIONS.get(name, ()):
+            args[i] = compile_condition(args[i])
+        compiled.append((EFFECTS[name], tuple(args)))
+    return tuple(compiled)
+
+def run(game, effects, ctx):
+    for fn, args in effects:
+        fn(game, ctx, *args)
+
+def check(game, condition):
+    fn, args = condition
+    return fn(game, *args)
+
+
+class Event:
+    """One compiled event: preconditions, text, immediate effects and choices"""
+    def __init__(self, spec):
+        self.id = spec["id"]
+        self.location = spec["location"]
+        self.below = spec.get("below")
+        self.requires = tuple(compile_condition(c) for c in spec.get("requires", ()))
+        for condition in spec.get("requires", ()):
+            REQUIRED_ITEMS.update(required_items(condition))
+        self.text = tuple(spec.get("text", ()))
+        self.effects = compile_effects(spec.get("effects"))
+        self.default = compile_effects(spec.get("default"))
+        self.labels = tuple(label for label, _ in spec.get("choices", ()))
+        self.choices = {str(i): (compile_effects(effects) if effects is not None else self.default)
+                        for i, (_, effects) in enumerate(spec.get("choices", ()), 1)}
+
+    def eligible(self, game):
+        for fn, args in self.requires:
+            if not fn(game, *args):
+                return False
+        return True
+
+class LocationTable:
+    """Event sampler for one location.
+
+    The events' roll bands and preconditions compile into a CascadeSampler,
+    so picking an event is one alias-table draw whatever the number of
+    events. Locations without a roll pick their first eligible event
+    without touching the RNG.
+    """
+    def __init__(self, location, events, roll=None, before=None):
+        self.location = location
+        self.roll = roll
+        self.before = compile_effects(before)
+        bands = [(event.below if roll and event.below is not None else (roll or 1) + 1,
+                  event, event.eligible if event.requires else None)
+                 for event in events]
+        self.sampler = CascadeSampler(roll or 1, bands)
+
+    def select(self, game):
+        if self.before:
+            run(game, self.before, TextContext(game))
+        event = self.sampler.draw(game.rng, game)
+        if event is None:
+            raise LookupError(f"No eligible event for {self.location}")
+        return event
+
+
+def compile_tables(event_specs, locations):
+    """Compile event specs into {location: LocationTable} and {event id: Event}"""
+    by_id = {}
+    by_location = {name: [] for name in locations}
+    for spec in event_specs:
+        event = Event(spec)
+        if event.id in by_id:
+            raise ValueError(f"Duplicate event id: {event.id}")
+        by_id[event.id] = event
+        by_location[event.location].append(event)
+    tables = {name: LocationTable(name, by_location[name], **locations[name]) for name in locations}
+    return tables, by_id
+
+TABLES, BY_ID = compile_tables(EVENTS, LOCATIONS)
+
+
+# --- Driving events from a front end ---
+
+def select(game, location):
+    """Roll for and pick the event that fires at ``location``"""
+    return TABLES[location].select(game)
+
+def begin(game, event):
+    """Show the event's text, run its immediate effects and return the options to offer"""
+    ctx = TextContext(game)
+    for line in event.text:
+        _say(game, ctx, line)
+    run(game, event.effects, ctx)
+    return [(str(i), label.format_map(ctx) if "{" in label else label)
+            for i, label in enumerate(event.labels, 1)]
+
+def resolve(game, event_id, choice):
+    """Apply the effects of ``choice`` for a pending event"""
+    event = BY_ID[event_id]
+    run(game, event.choices.get(choice, event.default), TextContext(game))
@@ -1,8 +1,21 @@
+import os
 import pygame
 import random
 import sys
+import time
+from collections import OrderedDict
 from enum import Enum
 
+import events
+import snapshot
+import workers
+from engine import NPC, HiredNPC, game_seed
+from history import History
+from inventory import Inventory
+from quests import Flags, QuestTracker
+from roster import Roster
+from status import StatusEffects
+
 # Initialize Pygame
 pygame.init()
 
@@ -10,10 +23,24 @@ pygame.init()
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+IDLE_TIMEOUT_MS = 1000  # Longest the event-driven loop sleeps without an event
 FONT_LARGE = pygame.font.Font(None, 36)
 FONT_MEDIUM = pygame.font.Font(None, 24)
 FONT_SMALL = pygame.font.Font(None, 18)
 
+SAVE_FILE = "savegame_pygame.sav"
+TRAVEL_KEYS = {
+    pygame.K_f: "forest", pygame.K_v: "village", pygame.K_r: "river", pygame.K_m: "mountain",
+    pygame.K_c: "cabin", pygame.K_u: "ruins", pygame.K_h: "hermit_cave",
+}
+
+# Main screen regions, redrawn independently
+HEADER_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, 60)
+STATS_RECT = pygame.Rect(0, 60, SCREEN_WIDTH, 125)
+INVENTORY_RECT = pygame.Rect(0, 185, 590, 100)
+LOG_RECT = pygame.Rect(0, 285, 590, SCREEN_HEIGHT - 285)
+MENU_RECT = pygame.Rect(590, 185, SCREEN_WIDTH - 590, SCREEN_HEIGHT - 185)
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -25,6 +52,36 @@ YELLOW = (255, 200, 0)
 BLUE = (50, 100, 200)
 ORANGE = (255, 165, 0)
 
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces keyed on (font, text, color, antialias)"""
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        
+    def render(self, font, text, antialias, color):
+        """Drop-in for font.render(text, antialias, color)"""
+        key = (font, text, color, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def stats(self):
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return f"Text cache: {self.hits} hits, {self.misses} misses ({rate:.1%} hit rate), {len(self.surfaces)} surfaces"
+
+TEXT_CACHE = TextCache()
+
 class GameState(Enum):
     INTRO = 1
     EXPLORING = 2
@@ -35,56 +92,28 @@ class GameState(Enum):
     EATING = 7
     GAME_OVER = 8
 
-class NPC:
-    def __init__(self, npc_type):
-        self.type = npc_type
-        self.names = {
-            "hermit": ["Marcus", "Jacob", "Solomon", "Thomas"],
-            "villager": ["Emma", "James", "Sarah", "David", "Alice"],
-            "merchant": ["Zeke", "Petra", "Silas", "Iris"]
-        }
-        self.name = random.choice(self.names.get(npc_type, ["Stranger"]))
-        self.personality = random.choice(["kind", "gruff", "mysterious", "cheerful"])
-        
-    def greet(self):
-        greetings = {
-            "kind": f"{self.name} smiles warmly at you.",
-            "gruff": f"{self.name} grunts in acknowledgment.",
-            "mysterious": f"{self.name} studies you with an unreadable expression.",
-            "cheerful": f"{self.name} greets you enthusiastically!"
-        }
-        return greetings.get(self.personality, f"{self.name} nods at you.")
-
-class HiredNPC:
-    def __init__(self, npc_type, name):
-        self.type = npc_type
-        self.name = name
-        self.effectiveness = random.randint(60, 100)
-        self.loyalty = 50
-        self.cost_per_day = {"hunter": 10, "gatherer": 5, "scout": 8, "cook": 7}.get(npc_type, 5)
-        self.morale = 100
-
-class Quest:
-    def __init__(self, quest_id, title, description, reward_items):
-        self.id = quest_id
-        self.title = title
-        self.description = description
-        self.reward_items = reward_items
-        self.completed = False
-
 class SurvivalGame:
-    def __init__(self):
+    def __init__(self, seed=None):
+        # Each game owns its RNG; the seed is enough to reproduce a session
+        self.seed = game_seed(seed)
+        self.rng = random.Random(self.seed)
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Survival: Lost in the Wild - Pygame Edition")
         self.clock = pygame.time.Clock()
         self.running = True
+        self.dirty = True  # Screen needs a redraw
+        self.full_redraw = True  # Next main-screen frame repaints every region
+        self.region_signatures = {}
+        self.blit_area = 0  # Pixels pushed to the display so far
+        self.present_time = 0.0
+        self.frames_presented = 0
         self.state = GameState.INTRO
         
         # Player stats
         self.player_name = ""
         self.health = 100
         self.hunger = 50
-        self.inventory = []
+        self.inventory = Inventory()
         self.location = "forest"
         self.day = 1
         self.won = False
@@ -92,18 +121,26 @@ class SurvivalGame:
         self.ending_type = None
         
         # Game data
-        self.events_triggered = set()
+        self.events_triggered = Flags()
         self.reputation = {"villagers": 0, "hermit": 0}
         self.crafted_items = set()
         self.visited_locations = set()
         self.npcs = {}
-        self.hired_npcs = []
-        self.poison_counter = 0
+        self.hired_npcs = Roster()
+        self.effects = StatusEffects()
+        self.effects.watch(self.inventory)
         self.available_gold = 0
         self.easter_eggs_found = set()
+        self.quests = {}
+        self.active_quests = []
+        self.completed_quests = []
+        self.quest_tracker = QuestTracker(self)
+        self.quest_tracker.start()
+        self.history = History(self)
         
         # UI state
         self.current_event = None
+        self.current_event_id = None
         self.current_choices = []
         self.message_log = []
         self.input_text = ""
@@ -111,7 +148,25 @@ class SurvivalGame:
         
         self.locations = ["forest", "mountain", "village", "river", "cabin", "ruins", "hermit_cave"]
         
+    @property
+    def poison_counter(self):
+        return self.effects.level("poison")
+    
+    @poison_counter.setter
+    def poison_counter(self, value):
+        self.effects.set_level("poison", value, start=self.day + 1)
+    
+    @property
+    def state(self):
+        return self._state
+    
+    @state.setter
+    def state(self, value):
+        self._state = value
+        self.dirty = True
+        
     def add_message(self, message):
+        self.dirty = True
         self.message_log.append(message)
         if len(self.message_log) > 10:
             self.message_log.pop(0)
@@ -119,19 +174,19 @@ class SurvivalGame:
     def draw_intro(self):
         self.screen.fill(DARK_GRAY)
         
-        title = FONT_LARGE.render("SURVIVAL: Lost in the Wild", True, YELLOW)
+        title = TEXT_CACHE.render(FONT_LARGE, "SURVIVAL: Lost in the Wild", True, YELLOW)
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
         
-        subtitle = FONT_MEDIUM.render("A Pygame Adventure", True, LIGHT_GRAY)
+        subtitle = TEXT_CACHE.render(FONT_MEDIUM, "A Pygame Adventure", True, LIGHT_GRAY)
         self.screen.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 150))
         
-        prompt = FONT_SMALL.render("Enter your name and press ENTER:", True, WHITE)
+        prompt = TEXT_CACHE.render(FONT_SMALL, "Enter your name and press ENTER:", True, WHITE)
         self.screen.blit(prompt, (50, 300))
         
         # Draw input box
         input_rect = pygame.Rect(50, 350, 300, 40)
         pygame.draw.rect(self.screen, WHITE, input_rect, 2)
-        text_surf = FONT_MEDIUM.render(self.input_text, True, WHITE)
+        text_surf = TEXT_CACHE.render(FONT_MEDIUM, self.input_text, True, WHITE)
         self.screen.blit(text_surf, (60, 360))
         
         story = [
@@ -145,63 +200,93 @@ class SurvivalGame:
         
         y = 450
         for line in story:
-            text = FONT_SMALL.render(line, True, LIGHT_GRAY)
+            text = TEXT_CACHE.render(FONT_SMALL, line, True, LIGHT_GRAY)
             self.screen.blit(text, (50, y))
             y += 30
     
+    def main_screen_regions(self):
+        """(name, rect, draw function, signature) for each separately invalidated region"""
+        return [
+            ("header", HEADER_RECT, self.draw_header,
+             (self.day, self.player_name)),
+            ("stats", STATS_RECT, self.draw_stats_bar,
+             (self.health, self.hunger, self.available_gold, self.poison_counter, len(self.hired_npcs), self.location)),
+            ("inventory", INVENTORY_RECT, self.draw_inventory_strip,
+             (tuple(self.inventory.head(5)), len(self.inventory))),
+            ("log", LOG_RECT, self.draw_message_log,
+             tuple(self.message_log[-6:])),
+            ("menu", MENU_RECT, self.draw_menu, None),
+        ]
+    
     def draw_main_screen(self):
-        self.screen.fill(DARK_GRAY)
-        
-        # Header
-        header = FONT_LARGE.render(f"DAY {self.day} - {self.player_name}", True, YELLOW)
+        """Redraw only the regions whose contents changed since the last main-screen frame"""
+        full = self.full_redraw
+        if full:
+            self.screen.fill(DARK_GRAY)
+        rects = []
+        for name, rect, draw_region, signature in self.main_screen_regions():
+            if not full and self.region_signatures.get(name) == signature:
+                continue
+            if not full:
+                self.screen.fill(DARK_GRAY, rect)
+            self.screen.set_clip(rect)
+            draw_region()
+            self.screen.set_clip(None)
+            self.region_signatures[name] = signature
+            rects.append(rect)
+        self.full_redraw = False
+        self.present(None if full else rects)
+    
+    def draw_header(self):
+        header = TEXT_CACHE.render(FONT_LARGE, f"DAY {self.day} - {self.player_name}", True, YELLOW)
         self.screen.blit(header, (20, 20))
-        
-        # Stats bar
+    
+    def draw_stats_bar(self):
         stats_text = f"Health: {self.health}/100 | Hunger: {self.hunger}/100 | Gold: {self.available_gold}"
-        stats_surf = FONT_MEDIUM.render(stats_text, True, GREEN)
+        stats_surf = TEXT_CACHE.render(FONT_MEDIUM, stats_text, True, GREEN)
         self.screen.blit(stats_surf, (20, 70))
         
         if self.poison_counter > 0:
             poison_text = f"⚠ Poison: {self.poison_counter}%"
-            poison_surf = FONT_MEDIUM.render(poison_text, True, RED)
+            poison_surf = TEXT_CACHE.render(FONT_MEDIUM, poison_text, True, RED)
             self.screen.blit(poison_surf, (20, 100))
         
         if len(self.hired_npcs) > 0:
             hired_text = f"Hired NPCs: {len(self.hired_npcs)}"
-            hired_surf = FONT_MEDIUM.render(hired_text, True, BLUE)
+            hired_surf = TEXT_CACHE.render(FONT_MEDIUM, hired_text, True, BLUE)
             self.screen.blit(hired_surf, (SCREEN_WIDTH - 300, 70))
         
         # Location
         loc_text = f"Location: {self.location.title()}"
-        loc_surf = FONT_MEDIUM.render(loc_text, True, WHITE)
+        loc_surf = TEXT_CACHE.render(FONT_MEDIUM, loc_text, True, WHITE)
         self.screen.blit(loc_surf, (20, 150))
-        
-        # Inventory
-        inv_title = FONT_MEDIUM.render("Inventory:", True, LIGHT_GRAY)
+    
+    def draw_inventory_strip(self):
+        inv_title = TEXT_CACHE.render(FONT_MEDIUM, "Inventory:", True, LIGHT_GRAY)
         self.screen.blit(inv_title, (20, 200))
         
         if self.inventory:
-            inv_text = ", ".join(self.inventory[:5])
+            inv_text = ", ".join(self.inventory.head(5))
             if len(self.inventory) > 5:
                 inv_text += f", +{len(self.inventory) - 5} more"
-            inv_surf = FONT_SMALL.render(inv_text, True, WHITE)
+            inv_surf = TEXT_CACHE.render(FONT_SMALL, inv_text, True, WHITE)
             self.screen.blit(inv_surf, (20, 230))
         else:
-            empty_surf = FONT_SMALL.render("Empty", True, LIGHT_GRAY)
+            empty_surf = TEXT_CACHE.render(FONT_SMALL, "Empty", True, LIGHT_GRAY)
             self.screen.blit(empty_surf, (20, 230))
-        
-        # Message log
-        msg_title = FONT_MEDIUM.render("Events:", True, LIGHT_GRAY)
+    
+    def draw_message_log(self):
+        msg_title = TEXT_CACHE.render(FONT_MEDIUM, "Events:", True, LIGHT_GRAY)
         self.screen.blit(msg_title, (20, 300))
         
         y = 330
         for msg in self.message_log[-6:]:
-            msg_surf = FONT_SMALL.render(msg[:80], True, WHITE)
+            msg_surf = TEXT_CACHE.render(FONT_SMALL, msg[:80], True, WHITE)
             self.screen.blit(msg_surf, (20, y))
             y += 25
-        
-        # Menu options
-        menu_title = FONT_MEDIUM.render("What do you do?", True, YELLOW)
+    
+    def draw_menu(self):
+        menu_title = TEXT_CACHE.render(FONT_MEDIUM, "What do you do?", True, YELLOW)
         self.screen.blit(menu_title, (600, 200))
         
         options = [
@@ -213,86 +298,105 @@ class SurvivalGame:
             "[6] Travel",
             "[7] Hire NPCs",
             "[8] Eat/Cook",
+            "[S] Save  [L] Load",
+            "[Z] Undo  [Y] Redo",
             "[Q] Quit"
         ]
         
         y = 240
         for opt in options:
-            opt_surf = FONT_SMALL.render(opt, True, LIGHT_GRAY)
+            opt_surf = TEXT_CACHE.render(FONT_SMALL, opt, True, LIGHT_GRAY)
             self.screen.blit(opt_surf, (600, y))
             y += 30
     
+    def render_stats(self):
+        frames = max(1, self.frames_presented)
+        return (f"Frames: {self.frames_presented} | Avg blit area: {self.blit_area // frames} px"
+                f" | Avg present: {self.present_time / frames * 1000:.3f} ms")
+    
+    def present(self, rects=None):
+        """Push the frame to the display: the whole surface, or just the given rects"""
+        started = time.perf_counter()
+        if rects is None:
+            pygame.display.flip()
+            self.blit_area += SCREEN_WIDTH * SCREEN_HEIGHT
+        elif rects:
+            pygame.display.update(rects)
+            self.blit_area += sum(rect.width * rect.height for rect in rects)
+        self.present_time += time.perf_counter() - started
+        self.frames_presented += 1
+    
     def draw_event_screen(self):
         self.screen.fill(DARK_GRAY)
         
         # Header
-        header = FONT_LARGE.render("Event", True, YELLOW)
+        header = TEXT_CACHE.render(FONT_LARGE, "Event", True, YELLOW)
         self.screen.blit(header, (SCREEN_WIDTH//2 - header.get_width()//2, 50))
         
         # Event description
         if self.current_event:
-            event_surf = FONT_MEDIUM.render(self.current_event, True, WHITE)
+            event_surf = TEXT_CACHE.render(FONT_MEDIUM, self.current_event, True, WHITE)
             self.screen.blit(event_surf, (100, 150))
         
         # Message log
         y = 250
         for msg in self.message_log[-4:]:
-            msg_surf = FONT_SMALL.render(msg[:100], True, LIGHT_GRAY)
+            msg_surf = TEXT_CACHE.render(FONT_SMALL, msg[:100], True, LIGHT_GRAY)
             self.screen.blit(msg_surf, (100, y))
             y += 30
         
         # Choices
-        choice_title = FONT_MEDIUM.render("Choose:", True, YELLOW)
+        choice_title = TEXT_CACHE.render(FONT_MEDIUM, "Choose:", True, YELLOW)
         self.screen.blit(choice_title, (100, 400))
         
         y = 440
         for i, choice in enumerate(self.current_choices, 1):
             choice_text = f"[{i}] {choice}"
-            choice_surf = FONT_SMALL.render(choice_text, True, LIGHT_GRAY)
+            choice_surf = TEXT_CACHE.render(FONT_SMALL, choice_text, True, LIGHT_GRAY)
             self.screen.blit(choice_surf, (120, y))
             y += 35
     
     def draw_inventory_screen(self):
         self.screen.fill(DARK_GRAY)
         
-        title = FONT_LARGE.render("Inventory", True, YELLOW)
+        title = TEXT_CACHE.render(FONT_LARGE, "Inventory", True, YELLOW)
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
         
         if not self.inventory:
-            empty_surf = FONT_MEDIUM.render("Your inventory is empty", True, LIGHT_GRAY)
+            empty_surf = TEXT_CACHE.render(FONT_MEDIUM, "Your inventory is empty", True, LIGHT_GRAY)
             self.screen.blit(empty_surf, (SCREEN_WIDTH//2 - empty_surf.get_width()//2, 200))
         else:
             y = 150
             for i, item in enumerate(self.inventory, 1):
                 item_text = f"{i}. {item}"
-                item_surf = FONT_SMALL.render(item_text, True, WHITE)
+                item_surf = TEXT_CACHE.render(FONT_SMALL, item_text, True, WHITE)
                 self.screen.blit(item_surf, (100, y))
                 y += 30
         
-        back_text = FONT_SMALL.render("Press SPACE to go back", True, LIGHT_GRAY)
+        back_text = TEXT_CACHE.render(FONT_SMALL, "Press SPACE to go back", True, LIGHT_GRAY)
         self.screen.blit(back_text, (SCREEN_WIDTH//2 - back_text.get_width()//2, SCREEN_HEIGHT - 50))
     
     def draw_hiring_screen(self):
         self.screen.fill(DARK_GRAY)
         
-        title = FONT_LARGE.render("Hire NPCs", True, YELLOW)
+        title = TEXT_CACHE.render(FONT_LARGE, "Hire NPCs", True, YELLOW)
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
         
-        gold_text = FONT_MEDIUM.render(f"Gold: {self.available_gold}", True, YELLOW)
+        gold_text = TEXT_CACHE.render(FONT_MEDIUM, f"Gold: {self.available_gold}", True, YELLOW)
         self.screen.blit(gold_text, (50, 120))
         
         if self.hired_npcs:
-            hired_title = FONT_MEDIUM.render("Your Team:", True, LIGHT_GRAY)
+            hired_title = TEXT_CACHE.render(FONT_MEDIUM, "Your Team:", True, LIGHT_GRAY)
             self.screen.blit(hired_title, (50, 170))
             
             y = 210
             for npc in self.hired_npcs:
                 npc_text = f"{npc.name} ({npc.type}) - Eff: {npc.effectiveness}% | Cost: {npc.cost_per_day}/day"
-                npc_surf = FONT_SMALL.render(npc_text, True, WHITE)
+                npc_surf = TEXT_CACHE.render(FONT_SMALL, npc_text, True, WHITE)
                 self.screen.blit(npc_surf, (70, y))
                 y += 30
         
-        available_title = FONT_MEDIUM.render("Available for Hire:", True, LIGHT_GRAY)
+        available_title = TEXT_CACHE.render(FONT_MEDIUM, "Available for Hire:", True, LIGHT_GRAY)
         self.screen.blit(available_title, (50, 400))
         
         options = [
@@ -305,7 +409,7 @@ class SurvivalGame:
         
         y = 440
         for opt in options:
-            opt_surf = FONT_SMALL.render(opt, True, LIGHT_GRAY)
+            opt_surf = TEXT_CACHE.render(FONT_SMALL, opt, True, LIGHT_GRAY)
             self.screen.blit(opt_surf, (70, y))
             y += 35
     
@@ -313,9 +417,9 @@ class SurvivalGame:
         self.screen.fill(DARK_GRAY)
         
         if self.won:
-            title = FONT_LARGE.render("VICTORY!", True, GREEN)
+            title = TEXT_CACHE.render(FONT_LARGE, "VICTORY!", True, GREEN)
         else:
-            title = FONT_LARGE.render("GAME OVER", True, RED)
+            title = TEXT_CACHE.render(FONT_LARGE, "GAME OVER", True, RED)
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
         
         stats = [
@@ -332,63 +436,68 @@ class SurvivalGame:
         
         y = 250
         for stat in stats:
-            stat_surf = FONT_SMALL.render(stat, True, WHITE)
+            stat_surf = TEXT_CACHE.render(FONT_SMALL, stat, True, WHITE)
             self.screen.blit(stat_surf, (SCREEN_WIDTH//2 - stat_surf.get_width()//2, y))
             y += 35
         
-        restart = FONT_MEDIUM.render("Press SPACE to return to menu", True, LIGHT_GRAY)
+        restart = TEXT_CACHE.render(FONT_MEDIUM, "Press SPACE to return to menu", True, LIGHT_GRAY)
         self.screen.blit(restart, (SCREEN_WIDTH//2 - restart.get_width()//2, SCREEN_HEIGHT - 50))
     
     def explore(self):
-        event_roll = random.randint(1, 100)
-        
-        if self.location == "forest":
-            if event_roll < 50:
-                self.current_event = "You find berry bushes!"
-                self.current_choices = ["Gather berries", "Keep moving"]
-                self.add_message("Berry bushes found in the forest.")
-            else:
-                self.current_event = "A wolf appears!"
-                self.current_choices = ["Run away", "Stand ground", "Offer food"]
-                self.add_message("A wolf emerges from the trees!")
-                
-        elif self.location == "village":
-            self.current_event = f"You meet {self.npcs['villager_1'].name} from the village"
-            self.current_choices = ["Talk to them", "Stay hidden"]
-            self.add_message(f"You see {self.npcs['villager_1'].name} approaching.")
-            
-        elif self.location == "river":
-            self.current_event = "You reach a crystal-clear river"
-            self.current_choices = ["Try to fish", "Collect water"]
-            self.add_message("You find a river with fish!")
-            
-        elif self.location == "mountain":
-            if event_roll < 50:
-                self.current_event = "You discover a cave entrance"
-                self.current_choices = ["Enter the cave", "Pass by"]
-                self.add_message("A cave entrance appears!")
-            else:
-                self.current_event = "A storm is approaching!"
-                self.current_choices = ["Take shelter", "Keep moving"]
-                self.add_message("Dark clouds roll in...")
-                
-        elif self.location == "cabin":
-            self.current_event = "You find an abandoned cabin"
-            self.current_choices = ["Enter cautiously", "Walk away"]
-            self.add_message("An old cabin appears in the distance.")
-            
-        elif self.location == "ruins":
-            self.current_event = "Ancient ruins overgrown with vines"
-            self.current_choices = ["Explore", "Leave"]
-            self.add_message("You discover ancient ruins!")
-            
-        elif self.location == "hermit_cave":
-            self.current_event = f"You meet the hermit {self.npcs['hermit'].name}"
-            self.current_choices = ["Greet", "Ask for help", "Leave"]
-            self.add_message(f"The hermit {self.npcs['hermit'].name} greets you.")
-        
+        # Same compiled event tables as the terminal game (see events.py)
+        event = events.select(self, self.location)
+        options = events.begin(self, event)
+        if not options:
+            self.next_day()
+            if not self.game_over:
+                self.state = GameState.EXPLORING
+            return
+        self.current_event = event.text[0].format_map(events.TextContext(self))
+        self.current_event_id = event.id
+        self.current_choices = [label for _, label in options]
         self.state = GameState.EVENT
     
+    def resolve_event(self, choice):
+        events.resolve(self, self.current_event_id, choice)
+        self.current_event_id = None
+        self.next_day()
+        if not self.game_over:
+            self.state = GameState.EXPLORING
+    
+    # Game protocol used by the event tables
+    
+    def say(self, message):
+        self.add_message(message.strip())
+    
+    def add_item(self, item):
+        if self.inventory.accepts(item):
+            self.inventory.add(item)
+            self.add_message(f"✓ Added {item} to inventory.")
+        else:
+            self.add_message(f"{item} already in inventory.")
+    
+    def has_item(self, item):
+        return item in self.inventory
+    
+    def remove_item(self, item):
+        return self.inventory.remove(item)
+    
+    def modify_stats(self, health=0, hunger=0):
+        self.health = max(0, min(100, self.health + health))
+        self.hunger = max(0, min(100, self.hunger + hunger))
+    
+    def hunt_with_hired(self, hunter):
+        success_rate = hunter.effectiveness + (10 if hunter.morale >= 70 else -10 if hunter.morale < 40 else 0)
+        if self.rng.randint(1, 100) <= success_rate:
+            self.add_item("venison")
+            self.add_message(f"{hunter.name}: 'Got one! Fresh meat for the group!'")
+            hunter.loyalty += 5
+            hunter.morale = min(100, hunter.morale + 10)
+            return True
+        self.add_message(f"{hunter.name}: 'It got away. These beasts are wily.'")
+        hunter.morale = max(0, hunter.morale - 5)
+        return False
+    
     def rest(self):
         self.health = min(100, self.health + 10)
         self.hunger = min(100, self.hunger + 5)
@@ -397,22 +506,14 @@ class SurvivalGame:
         self.state = GameState.EXPLORING
     
     def forage(self):
-        if random.randint(1, 100) > 60:
-            self.inventory.append("foraged_berries")
+        if self.rng.randint(1, 100) > 60:
+            self.inventory.add("foraged_berries")
             self.add_message("Found some edible berries!")
         else:
             self.add_message("Found nothing valuable.")
         self.next_day()
         self.state = GameState.EXPLORING
     
-    def apply_poison_damage(self):
-        if self.poison_counter > 0:
-            damage = int(self.poison_counter * 0.5)
-            self.health = max(0, self.health - damage)
-            self.poison_counter = max(0, self.poison_counter - 10)
-            if damage > 0:
-                self.add_message(f"⚠ Poison damage: {damage} health lost!")
-    
     def hire_npc(self, npc_type):
         available_names = {
             "hunter": ["Garrett", "Helena", "Quinn", "Roan"],
@@ -423,8 +524,8 @@ class SurvivalGame:
         cost = {"hunter": 10, "gatherer": 5, "scout": 8, "cook": 7}[npc_type]
         
         if self.available_gold >= cost:
-            hired_npc = HiredNPC(npc_type, random.choice(available_names.get(npc_type, ["Worker"])))
-            self.hired_npcs.append(hired_npc)
+            hired_npc = HiredNPC(npc_type, self.rng.choice(available_names.get(npc_type, ["Worker"])), self.rng)
+            self.hired_npcs.hire(hired_npc)
             self.available_gold -= cost
             self.add_message(f"Hired {hired_npc.name} the {npc_type}!")
         else:
@@ -432,18 +533,19 @@ class SurvivalGame:
     
     def eat_food(self, food_item):
         if food_item == "raw_meat":
-            cooks = [npc for npc in self.hired_npcs if npc.type == "cook"]
-            if cooks:
+            cook = self.hired_npcs.best("cook")
+            if cook:
                 self.inventory.remove(food_item)
-                self.inventory.append("cooked_meat")
+                self.inventory.add("cooked_meat")
                 self.health = min(100, self.health + 5)
                 self.hunger = max(0, self.hunger - 25)
-                self.add_message(f"{cooks[0].name} cooked the meat for you!")
+                self.add_message(f"{cook.name} cooked the meat for you!")
+                self.effects.add("well_fed", level=3, start=self.day + 1, duration=2)
             else:
                 self.inventory.remove(food_item)
                 self.health = max(0, self.health - 5)
                 self.hunger = max(0, self.hunger - 20)
-                poison_increase = random.randint(15, 35)
+                poison_increase = self.rng.randint(15, 35)
                 self.poison_counter += poison_increase
                 self.add_message(f"⚠ Ate raw meat! Poison +{poison_increase}%")
         elif food_item in ["cooked_meat", "venison"]:
@@ -451,6 +553,7 @@ class SurvivalGame:
             self.health = min(100, self.health + 10)
             self.hunger = max(0, self.hunger - 25)
             self.add_message(f"Delicious {food_item}! Restored health.")
+            self.effects.add("well_fed", level=3, start=self.day + 1, duration=2)
         elif "fish" in food_item:
             self.inventory.remove(food_item)
             self.health = min(100, self.health + 8)
@@ -464,10 +567,12 @@ class SurvivalGame:
     
     def next_day(self):
         self.day += 1
-        self.hunger = min(100, self.hunger + random.randint(5, 15))
-        if "warm_bed" not in self.inventory:
-            self.health = max(0, self.health - random.randint(1, 5))
-        self.apply_poison_damage()
+        self.hunger = min(100, self.hunger + self.rng.randint(5, 15))
+        if not self.effects.has("warmth"):
+            self.health = max(0, self.health - self.rng.randint(1, 5))
+        workers.run_jobs(self)
+        self.effects.tick(self, self.day)
+        self.quest_tracker.emit("day_changed", self.day)
         self.check_end_conditions()
     
     def check_end_conditions(self):
@@ -485,6 +590,7 @@ class SurvivalGame:
             self.game_over = True
             self.won = True
             self.add_message("Helicopter arrived! You escaped!")
+            self.quest_tracker.emit("won", self.ending_type)
             self.state = GameState.GAME_OVER
         elif self.day >= 8:
             self.game_over = True
@@ -498,9 +604,9 @@ class SurvivalGame:
                 if event.key == pygame.K_RETURN:
                     if self.input_text:
                         self.player_name = self.input_text
-                        self.npcs["hermit"] = NPC("hermit")
-                        self.npcs["villager_1"] = NPC("villager")
-                        self.npcs["merchant"] = NPC("merchant")
+                        self.npcs["hermit"] = NPC("hermit", self.rng)
+                        self.npcs["villager_1"] = NPC("villager", self.rng)
+                        self.npcs["merchant"] = NPC("merchant", self.rng)
                         self.state = GameState.EXPLORING
                         self.add_message(f"Welcome, {self.player_name}!")
                 elif event.key == pygame.K_BACKSPACE:
@@ -527,10 +633,24 @@ class SurvivalGame:
                 elif event.key == pygame.K_7:
                     self.state = GameState.HIRING
                 elif event.key == pygame.K_8:
-                    if any("meat" in item or "fish" in item or "berries" in item or "food" in item for item in self.inventory):
+                    if self.inventory.has_category("food"):
                         self.state = GameState.EATING
                     else:
                         self.add_message("No food to eat!")
+                elif event.key == pygame.K_s:
+                    snapshot.save_file(self, SAVE_FILE)
+                    self.add_message(f"Game saved to {SAVE_FILE}.")
+                elif event.key == pygame.K_l:
+                    if os.path.exists(SAVE_FILE):
+                        snapshot.load_file(SAVE_FILE, self)
+                        self.history.clear()
+                        self.add_message(f"Game loaded from {SAVE_FILE}.")
+                    else:
+                        self.add_message("No saved game found.")
+                elif event.key == pygame.K_z:
+                    self.add_message("Undone." if self.history.undo() else "Nothing to undo.")
+                elif event.key == pygame.K_y:
+                    self.add_message("Redone." if self.history.redo() else "Nothing to redo.")
                 elif event.key == pygame.K_q:
                     self.running = False
         
@@ -553,7 +673,7 @@ class SurvivalGame:
         
         elif self.state == GameState.EATING:
             if event.type == pygame.KEYDOWN:
-                food_items = [item for item in self.inventory if "meat" in item or "fish" in item or "berries" in item or "food" in item]
+                food_items = self.inventory.category("food")
                 if event.key - pygame.K_1 < len(food_items) and event.key >= pygame.K_1:
                     self.eat_food(food_items[event.key - pygame.K_1])
                     self.next_day()
@@ -563,11 +683,10 @@ class SurvivalGame:
         
         elif self.state == GameState.EVENT:
             if event.type == pygame.KEYDOWN:
-                if event.key - pygame.K_1 < len(self.current_choices):
+                if pygame.K_1 <= event.key < pygame.K_1 + len(self.current_choices):
                     choice_idx = event.key - pygame.K_1
                     self.add_message(f"You chose: {self.current_choices[choice_idx]}")
-                    self.next_day()
-                    self.state = GameState.EXPLORING
+                    self.resolve_event(str(choice_idx + 1))
         
         elif self.state == GameState.GAME_OVER:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
@@ -575,26 +694,9 @@ class SurvivalGame:
         
         elif self.state == GameState.MENU:
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_f:
-                    self.location = "forest"
-                    self.state = GameState.EXPLORING
-                elif event.key == pygame.K_v:
-                    self.location = "village"
-                    self.state = GameState.EXPLORING
-                elif event.key == pygame.K_r:
-                    self.location = "river"
-                    self.state = GameState.EXPLORING
-                elif event.key == pygame.K_m:
-                    self.location = "mountain"
-                    self.state = GameState.EXPLORING
-                elif event.key == pygame.K_c:
-                    self.location = "cabin"
-                    self.state = GameState.EXPLORING
-                elif event.key == pygame.K_u:
-                    self.location = "ruins"
-                    self.state = GameState.EXPLORING
-                elif event.key == pygame.K_h:
-                    self.location = "hermit_cave"
+                if event.key in TRAVEL_KEYS:
+                    self.location = TRAVEL_KEYS[event.key]
+                    self.quest_tracker.emit("location_visited", self.location)
                     self.state = GameState.EXPLORING
                 elif event.key == pygame.K_SPACE:
                     self.state = GameState.EXPLORING
@@ -604,6 +706,7 @@ class SurvivalGame:
             self.draw_intro()
         elif self.state == GameState.EXPLORING:
             self.draw_main_screen()
+            return
         elif self.state == GameState.EVENT:
             self.draw_event_screen()
         elif self.state == GameState.INVENTORY:
@@ -617,30 +720,32 @@ class SurvivalGame:
         elif self.state == GameState.MENU:
             self.draw_travel_screen()
         
-        pygame.display.flip()
+        # Any other screen overwrites the main screen's regions
+        self.full_redraw = True
+        self.present()
     
     def draw_eating_screen(self):
         self.screen.fill(DARK_GRAY)
         
-        title = FONT_LARGE.render("What do you want to eat?", True, YELLOW)
+        title = TEXT_CACHE.render(FONT_LARGE, "What do you want to eat?", True, YELLOW)
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
         
-        food_items = [item for item in self.inventory if "meat" in item or "fish" in item or "berries" in item or "food" in item]
+        food_items = self.inventory.category("food")
         
         y = 150
         for i, item in enumerate(food_items, 1):
             food_text = f"[{i}] {item}"
-            food_surf = FONT_SMALL.render(food_text, True, WHITE)
+            food_surf = TEXT_CACHE.render(FONT_SMALL, food_text, True, WHITE)
             self.screen.blit(food_surf, (100, y))
             y += 35
         
-        back_text = FONT_SMALL.render("Press SPACE to go back", True, LIGHT_GRAY)
+        back_text = TEXT_CACHE.render(FONT_SMALL, "Press SPACE to go back", True, LIGHT_GRAY)
         self.screen.blit(back_text, (SCREEN_WIDTH//2 - back_text.get_width()//2, SCREEN_HEIGHT - 50))
     
     def draw_travel_screen(self):
         self.screen.fill(DARK_GRAY)
         
-        title = FONT_LARGE.render("Where do you travel?", True, YELLOW)
+        title = TEXT_CACHE.render(FONT_LARGE, "Where do you travel?", True, YELLOW)
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
         
         options = [
@@ -656,23 +761,44 @@ class SurvivalGame:
         
         y = 200
         for opt in options:
-            opt_surf = FONT_SMALL.render(opt, True, LIGHT_GRAY)
+            opt_surf = TEXT_CACHE.render(FONT_SMALL, opt, True, LIGHT_GRAY)
             self.screen.blit(opt_surf, (SCREEN_WIDTH//2 - opt_surf.get_width()//2, y))
             y += 40
     
-    def run(self):
+    def run(self, event_driven=True, show_stats=False):
+        """Main loop. Event-driven mode sleeps until input arrives and only redraws dirty frames."""
         while self.running:
-            for event in pygame.event.get():
+            if event_driven:
+                pending = [pygame.event.wait(IDLE_TIMEOUT_MS)] + pygame.event.get()
+            else:
+                pending = pygame.event.get()
+            for event in pending:
+                if event.type == pygame.NOEVENT:
+                    continue
                 if event.type == pygame.QUIT:
                     self.running = False
-                self.handle_input(event)
+                if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED, pygame.VIDEOEXPOSE):
+                    self.full_redraw = True
+                if event.type in (pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED, pygame.VIDEOEXPOSE):
+                    self.dirty = True
+                if event.type == pygame.KEYDOWN and event.key not in (pygame.K_z, pygame.K_y):
+                    # Each key press is one step on the undo timeline
+                    with self.history.track():
+                        self.handle_input(event)
+                else:
+                    self.handle_input(event)
             
-            self.draw()
+            if self.dirty or not event_driven:
+                self.draw()
+                self.dirty = False
             self.clock.tick(FPS)
         
+        if show_stats:
+            print(self.render_stats())
+            print(TEXT_CACHE.stats())
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
     game = SurvivalGame()
-    game.run()
+    game.run(event_driven="--busy-loop" not in sys.argv, show_stats="--stats" in sys.argv)
@@ -0,0 +1,289 @@
+"""Bounded undo/redo for GameEngine and SurvivalGame, stored as per-action deltas.
+
+Each tracked action is stored as the fields it changed, as (before, after)
+pairs:
+
+- Inventory changes and new flags come from the inventory and flag
+  listeners, so they cost one entry per item or flag touched.
+- Stats, location, gold, the pending prompt and the small sets and lists
+  are compared before and after the action. Only the ones that differ are
+  kept.
+- The roster, status effects, clock queue and quest progress are kept
+  whole, and only when they changed.
+- The RNG keeps its position. Its 624-word block is shared between entries
+  until the generator regenerates it.
+
+The deltas live in a ring of ``size`` actions, so undoing or redoing N
+actions only touches what those actions changed. Memory stays bounded
+however long the session runs.
+
+    history = History(game)
+    with history.track("1"):
+        game.step("1")
+    history.undo()       # or undo(5), redo(), scrub(-20)
+"""
+import struct
+from collections import deque
+from contextlib import contextmanager
+
+from clock import Clock
+from roster import Roster
+
+DEFAULT_SIZE = 1000
+RNG_WORDS = struct.Struct("<624I")  # Mersenne Twister state, minus the position
+
+# Plain attributes compared before and after each action; missing ones are skipped
+FIELDS = (
+    "player_name", "day", "health", "hunger", "location", "available_gold",
+    "game_over", "won", "ending_type",
+    "prompt", "prompt_text", "options", "context",  # GameEngine's pending prompt
+    "state", "current_event", "current_event_id", "current_choices",  # SurvivalGame's screens
+)
+# Small containers, compared by value and restored in place
+CONTAINERS = ("reputation", "crafted_items", "visited_locations", "easter_eggs_found",
+              "active_quests", "completed_quests")
+
+
+def _roster(game):
+    return tuple((w, w.loyalty, w.morale) for w in game.hired_npcs)
+
+def _set_roster(game, workers):
+    for worker, loyalty, morale in workers:
+        worker.loyalty, worker.morale = loyalty, morale
+    game.hired_npcs = Roster(worker for worker, _, _ in workers)
+
+def _effects(game):
+    return tuple((e.name, e.level, e.due, e.expires) for e in game.effects)
+
+def _set_effects(game, effects):
+    game.effects.clear()
+    for name, level, due, expires in effects:
+        game.effects.restore(name, level, due, expires)
+
+def _clock(game):
+    return game.clock.now, tuple(game.clock.queue)
+
+def _set_clock(game, value):
+    game.clock.now, queue = value
+    game.clock.queue = list(queue)
+
+def _quests(game):
+    return tuple((key, quest.progress, quest.completed) for key, quest in game.quests.items())
+
+def _set_quests(game, quests):
+    tracker = getattr(game, "quest_tracker", None)
+    if tracker is not None:
+        tracker.own_quests()
+    for key, progress, completed in quests:
+        quest = game.quests[key]
+        quest.progress, quest.completed = progress, completed
+
+# Parts of the state kept whole: name -> (read, write)
+PARTS = {
+    "roster": (_roster, _set_roster),
+    "effects": (_effects, _set_effects),
+    "clock": (_clock, _set_clock),
+    "quests": (_quests, _set_quests),
+}
+# Delta entries that are not plain (before, after) attribute pairs
+SPECIAL = {"items", "flags", "rng", "action"}
+
+
+class History:
+    """Ring buffer of per-action deltas with undo, redo and scrubbing"""
+    def __init__(self, game, size=DEFAULT_SIZE):
+        self.game = game
+        self.done = deque(maxlen=size)
+        self.undone = []
+        self.fields = [name for name in FIELDS if hasattr(game, name)]
+        self.containers = [name for name in CONTAINERS if hasattr(game, name)]
+        self.parts = [name for name in PARTS
+                      if name != "clock" or isinstance(getattr(game, "clock", None), Clock)]
+        self.counts = dict(game.inventory.counts)  # Last seen inventory counts
+        self.delta = None  # Delta being recorded
+        self.applying = False
+        self.words = ()  # Most recent RNG word block, and the packed copy every entry that saw it shares
+        self.packed = b""
+        self.last = {}  # Field -> value stored as the latest entry's "after"
+        game.inventory.listeners.append(self.on_item_change)
+        game.events_triggered.listeners.append(self.on_flag)
+
+    def __len__(self):
+        return len(self.done)
+
+    def clear(self):
+        """Forget every entry, e.g. after the game was replaced by a loaded save"""
+        self.done.clear()
+        self.undone = []
+        self.delta = None  # An action in progress is dropped too
+        self.last = {}
+        self.counts = dict(self.game.inventory.counts)
+
+    # --- Recording ---
+
+    @contextmanager
+    def track(self, action=None):
+        """Record what the body of the ``with`` block changes as one undoable action"""
+        self.begin()
+        try:
+            yield
+        finally:
+            self.commit(action)
+
+    def begin(self):
+        game = self.game
+        self.delta = {"items": {}, "flags": []}
+        self.before = (
+            [getattr(game, name) for name in self.fields],
+            [_copy(getattr(game, name)) for name in self.containers],
+            [PARTS[name][0](game) for name in self.parts],
+            self.rng_state(),
+        )
+
+    def commit(self, action=None):
+        """Store the recorded delta, unless the action changed nothing"""
+        game, delta = self.game, self.delta
+        if delta is None:
+            return None
+        self.delta = None
+        fields, containers, parts, rng = self.before
+        self.before = None
+        for name, value in zip(self.fields, fields):
+            now = getattr(game, name)
+            if now is not value and now != value:
+                self.store(delta, name, value, now)
+        for name, value in zip(self.containers, containers):
+            now = getattr(game, name)
+            if now != value:
+                self.store(delta, name, value, _copy(now))
+        for name, value in zip(self.parts, parts):
+            now = PARTS[name][0](game)
+            if now != value:
+                self.store(delta, name, value, now)
+        rng_after = self.rng_state()
+        if rng_after != rng:
+            self.store(delta, "rng", rng, rng_after)
+        items = delta.pop("items")
+        if items:
+            delta["items"] = {item: (before, game.inventory.count(item)) for item, before in items.items()}
+        flags = delta.pop("flags")
+        if flags:
+            delta["flags"] = flags
+        if action is not None and hasattr(game, "actions"):
+            delta["action"] = action  # Logged even when nothing else changed
+        if not delta:
+            return None
+        self.done.append(delta)
+        self.undone = []
+        return delta
+
+    def store(self, delta, name, before, after):
+        # An action's "before" usually equals the previous action's "after": keep one object for both
+        if name in self.last and self.last[name] == before:
+            before = self.last[name]
+        delta[name] = (before, after)
+        self.last[name] = after
+
+    def rng_state(self):
+        version, state, gauss = self.game.rng.getstate()
+        words = state[:-1]
+        if words != self.words:
+            self.words = words
+            self.packed = RNG_WORDS.pack(*words)
+        return version, self.packed, state[-1], gauss
+
+    def on_item_change(self, item, count):
+        before = self.counts.pop(item, 0)
+        if count:
+            self.counts[item] = count
+        if self.delta is not None and not self.applying:
+            self.delta["items"].setdefault(item, before)
+
+    def on_flag(self, flag):
+        if self.delta is not None and not self.applying:
+            self.delta["flags"].append(flag)
+
+    # --- Undo and redo ---
+
+    def undo(self, steps=1):
+        """Undo up to ``steps`` actions; returns how many were undone"""
+        count = 0
+        while count < steps and self.done:
+            delta = self.done.pop()
+            self.apply(delta, 0)
+            self.undone.append(delta)
+            count += 1
+        return count
+
+    def redo(self, steps=1):
+        """Redo up to ``steps`` undone actions; returns how many were redone"""
+        count = 0
+        while count < steps and self.undone:
+            delta = self.undone.pop()
+            self.apply(delta, 1)
+            self.done.append(delta)
+            count += 1
+        return count
+
+    def scrub(self, offset):
+        """Move ``offset`` actions along the timeline: back if negative, forward if positive"""
+        return -self.undo(-offset) if offset < 0 else self.redo(offset)
+
+    def apply(self, delta, side):
+        """Put the game in the state before (side 0) or after (side 1) ``delta``"""
+        game = self.game
+        tracker = getattr(game, "quest_tracker", None)
+        self.applying = True
+        if tracker is not None:
+            tracker.muted = True  # Items and flags coming back are not new progress
+        try:
+            for item, counts in delta.get("items", {}).items():
+                _set_count(game.inventory, item, counts[side])
+            for flag in delta.get("flags", ()):
+                if side:
+                    game.events_triggered.add(flag)
+                else:
+                    game.events_triggered.discard(flag)
+            for name, values in delta.items():
+                if name in SPECIAL:
+                    continue
+                if name in PARTS:
+                    PARTS[name][1](game, values[side])
+                elif name in self.containers:
+                    _refill(getattr(game, name), values[side])
+                else:
+                    setattr(game, name, values[side])
+            if "rng" in delta:
+                version, packed, pos, gauss = delta["rng"][side]
+                game.rng.setstate((version, RNG_WORDS.unpack(packed) + (pos,), gauss))
+            if "action" in delta:
+                if side:
+                    game.actions.append(delta["action"])
+                else:
+                    game.actions.pop()
+        finally:
+            self.applying = False
+            if tracker is not None:
+                tracker.muted = False
+                tracker.rebuild()
+            if hasattr(game, "sampler_tables"):
+                game.forget_tables()  # Restored flags, eggs and workers do not notify
+
+
+def _copy(value):
+    return value.copy() if isinstance(value, (dict, set, list)) else value
+
+def _refill(target, value):
+    # In place, so anything holding on to the container (listeners, front ends) stays attached
+    target.clear()
+    if isinstance(target, list):
+        target.extend(value)
+    else:
+        target.update(value)
+
+def _set_count(inventory, item, count):
+    held = inventory.count(item)
+    if count > held:
+        inventory.add(item, count - held)
+    for _ in range(held - count):
+        inventory.remove(item)
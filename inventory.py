@@ -0,0 +1,116 @@
+from itertools import islice, repeat
+
+# An item belongs to a category when its name contains one of the keywords
+CATEGORY_KEYWORDS = {
+    "food": ("meat", "fish", "berries", "food"),
+}
+
+_category_cache = {}
+
+
+def categories_of(item):
+    """Categories an item name falls into, computed once per distinct name"""
+    cats = _category_cache.get(item)
+    if cats is None:
+        cats = tuple(name for name, keywords in CATEGORY_KEYWORDS.items()
+                     if any(keyword in item for keyword in keywords))
+        _category_cache[item] = cats
+    return cats
+
+def is_food(item):
+    return "food" in categories_of(item)
+
+
+class Inventory:
+    """Counted multiset of item names with a per-category index.
+
+    Membership, counts, adds and removals are constant time. Iterating
+    yields every copy, in the order items were first picked up.
+    Listeners are called as ``listener(item, count)`` after every change.
+    """
+    def __init__(self, items=()):
+        self.counts = {}
+        self.by_category = {name: {} for name in CATEGORY_KEYWORDS}
+        self.total = 0
+        self.listeners = []
+        for item in items:
+            self.add(item)
+
+    def add(self, item, count=1):
+        self.counts[item] = self.counts.get(item, 0) + count
+        for cat in categories_of(item):
+            index = self.by_category[cat]
+            index[item] = index.get(item, 0) + count
+        self.total += count
+        for listener in self.listeners:
+            listener(item, self.counts[item])
+
+    def remove(self, item):
+        """Remove one copy; returns False if the item is not held"""
+        held = self.counts.get(item)
+        if not held:
+            return False
+        if held == 1:
+            del self.counts[item]
+        else:
+            self.counts[item] = held - 1
+        for cat in categories_of(item):
+            index = self.by_category[cat]
+            if index[item] == 1:
+                del index[item]
+            else:
+                index[item] -= 1
+        self.total -= 1
+        for listener in self.listeners:
+            listener(item, held - 1)
+        return True
+
+    def copy(self):
+        """Copy of the counts, without listeners"""
+        other = Inventory.__new__(Inventory)
+        other.counts = dict(self.counts)
+        other.by_category = {name: dict(index) for name, index in self.by_category.items()}
+        other.total = self.total
+        other.listeners = []
+        return other
+
+    def accepts(self, item):
+        """Duplicate rule: only food stacks, everything else is held at most once"""
+        return item not in self.counts or is_food(item)
+
+    def count(self, item):
+        return self.counts.get(item, 0)
+
+    def category(self, name):
+        """Every copy of the items in a category, e.g. category("food")"""
+        return [item for item, n in self.by_category[name].items() for _ in repeat(None, n)]
+
+    def has_category(self, name):
+        return bool(self.by_category[name])
+
+    def head(self, n):
+        """The first n copies, without expanding the rest"""
+        return list(islice(self, n))
+
+    def clear(self):
+        items = list(self.counts)
+        self.counts.clear()
+        for index in self.by_category.values():
+            index.clear()
+        self.total = 0
+        for item in items:
+            for listener in self.listeners:
+                listener(item, 0)
+
+    def __contains__(self, item):
+        return item in self.counts
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        for item, n in self.counts.items():
+            yield from repeat(item, n)
+
+    def __repr__(self):
+        return f"Inventory({list(self)!r})"
@@ -0,0 +1,180 @@
+"""Monte Carlo tree search over the headless engine.
+
+Every playout forks the position being searched, reseeds its RNG, walks down the tree by UCB1 and finishes the game with a
+rollout policy. The tree is a transposition table: nodes are keyed by
+``state_key``, so paths that reach the same position (and chance
+outcomes that land on it again) share their statistics.
+
+    python mcts.py -n 20 --budget 0.2                 # play 20 games, 0.2s of search per move
+    python mcts.py -n 5 --reward gold --rollout random
+    python simulate.py --policy mcts:mcts_policy -n 200
+"""
+import argparse
+import math
+import random
+import time
+from collections import Counter
+
+from engine import GameEngine
+from simulate import load_policy
+
+EXPLORATION = 1.4
+GOLD_SCALE = 200  # Gold at which the gold reward saturates
+MAX_ROLLOUT_STEPS = 1000
+
+# Final position -> reward in [0, 1]. "gold" still puts escaping first: a win with no gold
+# is worth half, and gold only adds the other half on top of a win.
+REWARDS = {
+    "win": lambda game: 1.0 if game.won else 0.0,
+    "gold": lambda game: 0.5 + 0.5 * min(1.0, game.available_gold / GOLD_SCALE) if game.won else 0.0,
+}
+
+
+def state_key(game):
+    """Canonical key of a decision point: the game state plus the prompt waiting for an answer"""
+    context = game.context
+    return (
+        game.clock.now, game.day, game.health, game.hunger, game.location, game.available_gold,
+        frozenset(game.inventory.counts.items()), frozenset(game.events_triggered),
+        tuple(sorted((w.type, w.effectiveness, w.morale, w.loyalty) for w in game.hired_npcs)),
+        tuple(sorted((e.name, e.level, e.due, e.expires) for e in game.effects)),
+        tuple(sorted((quest.id, quest.progress) for quest in game.quests.values())),
+        game.prompt, tuple(context) if isinstance(context, list) else context,
+    )
+
+class Node:
+    """Visit counts and reward totals for each legal action of one position"""
+    __slots__ = ("visits", "actions", "counts", "totals")
+
+    def __init__(self, actions):
+        self.visits = 0
+        self.actions = actions
+        self.counts = [0] * len(actions)
+        self.totals = [0.0] * len(actions)
+
+class MCTS:
+    """UCT search with a transposition table, kept across moves of the same game"""
+    def __init__(self, budget=0.1, playouts=None, exploration=EXPLORATION, rollout="cautious",
+                 reward="win", seed=None):
+        self.budget = budget        # Seconds of search per move
+        self.max_playouts = playouts  # Or a fixed number of playouts per move
+        self.exploration = exploration
+        self.rollout_policy = load_policy(rollout)
+        self.reward = REWARDS[reward]
+        self.rng = random.Random(seed)
+        self.table = {}
+        self.playouts = 0
+        self.steps = 0
+        self.search_time = 0.0
+
+    def playouts_per_second(self):
+        return self.playouts / self.search_time if self.search_time else 0.0
+
+    def choose(self, game):
+        """Search from ``game``'s pending prompt and return the most visited action"""
+        started = time.perf_counter()
+        deadline = started + self.budget
+        done = 0
+        while (done < self.max_playouts) if self.max_playouts else (time.perf_counter() < deadline):
+            position = game.fork()
+            position.rng.seed(self.rng.getrandbits(64))
+            self.playout(position)
+            done += 1
+        self.search_time += time.perf_counter() - started
+        self.playouts += done
+        node = self.table[state_key(game)]
+        return node.actions[max(range(len(node.actions)), key=node.counts.__getitem__)]
+
+    def select(self, node):
+        untried = [i for i, count in enumerate(node.counts) if count == 0]
+        if untried:
+            return self.rng.choice(untried)
+        log_visits = math.log(node.visits)
+        return max(range(len(node.actions)),
+                   key=lambda i: node.totals[i] / node.counts[i]
+                   + self.exploration * math.sqrt(log_visits / node.counts[i]))
+
+    def playout(self, game):
+        """One iteration: descend the tree, add one node, roll out, back the reward up"""
+        path = []
+        seen = set()
+        outcome = game.outcome()
+        while not game.game_over:
+            key = state_key(game)
+            if key in seen:
+                # A menu choice that changed nothing (e.g. hiring without gold): score the
+                # loop as a loss so the bot never picks it for real and stalls forever
+                self.backup(path, 0.0)
+                return
+            seen.add(key)
+            node = self.table.get(key)
+            expand = node is None
+            if expand:
+                node = self.table[key] = Node(game.legal_actions())
+            index = self.select(node)
+            path.append((node, index))
+            outcome = game.step(node.actions[index])
+            self.steps += 1
+            if expand:
+                break
+        for _ in range(MAX_ROLLOUT_STEPS):
+            if game.game_over:
+                break
+            outcome = game.step(self.rollout_policy(game, outcome, self.rng))
+            self.steps += 1
+        self.backup(path, self.reward(game))
+
+    def backup(self, path, reward):
+        for node, index in path:
+            node.visits += 1
+            node.counts[index] += 1
+            node.totals[index] += reward
+
+
+_search = (None, None)  # (game, MCTS) of the game being played, so its tree carries over between moves
+
+def mcts_policy(engine, outcome, rng):
+    """MCTS with 1000 playouts per move (use as --policy mcts:mcts_policy)"""
+    global _search
+    if _search[0] is not engine:
+        _search = (engine, MCTS(playouts=1000, seed=rng.getrandbits(64)))
+    return _search[1].choose(engine)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play games with Monte Carlo tree search")
+    parser.add_argument("-n", "--games", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=0.1, help="seconds of search per move")
+    parser.add_argument("--playouts", type=int, default=None, help="fixed playouts per move instead of a time budget")
+    parser.add_argument("--exploration", type=float, default=EXPLORATION)
+    parser.add_argument("--rollout", default="cautious", help="rollout policy name or module:function")
+    parser.add_argument("--reward", default="win", choices=sorted(REWARDS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    endings = Counter()
+    gold = playouts = steps = 0
+    search_time = 0.0
+    for _ in range(args.games):
+        search = MCTS(args.budget, args.playouts, args.exploration, args.rollout, args.reward, rng.getrandbits(64))
+        game = GameEngine(seed=rng.getrandbits(63))
+        game.start("Bot")
+        while not game.game_over:
+            game.step(search.choose(game))
+        endings[game.ending_type] += 1
+        gold += game.available_gold
+        playouts += search.playouts
+        steps += search.steps
+        search_time += search.search_time
+        print(f"{game.ending_type:<16} day {game.day}  gold {game.available_gold:>4}  "
+              f"{search.playouts:>7,} playouts  {len(search.table):>7,} nodes")
+
+    wins = sum(n for ending, n in endings.items() if ending not in ("death", "starvation", "timeout"))
+    print(f"\nWon {wins}/{args.games}, average gold {gold / args.games:.0f}")
+    print(f"{playouts:,} playouts in {search_time:.2f}s: {playouts / search_time:,.0f} playouts/s, "
+          f"{steps / search_time:,.0f} engine steps/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Quests as data, advanced incrementally by the game events they listen to.
+
+Each quest lists triggers ``(event, key, amount)``: when the game emits
+``event`` for ``key`` (None matches any key), the quest gains ``amount``
+progress, or the size of the change when amount is None. Events are:
+
+- ``item_added``: key is the item and each of its categories (e.g. "food")
+- ``flag_set``: key is the flag added to ``events_triggered``
+- ``location_visited``: key is the location travelled to
+- ``day_changed``: key is the new day number
+- ``won``: key is the ending type
+
+The tracker indexes active quests by (event, key), so an event only
+touches the quests listening for it, however many quests exist.
+"""
+from inventory import categories_of
+
+QUESTS = [
+    {
+        "id": "rescue", "title": "Escape the Wilderness",
+        "description": "Reach the village and catch the helicopter by day 7",
+        "reward_items": [], "reward_health": 0, "target": 1,
+        "on": [("won", None, 1)],
+    },
+    {
+        "id": "find_hermit", "title": "Find the Hermit",
+        "description": "Discover the hermit in the northern cave",
+        "reward_items": ["hermit_wisdom"], "reward_health": 0, "target": 1,
+        "on": [("flag_set", "met_hermit", 1)],
+    },
+    {
+        "id": "gather_food", "title": "Stock Up on Food",
+        "description": "Collect 3 food items for the journey",
+        "reward_items": ["travelers_ration"], "reward_health": 5, "target": 3,
+        "on": [("item_added", "food", None)],
+    },
+]
+QUEST_SPECS = {spec["id"]: spec for spec in QUESTS}
+
+
+class Quest:
+    """Quest system with tracking and rewards"""
+    __slots__ = ("id", "title", "description", "reward_items", "reward_health", "completed", "progress")
+
+    def __init__(self, quest_id, title, description, reward_items, reward_health=0):
+        self.id = quest_id
+        self.title = title
+        self.description = description
+        self.reward_items = reward_items
+        self.reward_health = reward_health
+        self.completed = False
+        self.progress = 0
+
+    def copy(self):
+        other = Quest.__new__(Quest)
+        for name in Quest.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+
+
+class Flags(set):
+    """Set of story flags that tells its listeners when a new flag is added"""
+    def __init__(self, flags=()):
+        super().__init__(flags)
+        self.listeners = []
+
+    def add(self, flag):
+        if flag not in self:
+            super().add(flag)
+            for listener in self.listeners:
+                listener(flag)
+
+
+class QuestTracker:
+    """Routes game events to the active quests subscribed to them"""
+    def __init__(self, game):
+        self.game = game
+        self.subscribers = {}  # (event, key) -> {quest id: amount}
+        self.counts = {}  # Last seen inventory counts, to turn changes into amounts
+        self.muted = False
+        self.shared = False  # True while game.quests is shared with a fork
+        game.inventory.listeners.append(self.on_item_change)
+        game.events_triggered.listeners.append(self.on_flag)
+
+    def fork(self, game):
+        """Tracker for ``game``, a fork of this tracker's game that shares its quest records"""
+        other = QuestTracker.__new__(QuestTracker)
+        other.game = game
+        other.subscribers = {key: dict(quests) for key, quests in self.subscribers.items()}
+        other.counts = dict(self.counts)
+        other.muted = False
+        other.shared = self.shared = True
+        game.inventory.listeners.append(other.on_item_change)
+        game.events_triggered.listeners.append(other.on_flag)
+        return other
+
+    def own_quests(self):
+        """Give the game its own copies of the quest records before one of them changes"""
+        if self.shared:
+            self.game.quests = {key: quest.copy() for key, quest in self.game.quests.items()}
+            self.shared = False
+
+    def start(self):
+        """Hand out every quest in QUESTS as active"""
+        for spec in QUESTS:
+            self.game.quests[spec["id"]] = Quest(spec["id"], spec["title"], spec["description"],
+                                                 list(spec["reward_items"]), spec["reward_health"])
+            self.game.active_quests.append(spec["id"])
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-index the game's active quests, e.g. after loading a snapshot"""
+        self.subscribers = {}
+        self.counts = dict(self.game.inventory.counts)
+        for quest_id in self.game.active_quests:
+            self.subscribe(quest_id)
+
+    def subscribe(self, quest_id):
+        for event, key, amount in QUEST_SPECS[quest_id]["on"]:
+            self.subscribers.setdefault((event, key), {})[quest_id] = amount
+
+    def unsubscribe(self, quest_id):
+        for event, key, _ in QUEST_SPECS[quest_id]["on"]:
+            quests = self.subscribers.get((event, key))
+            if quests is not None:
+                quests.pop(quest_id, None)
+                if not quests:
+                    del self.subscribers[(event, key)]
+
+    def emit(self, event, key, amount=1):
+        if self.muted:
+            return
+        keys = (key, None) + (categories_of(key) if event == "item_added" else ())
+        for k in keys:
+            quests = self.subscribers.get((event, k))
+            if quests:
+                for quest_id, step in list(quests.items()):
+                    self.advance(quest_id, amount if step is None else step)
+
+    def advance(self, quest_id, amount):
+        self.own_quests()
+        quest = self.game.quests[quest_id]
+        if quest.completed:
+            return
+        spec = QUEST_SPECS[quest_id]
+        quest.progress = min(spec["target"], quest.progress + amount)
+        if quest.progress >= spec["target"]:
+            self.complete(quest_id)
+
+    def complete(self, quest_id):
+        game = self.game
+        quest = game.quests[quest_id]
+        quest.completed = True
+        self.unsubscribe(quest_id)
+        if quest_id in game.active_quests:
+            game.active_quests.remove(quest_id)
+        game.completed_quests.append(quest_id)
+        game.say(f"★ Quest complete: {quest.title}")
+        if quest.reward_health:
+            game.modify_stats(health=quest.reward_health)
+        for item in quest.reward_items:
+            game.add_item(item)
+
+    # --- Hooks ---
+
+    def on_item_change(self, item, count):
+        before = self.counts.pop(item, 0)
+        if count:
+            self.counts[item] = count
+        if count > before:
+            self.emit("item_added", item, count - before)
+
+    def on_flag(self, flag):
+        self.emit("flag_set", flag)
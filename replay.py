@@ -0,0 +1,121 @@
+"""Record and replay headless runs.
+
+A recording is one JSON line holding the seed, player name, every action
+sent to the engine and the final state hash. Replaying re-runs the
+actions on a fresh engine with the same seed and checks the hash:
+
+    python replay.py record -n 10000 --policy random -o corpus.jsonl
+    python replay.py verify corpus.jsonl
+"""
+import argparse
+import json
+import random
+import sys
+import time
+
+from engine import GameEngine
+
+FORMAT_VERSION = 6  # Bumped whenever a rules change makes old recordings replay differently
+
+
+class Recording:
+    """Seed, player name and chosen actions of one run, plus its final state hash"""
+    def __init__(self, seed, player_name, actions, state_hash=None):
+        self.seed = seed
+        self.player_name = player_name
+        self.actions = actions
+        self.state_hash = state_hash
+
+    @classmethod
+    def from_engine(cls, engine):
+        return cls(engine.seed, engine.player_name, list(engine.actions), engine.state_hash())
+
+    def to_line(self):
+        return json.dumps({"v": FORMAT_VERSION, "seed": self.seed, "name": self.player_name,
+                           "actions": self.actions, "hash": self.state_hash}, separators=(",", ":"))
+
+    @classmethod
+    def from_line(cls, line):
+        data = json.loads(line)
+        if data.get("v") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version: {data.get('v')}")
+        return cls(data["seed"], data["name"], data["actions"], data.get("hash"))
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_line() + "\n")
+
+
+def replay(recording):
+    """Re-run a recording on a fresh engine and return the engine"""
+    engine = GameEngine(seed=recording.seed)
+    engine.start(recording.player_name)
+    for action in recording.actions:
+        if engine.game_over:
+            break
+        engine.step(action)
+    return engine
+
+def verify(recording):
+    """True if replaying the recording reaches the recorded final state"""
+    return replay(recording).state_hash() == recording.state_hash
+
+def read_recordings(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield Recording.from_line(line)
+
+
+def record_games(games, policy_name, seed, out, max_steps=1000):
+    from simulate import load_policy
+
+    policy = load_policy(policy_name)
+    rng = random.Random(seed)
+    for _ in range(games):
+        engine = GameEngine(seed=rng.getrandbits(63))
+        outcome = engine.start("Bot")
+        for _ in range(max_steps):
+            if outcome.game_over:
+                break
+            outcome = engine.step(policy(engine, outcome, rng))
+        out.write(Recording.from_engine(engine).to_line() + "\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and verify headless runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_cmd = commands.add_parser("record", help="play games with a policy and write recordings")
+    record_cmd.add_argument("-n", "--games", type=int, default=1000)
+    record_cmd.add_argument("--policy", default="random")
+    record_cmd.add_argument("--seed", type=int, default=0)
+    record_cmd.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+
+    verify_cmd = commands.add_parser("verify", help="replay recordings and check their final state")
+    verify_cmd.add_argument("paths", nargs="+")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        if args.output == "-":
+            record_games(args.games, args.policy, args.seed, sys.stdout)
+        else:
+            with open(args.output, "w", encoding="utf-8") as out:
+                record_games(args.games, args.policy, args.seed, out)
+        return
+
+    total = failed = steps = 0
+    started = time.perf_counter()
+    for path in args.paths:
+        for index, recording in enumerate(read_recordings(path), 1):
+            total += 1
+            steps += len(recording.actions)
+            if not verify(recording):
+                failed += 1
+                print(f"MISMATCH {path}:{index} (seed {recording.seed})")
+    elapsed = time.perf_counter() - started
+    print(f"{total - failed}/{total} recordings verified, {steps} actions in {elapsed:.2f}s")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import heapq
+from collections import Counter
+from itertools import count, islice
+
+
+class Roster:
+    """Hired workers with a running payroll and per-role lookups.
+
+    Workers are kept in hire order in a dict, so hiring and firing are O(1).
+    Each role also keeps a max-heap on effectiveness; fired workers drop
+    out of it lazily the next time the role's best worker is asked for.
+    """
+    def __init__(self, workers=()):
+        self.workers = {}  # serial -> HiredNPC, in hire order
+        self.serials = {}  # id(worker) -> serial
+        self.roles = {}  # role -> heap of (-effectiveness, serial)
+        self.role_counts = Counter()
+        self.payroll = 0
+        self._serial = count()
+        for worker in workers:
+            self.hire(worker)
+
+    def copy(self):
+        """Roster of copied workers under the same serials, so the role heaps carry over"""
+        other = Roster.__new__(Roster)
+        other.workers = {}
+        other.serials = {}
+        for serial, worker in self.workers.items():
+            clone = other.workers[serial] = worker.copy()
+            other.serials[id(clone)] = serial
+        other.roles = {role: list(heap) for role, heap in self.roles.items()}
+        other.role_counts = self.role_counts.copy()
+        other.payroll = self.payroll
+        other._serial = count(next(self._serial))
+        return other
+
+    def hire(self, worker):
+        serial = next(self._serial)
+        self.workers[serial] = worker
+        self.serials[id(worker)] = serial
+        heapq.heappush(self.roles.setdefault(worker.type, []), (-worker.effectiveness, serial))
+        self.role_counts[worker.type] += 1
+        self.payroll += worker.cost_per_day
+        return worker
+
+    def fire(self, worker):
+        serial = self.serials.pop(id(worker))
+        del self.workers[serial]
+        self.role_counts[worker.type] -= 1
+        self.payroll -= worker.cost_per_day
+        heap = self.roles[worker.type]
+        if len(heap) > 2 * self.role_counts[worker.type] + 16:
+            # Too many stale entries: rebuild instead of letting the heap grow with churn
+            heap[:] = [entry for entry in heap if entry[1] in self.workers]
+            heapq.heapify(heap)
+        return worker
+
+    def best(self, role):
+        """Most effective worker of ``role`` (earliest hired on ties), or None"""
+        heap = self.roles.get(role)
+        while heap:
+            serial = heap[0][1]
+            if serial in self.workers:
+                return self.workers[serial]
+            heapq.heappop(heap)
+        return None
+
+    def has(self, role):
+        return self.role_counts[role] > 0
+
+    def members(self, role):
+        """Workers of ``role``, in hire order"""
+        return [worker for worker in self.workers.values() if worker.type == role] if self.has(role) else []
+
+    def adjust(self, morale=0, loyalty=0, role=None):
+        """Add morale/loyalty deltas to every worker (or every worker of ``role``) in one pass"""
+        for worker in (self.workers.values() if role is None else self.members(role)):
+            worker.morale = max(0, min(100, worker.morale + morale))
+            worker.loyalty += loyalty
+
+    def __getitem__(self, index):
+        """Worker at ``index`` in hire order, as listed in the roster menu"""
+        if not 0 <= index < len(self.workers):
+            raise IndexError(index)
+        return next(islice(self.workers.values(), index, None))
+
+    def __len__(self):
+        return len(self.workers)
+
+    def __iter__(self):
+        return iter(list(self.workers.values()))
+
+    def __repr__(self):
+        return f"Roster({list(self.workers.values())!r})"
@@ -0,0 +1,128 @@
+"""Weighted outcome sampling with Vose alias tables.
+
+An AliasTable draws one of n weighted outcomes in constant time, however
+many outcomes there are. A CascadeSampler describes outcomes the way the
+game content does - cascading ``roll < threshold and condition`` bands
+over a 1..N roll - and keeps one alias table per eligible set, so a table
+is only rebuilt when a condition changes (an egg found, an item picked up).
+
+Games that keep a ``sampler_tables`` dict also remember the table they
+drew from last, so rolls skip the conditions entirely until the game
+clears that dict on a change the conditions could see.
+"""
+
+
+class AliasTable:
+    """O(n) build, O(1) draws from ``outcomes`` with non-negative ``weights``"""
+    def __init__(self, outcomes, weights):
+        pairs = [(outcome, weight) for outcome, weight in zip(outcomes, weights) if weight > 0]
+        if not pairs:
+            raise ValueError("AliasTable needs at least one outcome with positive weight")
+        self.outcomes = [outcome for outcome, _ in pairs]
+        n = len(pairs)
+        total = sum(weight for _, weight in pairs)
+        scaled = [weight * n / total for _, weight in pairs]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left over is 1.0 up to rounding error
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def draw(self, rng):
+        """One outcome using a single ``rng.random()`` call (none if there is only one outcome)"""
+        n = len(self.outcomes)
+        if n == 1:
+            return self.outcomes[0]
+        u = rng.random() * n
+        i = int(u)
+        return self.outcomes[i if u - i < self.prob[i] else self.alias[i]]
+
+    def draw_many(self, rng, k):
+        return [self.draw(rng) for _ in range(k)]
+
+    def sample_indices(self, np_rng, k):
+        """``k`` outcome indices as a NumPy array, drawn from a ``numpy.random.Generator``"""
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = (np.array(self.prob), np.array(self.alias))
+        prob, alias = self._arrays
+        n = len(self.outcomes)
+        if n == 1:
+            return np.zeros(k, dtype=np.int64)
+        u = np_rng.random(k) * n
+        i = u.astype(np.int64)
+        return np.where(u - i < prob[i], i, alias[i])
+
+
+class CascadeSampler:
+    """Outcomes given as ordered ``(below, outcome, condition)`` bands over a roll of 1..roll.
+
+    A roll picks the first band with ``roll < below`` whose condition
+    holds (None = always), exactly like an ``if roll < 5 and ...: elif``
+    chain; rolls no band claims go to ``fallback``. Each distinct eligible
+    set gets its own alias table, built on first use and cached.
+
+    ``key(game)`` names any state the conditions read that the game does
+    not announce a change of (e.g. its location); the game's remembered
+    table is kept per key.
+    """
+    def __init__(self, roll, bands, fallback=None, key=None):
+        self.roll = roll
+        self.bands = [(min(below, roll + 1), outcome, condition) for below, outcome, condition in bands]
+        self.fallback = fallback
+        self.conditional = [condition for _, _, condition in self.bands if condition is not None]
+        self.key = key
+        self.tables = {}
+
+    def eligible_set(self, game):
+        return tuple(condition(game) for condition in self.conditional)
+
+    def weights(self, eligible):
+        """Number of roll values that land on each outcome, for one eligible set"""
+        flags = iter(eligible)
+        claimed = 0  # Rolls 1..claimed already belong to an earlier band
+        weights = {}
+        for below, outcome, condition in self.bands:
+            if condition is not None and not next(flags):
+                continue
+            if below - 1 > claimed:
+                weights[outcome] = weights.get(outcome, 0) + below - 1 - claimed
+                claimed = below - 1
+        if claimed < self.roll:
+            weights[self.fallback] = weights.get(self.fallback, 0) + self.roll - claimed
+        return weights
+
+    def table(self, game):
+        current = getattr(game, "sampler_tables", None)
+        if current is None:
+            return self.table_for(self.eligible_set(game))
+        slot = self if self.key is None else (self, self.key(game))
+        table = current.get(slot)
+        if table is None:
+            table = current[slot] = self.table_for(self.eligible_set(game))
+        return table
+
+    def table_for(self, eligible):
+        table = self.tables.get(eligible)
+        if table is None:
+            weights = self.weights(eligible)
+            table = self.tables[eligible] = AliasTable(list(weights), list(weights.values()))
+        return table
+
+    def draw(self, rng, game):
+        return self.table(game).draw(rng)
+
+    def draw_many(self, rng, game, k):
+        """``k`` draws for the same eligible set, e.g. for simulators"""
+        return self.table(game).draw_many(rng, k)
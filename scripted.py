@@ -0,0 +1,172 @@
+"""Run the text game from transcripts of player input, without a terminal.
+
+A transcript is a text file with one line per input, exactly as a player
+would type it into game.py: the name, an empty line for each "Press
+Enter", then the choices, including save/load and undo/redo. Lines
+starting with "#" are headers or comments:
+
+    # seed: 42
+    # expect: healthy_escape
+    Alice
+
+    2
+    ...
+
+Each transcript plays on a fresh game with the header's seed (or
+--seed). Output is discarded, or written to <output dir>/<name>.out. A
+transcript that runs out of input before the game ends is "incomplete";
+one whose ending differs from its "expect" header fails, and so does one
+that raises.
+
+    python scripted.py scenarios/ --workers 8 --output logs/
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from game import Game, SAVE_FILE
+
+
+class Transcript:
+    """Inputs of one scripted session, plus its seed and expected ending if the headers give them"""
+    def __init__(self, name, inputs, seed=None, expect=None):
+        self.name = name
+        self.inputs = inputs
+        self.seed = seed
+        self.expect = expect
+
+    @classmethod
+    def read(cls, path):
+        inputs, headers = [], {}
+        with open(path, encoding="utf-8") as f:
+            for line in f.read().splitlines():
+                if line.startswith("#"):
+                    key, sep, value = line[1:].partition(":")
+                    if sep:
+                        headers[key.strip().lower()] = value.strip()
+                else:
+                    inputs.append(line)
+        seed = headers.get("seed")
+        return cls(path, inputs, None if seed is None else int(seed), headers.get("expect"))
+
+
+class ScriptedGame(Game):
+    """Game whose input comes from a list of lines; running out raises EOFError like input() does"""
+    def __init__(self, inputs, seed=None):
+        super().__init__(seed=seed)
+        self.inputs = inputs
+        self.used = 0
+
+    def read_line(self, prompt):
+        if self.used >= len(self.inputs):
+            raise EOFError("transcript ended")
+        line = self.inputs[self.used]
+        self.used += 1
+        self.show(prompt + line)  # Echo it, so captured output reads like the terminal session
+        return line
+
+
+class Result:
+    """How one transcript went"""
+    def __init__(self, name, ending, day, used, inputs, seconds, expect=None, error=None):
+        self.name = name
+        self.ending = ending
+        self.day = day
+        self.used = used
+        self.inputs = inputs
+        self.seconds = seconds
+        self.expect = expect
+        self.error = error
+
+    @property
+    def passed(self):
+        return self.error is None and (self.expect is None or self.expect == self.ending)
+
+
+def run_transcript(job):
+    """Worker entry point: play one transcript and return its Result"""
+    path, seed, output_dir = job
+    script = Transcript.read(path)
+    game = ScriptedGame(script.inputs, seed=seed if script.seed is None else script.seed)
+    if output_dir:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        sink = open(os.path.join(output_dir, stem + ".out"), "w", encoding="utf-8")
+    else:
+        sink = open(os.devnull, "w", encoding="utf-8")
+    error = None
+    with tempfile.TemporaryDirectory() as scratch, sink, redirect_stdout(sink):
+        game.save_file = os.path.join(scratch, SAVE_FILE)  # Saves stay inside this transcript
+        started = time.perf_counter()
+        try:
+            game.run()
+        except EOFError:
+            pass
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        elapsed = time.perf_counter() - started
+    if error is not None:
+        ending = "error"
+    else:
+        ending = game.ending_type if game.game_over else "incomplete"
+    return Result(path, ending, game.day, game.used, len(script.inputs), elapsed, script.expect, error)
+
+def find_transcripts(paths):
+    """Transcript files named on the command line, with directories searched for *.txt"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(sorted(glob.glob(os.path.join(path, "**", "*.txt"), recursive=True)))
+        else:
+            found.append(path)
+    return found
+
+def run_all(paths, seed=0, workers=1, output_dir=None):
+    """Play every transcript, across a process pool if workers > 1; yields Results in order"""
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    jobs = [(path, seed, output_dir) for path in paths]
+    if workers == 1:
+        for job in jobs:
+            yield run_transcript(job)
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            yield from pool.imap(run_transcript, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+
+def format_result(result):
+    status = "ok" if result.passed else "FAIL"
+    if result.error:
+        status += f" ({result.error})"
+    elif not result.passed:
+        status += f" (expected {result.expect})"
+    return (f"{result.name:<40}{result.ending:<16}{result.day:>4}{result.used:>6}/{result.inputs:<6}"
+            f"{result.seconds * 1000:>9.1f}ms  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play game.py from transcripts of player input")
+    parser.add_argument("paths", nargs="+", help="transcript files, or directories of *.txt transcripts")
+    parser.add_argument("--seed", type=int, default=0, help="seed for transcripts without a seed header")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (0: all cores)")
+    parser.add_argument("--output", metavar="DIR", help="write each transcript's game output to DIR/<name>.out")
+    args = parser.parse_args()
+
+    paths = find_transcripts(args.paths)
+    workers = args.workers or os.cpu_count() or 1
+    print(f"{'Transcript':<40}{'Ending':<16}{'Day':>4}{'Inputs':>13}{'Time':>11}  Result")
+    failed = 0
+    started = time.perf_counter()
+    for result in run_all(paths, args.seed, workers, args.output):
+        failed += not result.passed
+        print(format_result(result))
+    elapsed = time.perf_counter() - started
+    rate = len(paths) / elapsed if elapsed else 0
+    print(f"\n{len(paths)} transcripts, {failed} failed, in {elapsed:.2f}s ({rate:,.0f} transcripts/s)")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
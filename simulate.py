@@ -0,0 +1,150 @@
+"""Monte Carlo estimate of how often each ending is reached.
+
+Plays N headless games across a process pool and tallies ``ending_type``:
+
+    python simulate.py -n 1000000 --policy random --workers 8 --seed 42
+"""
+import argparse
+import importlib
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+
+from engine import ENDINGS, GameEngine
+
+CHUNK_SIZE = 5000
+
+
+def random_policy(engine, outcome, rng):
+    """Pick uniformly among the options of the pending prompt"""
+    return rng.choice(outcome.options)[0]
+
+def first_policy(engine, outcome, rng):
+    """Always pick the first option"""
+    return outcome.options[0][0]
+
+def cautious_policy(engine, outcome, rng):
+    """Head for the village, eat when hungry, rest when hurt, and otherwise explore"""
+    prompt = outcome.prompt
+    if prompt == "menu":
+        if engine.hunger >= 60 and engine.food_items():
+            return "9"
+        if engine.location != "village":
+            return "7"
+        if engine.health < 50:
+            return "2"
+        return "1"
+    if prompt == "travel":
+        return "3"
+    if prompt == "eat":
+        return "1"
+    if prompt in ("hire_empty", "hire_roster"):
+        return outcome.options[-1][0]
+    return outcome.options[0][0]
+
+POLICIES = {
+    "random": random_policy,
+    "first": first_policy,
+    "cautious": cautious_policy,
+}
+
+
+def load_policy(name):
+    """Resolve a policy by registry name or as ``module:function``"""
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, _, func_name = name.partition(":")
+    if not func_name:
+        raise ValueError(f"Unknown policy: {name}")
+    return getattr(importlib.import_module(module_name), func_name)
+
+def play_game(policy, rng, max_steps=1000):
+    """Play one headless game and return its ending (None if it ran past max_steps)"""
+    engine = GameEngine(seed=rng.getrandbits(63))
+    outcome = engine.start("Bot")
+    for _ in range(max_steps):
+        if outcome.game_over:
+            return outcome.ending_type
+        outcome = engine.step(policy(engine, outcome, rng))
+    return outcome.ending_type if outcome.game_over else None
+
+def run_chunk(args):
+    """Worker entry point: play one chunk of games on its own seeded RNG stream"""
+    policy_name, seed, chunk_index, games, max_steps = args
+    rng = random.Random(f"{seed}:{chunk_index}")
+    policy = load_policy(policy_name)
+    tally = Counter()
+    for _ in range(games):
+        tally[play_game(policy, rng, max_steps)] += 1
+    return tally
+
+
+def wilson_interval(successes, total, z=1.96):
+    """Wilson score confidence interval for a binomial proportion"""
+    if total == 0:
+        return 0.0, 0.0
+    p = successes / total
+    denom = 1 + z * z / total
+    centre = (p + z * z / (2 * total)) / denom
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denom
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+def estimate(games, policy="random", workers=None, seed=0, max_steps=1000, chunk_size=CHUNK_SIZE):
+    """Play ``games`` games across a process pool and return a Counter of endings"""
+    load_policy(policy)  # Fail fast in the parent on a bad policy name
+    workers = workers or os.cpu_count() or 1
+    jobs = []
+    remaining, chunk_index = games, 0
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        jobs.append((policy, seed, chunk_index, size, max_steps))
+        remaining -= size
+        chunk_index += 1
+
+    tally = Counter()
+    if workers == 1:
+        for job in jobs:
+            tally.update(run_chunk(job))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for chunk_tally in pool.imap_unordered(run_chunk, jobs):
+                tally.update(chunk_tally)
+    return tally
+
+def format_report(tally, z=1.96):
+    total = sum(tally.values())
+    lines = [f"{'Ending':<16}{'Games':>12}{'Share':>10}   95% CI"]
+    for ending in ENDINGS + [None]:
+        count = tally.get(ending, 0)
+        if ending is None and count == 0:
+            continue
+        low, high = wilson_interval(count, total, z)
+        share = count / total if total else 0.0
+        label = ending or "unfinished"
+        lines.append(f"{label:<16}{count:>12}{share:>10.4%}   [{low:.4%}, {high:.4%}]")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate the ending distribution by Monte Carlo")
+    parser.add_argument("-n", "--games", type=int, default=100000, help="number of games to play")
+    parser.add_argument("--policy", default="random",
+                        help=f"one of {', '.join(POLICIES)} or module:function")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for the per-chunk RNG streams")
+    parser.add_argument("--max-steps", type=int, default=1000, help="give up on a game after this many prompts")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="games per worker task")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    tally = estimate(args.games, args.policy, args.workers, args.seed, args.max_steps, args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    print(format_report(tally))
+    print(f"\n{args.games} games in {elapsed:.2f}s ({args.games / elapsed:,.0f} games/s)")
+
+if __name__ == "__main__":
+    main()
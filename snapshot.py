@@ -0,0 +1,413 @@
+"""Versioned binary snapshots of the full game state.
+
+Layout: a fixed struct header (magic, version, seed and the scalar
+stats), a table of section lengths, then one length-prefixed section per
+entry in SECTIONS. Sections are encoded by schema with ``struct`` rather
+than pickle, and a loaded Snapshot only decodes a section when it is
+first asked for, so peeking at the stats of a save costs one header
+unpack.
+"""
+import struct
+
+from clock import Clock
+from engine import ENDINGS, LOCATIONS, NPC, HiredNPC
+from quests import Quest
+from roster import Roster
+
+MAGIC = b"SVSN"
+VERSION = 3
+
+HEADER = struct.Struct("<4sBqHhhiiBbB")
+_U16 = struct.Struct("<H")
+_I32 = struct.Struct("<i")
+_NPC = struct.Struct("<Bhhh")
+_RNG_STATE = struct.Struct("<625I")
+_GAUSS = struct.Struct("<Bd")
+
+FLAG_GAME_OVER = 1
+FLAG_WON = 2
+
+CONTEXT_NONE = 0
+CONTEXT_STR = 1
+CONTEXT_LIST = 2
+
+
+class Writer:
+    def __init__(self):
+        self.buf = bytearray()
+
+    def u16(self, value):
+        self.buf += _U16.pack(value)
+
+    def i32(self, value):
+        self.buf += _I32.pack(value)
+
+    def str(self, value):
+        data = value.encode("utf-8")
+        self.buf += _U16.pack(len(data))
+        self.buf += data
+
+    def strs(self, values):
+        self.buf += _U16.pack(len(values))
+        for value in values:
+            self.str(value)
+
+class Reader:
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+
+    def unpack(self, fmt):
+        values = fmt.unpack_from(self.data, self.pos)
+        self.pos += fmt.size
+        return values
+
+    def u16(self):
+        return self.unpack(_U16)[0]
+
+    def i32(self):
+        return self.unpack(_I32)[0]
+
+    def str(self):
+        length = self.u16()
+        value = bytes(self.data[self.pos:self.pos + length]).decode("utf-8")
+        self.pos += length
+        return value
+
+    def strs(self):
+        return [self.str() for _ in range(self.u16())]
+
+
+# --- Sections: (name, encode(game, writer), decode(reader), apply(game, value)) ---
+
+def _encode_inventory(game, w):
+    counts = game.inventory.counts
+    w.u16(len(counts))
+    for item, count in counts.items():
+        w.str(item)
+        w.u16(count)
+
+def _decode_inventory(r):
+    return [(r.str(), r.u16()) for _ in range(r.u16())]
+
+def _apply_inventory(game, counts):
+    # Refill in place so inventory listeners (e.g. the crafting tracker) stay attached
+    game.inventory.clear()
+    for item, count in counts:
+        game.inventory.add(item, count)
+
+
+def _encode_flags(game, w):
+    w.strs(sorted(game.events_triggered))
+    w.strs(sorted(game.easter_eggs_found))
+    w.strs(sorted(game.crafted_items))
+    w.strs(sorted(game.visited_locations))
+
+def _decode_flags(r):
+    return set(r.strs()), set(r.strs()), set(r.strs()), set(r.strs())
+
+def _apply_flags(game, flags):
+    # Refill in place so flag listeners (e.g. the quest tracker) stay attached
+    current = (game.events_triggered, game.easter_eggs_found, game.crafted_items, game.visited_locations)
+    for target, saved in zip(current, flags):
+        target.clear()
+        target.update(saved)
+
+
+def _encode_reputation(game, w):
+    w.u16(len(game.reputation))
+    for name, value in game.reputation.items():
+        w.str(name)
+        w.i32(value)
+
+def _decode_reputation(r):
+    return {r.str(): r.i32() for _ in range(r.u16())}
+
+def _apply_reputation(game, reputation):
+    game.reputation = reputation
+
+
+def _encode_npcs(game, w):
+    w.u16(len(game.npcs))
+    for key, npc in game.npcs.items():
+        w.str(key)
+        w.str(npc.type)
+        w.str(npc.name)
+        w.str(npc.personality)
+        w.str(getattr(npc, "backstory", ""))
+        w.strs(getattr(npc, "likes", []))
+
+def _decode_npcs(r):
+    npcs = {}
+    for _ in range(r.u16()):
+        key = r.str()
+        npc = NPC.__new__(NPC)
+        npc.type = r.str()
+        npc.name = r.str()
+        npc.personality = r.str()
+        npc.backstory = r.str()
+        npc.likes = r.strs()
+        npcs[key] = npc
+    return npcs
+
+def _apply_npcs(game, npcs):
+    game.npcs = npcs
+
+
+def _encode_hired(game, w):
+    w.u16(len(game.hired_npcs))
+    for npc in game.hired_npcs:
+        w.str(npc.type)
+        w.str(npc.name)
+        w.buf += _NPC.pack(npc.effectiveness, npc.loyalty, npc.morale, npc.cost_per_day)
+
+def _decode_hired(r):
+    hired = []
+    for _ in range(r.u16()):
+        npc = HiredNPC.__new__(HiredNPC)
+        npc.type = r.str()
+        npc.name = r.str()
+        npc.effectiveness, npc.loyalty, npc.morale, npc.cost_per_day = r.unpack(_NPC)
+        hired.append(npc)
+    return hired
+
+def _apply_hired(game, hired):
+    game.hired_npcs = Roster(hired)
+
+
+def _encode_quests(game, w):
+    quests = getattr(game, "quests", {})
+    w.u16(len(quests))
+    for key, quest in quests.items():
+        w.str(key)
+        w.str(quest.id)
+        w.str(quest.title)
+        w.str(quest.description)
+        w.strs(quest.reward_items)
+        w.i32(quest.reward_health)
+        w.i32(quest.progress)
+        w.u16(quest.completed)
+    w.strs(getattr(game, "active_quests", []))
+    w.strs(getattr(game, "completed_quests", []))
+
+def _decode_quests(r):
+    quests = {}
+    for _ in range(r.u16()):
+        key = r.str()
+        quest = Quest(r.str(), r.str(), r.str(), r.strs(), r.i32())
+        quest.progress = r.i32()
+        quest.completed = bool(r.u16())
+        quests[key] = quest
+    return quests, r.strs(), r.strs()
+
+def _apply_quests(game, value):
+    game.quests, game.active_quests, game.completed_quests = value
+
+
+def _encode_prompt(game, w):
+    w.str(getattr(game, "prompt", None) or "")
+    w.str(getattr(game, "prompt_text", ""))
+    options = getattr(game, "options", [])
+    w.u16(len(options))
+    for key, label in options:
+        w.str(key)
+        w.str(label)
+    context = getattr(game, "context", None)
+    if context is None:
+        w.u16(CONTEXT_NONE)
+    elif isinstance(context, str):
+        w.u16(CONTEXT_STR)
+        w.str(context)
+    else:
+        w.u16(CONTEXT_LIST)
+        w.strs(context)
+
+def _decode_prompt(r):
+    prompt = r.str() or None
+    prompt_text = r.str()
+    options = [(r.str(), r.str()) for _ in range(r.u16())]
+    kind = r.u16()
+    if kind == CONTEXT_STR:
+        context = r.str()
+    elif kind == CONTEXT_LIST:
+        context = r.strs()
+    else:
+        context = None
+    return prompt, prompt_text, options, context
+
+def _apply_prompt(game, value):
+    game.prompt, game.prompt_text, game.options, game.context = value
+
+
+def _encode_effects(game, w):
+    effects = list(game.effects)
+    w.u16(len(effects))
+    for effect in effects:
+        w.str(effect.name)
+        w.i32(effect.level)
+        w.i32(-1 if effect.due is None else effect.due)
+        w.i32(-1 if effect.expires is None else effect.expires)
+
+def _decode_effects(r):
+    effects = []
+    for _ in range(r.u16()):
+        name, level, due, expires = r.str(), r.i32(), r.i32(), r.i32()
+        effects.append((name, level, None if due < 0 else due, None if expires < 0 else expires))
+    return effects
+
+def _apply_effects(game, effects):
+    # Restore in place: the inventory watcher holds on to this StatusEffects
+    game.effects.clear()
+    for name, level, due, expires in effects:
+        game.effects.restore(name, level, due, expires)
+
+
+def _encode_clock(game, w):
+    clock = getattr(game, "clock", None)
+    if not isinstance(clock, Clock):
+        clock = None  # e.g. the pygame front end, whose clock is a pygame one
+    entries = clock.entries() if clock else []
+    w.i32(clock.now if clock else -1)
+    w.u16(len(entries))
+    for time, name, every in entries:
+        w.i32(time)
+        w.str(name)
+        w.i32(every or 0)
+
+def _decode_clock(r):
+    now = r.i32()
+    return now, [(r.i32(), r.str(), r.i32() or None) for _ in range(r.u16())]
+
+def _apply_clock(game, value):
+    now, entries = value
+    if now >= 0:
+        game.clock.restore(now, entries)
+
+
+def _encode_rng(game, w):
+    version, state, gauss = game.rng.getstate()
+    w.u16(version)
+    w.buf += _RNG_STATE.pack(*state)
+    w.buf += _GAUSS.pack(gauss is not None, gauss or 0.0)
+
+def _decode_rng(r):
+    version = r.u16()
+    state = r.unpack(_RNG_STATE)
+    has_gauss, gauss = r.unpack(_GAUSS)
+    return version, state, gauss if has_gauss else None
+
+def _apply_rng(game, state):
+    game.rng.setstate(state)
+
+
+def _encode_actions(game, w):
+    w.strs(getattr(game, "actions", []))
+
+def _decode_actions(r):
+    return r.strs()
+
+def _apply_actions(game, actions):
+    game.actions = actions
+
+
+SECTIONS = [
+    ("inventory", _encode_inventory, _decode_inventory, _apply_inventory),
+    ("flags", _encode_flags, _decode_flags, _apply_flags),
+    ("reputation", _encode_reputation, _decode_reputation, _apply_reputation),
+    ("npcs", _encode_npcs, _decode_npcs, _apply_npcs),
+    ("hired", _encode_hired, _decode_hired, _apply_hired),
+    ("quests", _encode_quests, _decode_quests, _apply_quests),
+    ("prompt", _encode_prompt, _decode_prompt, _apply_prompt),
+    ("effects", _encode_effects, _decode_effects, _apply_effects),
+    ("clock", _encode_clock, _decode_clock, _apply_clock),
+    ("rng", _encode_rng, _decode_rng, _apply_rng),
+    ("actions", _encode_actions, _decode_actions, _apply_actions),
+]
+SECTION_TABLE = struct.Struct("<" + "I" * len(SECTIONS))
+
+
+def dump(game):
+    """Encode the full state of a GameEngine or SurvivalGame to bytes"""
+    flags = (FLAG_GAME_OVER if game.game_over else 0) | (FLAG_WON if game.won else 0)
+    ending = ENDINGS.index(game.ending_type) if game.ending_type in ENDINGS else -1
+    header = HEADER.pack(MAGIC, VERSION, game.seed, game.day, game.health, game.hunger,
+                         game.poison_counter, game.available_gold,
+                         LOCATIONS.index(game.location), ending, flags)
+    w = Writer()
+    w.str(game.player_name)
+    lengths = []
+    for _, encode, _, _ in SECTIONS:
+        start = len(w.buf)
+        encode(game, w)
+        lengths.append(len(w.buf) - start)
+    return header + SECTION_TABLE.pack(*lengths) + bytes(w.buf)
+
+class Snapshot:
+    """Decoded view of a snapshot. Scalars are read up front; sections decode on first access."""
+    def __init__(self, data):
+        self.data = memoryview(data)
+        (magic, version, self.seed, self.day, self.health, self.hunger, self.poison_counter,
+         self.available_gold, location, ending, flags) = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a game snapshot")
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        self.location = LOCATIONS[location]
+        self.ending_type = ENDINGS[ending] if ending >= 0 else None
+        self.game_over = bool(flags & FLAG_GAME_OVER)
+        self.won = bool(flags & FLAG_WON)
+
+        lengths = SECTION_TABLE.unpack_from(self.data, HEADER.size)
+        r = Reader(self.data, HEADER.size + SECTION_TABLE.size)
+        self.player_name = r.str()
+        self.offsets = {}
+        pos = r.pos
+        for (name, _, _, _), length in zip(SECTIONS, lengths):
+            self.offsets[name] = pos
+            pos += length
+        self.decoded = {}
+
+    def section(self, name):
+        if name not in self.decoded:
+            decode = next(decode for section, _, decode, _ in SECTIONS if section == name)
+            self.decoded[name] = decode(Reader(self.data, self.offsets[name]))
+        return self.decoded[name]
+
+    def restore(self, game):
+        """Overwrite ``game`` with the snapshot's state"""
+        game.seed = self.seed
+        game.player_name = self.player_name
+        game.day = self.day
+        game.health = self.health
+        game.hunger = self.hunger
+        game.poison_counter = self.poison_counter
+        game.available_gold = self.available_gold
+        game.location = self.location
+        game.ending_type = self.ending_type
+        game.game_over = self.game_over
+        game.won = self.won
+        tracker = getattr(game, "quest_tracker", None)
+        if tracker is not None:
+            # Restoring items and flags must not count as collecting them
+            tracker.muted = True
+        for name, _, _, apply in SECTIONS:
+            apply(game, self.section(name))
+        if tracker is not None:
+            tracker.muted = False
+            tracker.shared = False  # The quest records are freshly decoded
+            tracker.rebuild()
+        if hasattr(game, "sampler_tables"):
+            game.forget_tables()  # Flags, eggs, items and workers were replaced wholesale
+        return game
+
+def load(data, game):
+    """Restore bytes produced by dump() into ``game``"""
+    return Snapshot(data).restore(game)
+
+def save_file(game, path):
+    with open(path, "wb") as f:
+        f.write(dump(game))
+
+def load_file(path, game):
+    with open(path, "rb") as f:
+        return load(f.read(), game)
@@ -0,0 +1,537 @@
+"""Exact rescue odds for an abstracted game, solved by backward induction.
+
+The abstract state is the day, health and hunger (in steps of STEP),
+location, the story flags in FLAGS, days of illness left, poison (in steps
+of POISON_STEP), food rations and raw meat. Event odds come straight from
+the roll bands in events.py: each location's CascadeSampler gives the
+weight of every event for the flags and items at hand, and the event
+effects are read from the same specs the engine runs. Every action ends
+the day, so the values are solved one day at a time from the last day
+back to day 1, each day as NumPy passes over the whole state grid.
+
+The saved table holds, for every day and state, the odds of being rescued
+from the moment the day's action has resolved; odds at the menu or at an
+event choice are one lookahead over it.
+
+Left out: gold, hired workers, crafting, Easter eggs and quest rewards.
+All food counts as one kind of ration (-15 hunger, +5 health), and the
+villagers' warm_bed comes with the met_villagers flag. Stat changes that
+fall between grid steps are split across the two neighbouring steps.
+
+    python solver.py build                       # solve and write solver_table.npz
+    python solver.py odds --day 5 --health 40 --location river --flags know_rescue
+    python simulate.py --policy solver:solver_policy -n 10000
+"""
+import argparse
+import os
+import time
+from collections import namedtuple
+from functools import lru_cache, reduce
+
+import numpy as np
+
+import events
+from engine import LOCATIONS, TRAVEL_MAP
+from inventory import is_food
+
+STEP = 10
+LEVELS = 100 // STEP + 1
+POISON_STEP = 10
+POISON_LEVELS = 5  # 0..40
+FLAGS = ("know_rescue", "met_hermit", "met_villagers", "cabin_explored")
+FLAG_BITS = {name: 1 << i for i, name in enumerate(FLAGS)}
+WARMTH_FLAG = "met_villagers"  # Meeting the villagers is the only way to get their warm_bed
+MAX_FOOD = 3
+MAX_RAW = 1
+ILLNESS_DAY = 3
+ILLNESS_DAYS = 2
+STARVING = 90
+RESCUE_DAY = 7
+LAST_DAY = 8
+VILLAGE = LOCATIONS.index("village")
+SHAPE = (LEVELS, LEVELS, len(LOCATIONS), 1 << len(FLAGS), ILLNESS_DAYS + 1, POISON_LEVELS, MAX_FOOD + 1, MAX_RAW + 1)
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solver_table.npz")
+
+# Menu actions of the abstract game -> engine menu key
+ACTIONS = {"explore": "1", "rest": "2", "forage": "3", "wait": "4", "eat": "9", "eat_raw": "9"}
+ACTIONS.update({"travel:" + location: "7" for location in LOCATIONS})
+TRAVEL_KEYS = {location: key for key, location in TRAVEL_MAP.items()}
+
+SPECS = {spec["id"]: spec for spec in events.EVENTS}
+IGNORED_EFFECTS = {"say", "egg", "rep", "gold", "hunter_loyalty"}
+
+# What one outcome does to the state; location and sick are None when unchanged
+Change = namedtuple("Change", "health hunger food raw flags location poison sick")
+NO_CHANGE = Change(0, 0, 0, 0, 0, None, 0, None)
+# Everything the event tables can branch on
+Context = namedtuple("Context", "location flags food raw can_fall_ill")
+
+# Hard-coded outcomes of the engine's menu and secret events
+REST = Change(10, 5, 0, 0, 0, None, 0, None)
+FORAGE = Change(0, 0, 1, 0, 0, None, 0, None)
+FORAGE_ODDS = 0.4
+EAT = Change(5, -15, -1, 0, 0, None, 0, None)
+EAT_RAW = Change(-5, -20, 0, -1, 0, None, 0, None)
+RAW_POISON = range(15, 36)
+ILLNESS = Change(-20, 15, 0, 0, 0, None, 0, ILLNESS_DAYS)
+ILLNESS_ODDS = 0.39  # rng.randint(1, 100) < 40
+ILLNESS_TICK = 5
+HUNGER_PER_DAY = range(5, 16)
+COLD_PER_NIGHT = range(1, 6)
+
+
+# --- Abstract interpretation of the event specs ---
+# Outcome trees are nested tuples: ("leaf", change), ("chance", ((p, node), ...))
+# for rolls and ("choice", (node, ...)) for decisions the player makes
+
+def _holds(condition, ctx):
+    name, *args = condition
+    if name == "any":
+        return any(_holds(c, ctx) for c in args)
+    if name == "hired":
+        return False
+    base = name[4:] if name.startswith("not_") else name
+    if base == "flag":
+        value = bool(ctx.flags & FLAG_BITS.get(args[0], 0))
+    elif base == "has":
+        value = ctx.raw if args[0] == "raw_meat" else ctx.food if is_food(args[0]) else False
+    elif base == "egg":
+        value = False
+    else:
+        raise ValueError(f"Condition {name} is not modelled")
+    return not value if name.startswith("not_") else value
+
+def _with_item(change, item, n):
+    if item == "raw_meat":
+        return change._replace(raw=change.raw + n)
+    if is_food(item):
+        return change._replace(food=change.food + n)
+    return change
+
+def _outcomes(effects, ctx, p=1.0, change=NO_CHANGE):
+    """Abstract outcomes of an effect list, as [(probability, Change)]"""
+    outcomes = [(p, change)]
+    for name, *args in effects or ():
+        outcomes = [o for q, c in outcomes for o in _effect(name, args, ctx, q, c)]
+    return outcomes
+
+def _effect(name, args, ctx, p, change):
+    if name == "stats":
+        return [(p, change._replace(health=change.health + args[0], hunger=change.hunger + args[1]))]
+    if name == "add_item":
+        return [(p, _with_item(change, args[0], 1))]
+    if name == "remove_item":
+        return [(p, _with_item(change, args[0], -1))]
+    if name == "flag":
+        return [(p, change._replace(flags=change.flags | FLAG_BITS.get(args[0], 0)))]
+    if name == "location":
+        return [(p, change._replace(location=LOCATIONS.index(args[0])))]
+    if name == "chance":
+        threshold, then, otherwise = args
+        odds = (100 - threshold) / 100  # rng.randint(1, 100) > threshold
+        return (_outcomes(then, ctx, p * odds, change) if odds else []) + \
+               (_outcomes(otherwise, ctx, p * (1 - odds), change) if odds < 1 else [])
+    if name == "if":
+        condition, then, otherwise = args
+        return _outcomes(then if _holds(condition, ctx) else otherwise, ctx, p, change)
+    if name in IGNORED_EFFECTS:
+        return [(p, change)]
+    raise ValueError(f"Effect {name} is not modelled")
+
+def _chance(outcomes):
+    if len(outcomes) == 1:
+        return ("leaf", outcomes[0][1])
+    return ("chance", tuple((p, ("leaf", c)) for p, c in outcomes))
+
+def _choice_nodes(event_id, ctx, change=NO_CHANGE):
+    """One outcome tree per option of an event, in option order"""
+    spec = SPECS[event_id]
+    return tuple(_chance(_outcomes(effects if effects is not None else spec.get("default"), ctx, 1.0, change))
+                 for _, effects in spec["choices"])
+
+def _event_node(event_id, ctx, change):
+    spec = SPECS[event_id]
+    outcomes = _outcomes(spec.get("effects"), ctx, 1.0, change)
+    if not spec.get("choices"):
+        return _chance(outcomes)
+    return ("chance", tuple((p, ("choice", _choice_nodes(event_id, ctx, c))) for p, c in outcomes))
+
+def _draw_node(location, ctx, change=NO_CHANGE):
+    """The location's event roll, weighted by its CascadeSampler bands"""
+    sampler = events.TABLES[location].sampler
+    eligible = tuple(all(_holds(c, ctx) for c in SPECS[event.id].get("requires", ()))
+                     for _, event, condition in sampler.bands if condition is not None)
+    weights = sampler.weights(eligible)
+    before = _outcomes(events.LOCATIONS[location].get("before"), ctx, 1.0, change)
+    return ("chance", tuple((q * n / sampler.roll, _event_node(event.id, ctx, c))
+                            for q, c in before for event, n in weights.items()))
+
+def _secret_node(ctx):
+    """check_secret_events: the day-3 illness roll, otherwise the hermit's cave"""
+    hermit = _draw_node("hermit_cave", ctx)
+    if not ctx.can_fall_ill:
+        return hermit
+    return ("chance", ((ILLNESS_ODDS, ("leaf", ILLNESS)), (1 - ILLNESS_ODDS, hermit)))
+
+@lru_cache(maxsize=None)
+def action_node(action, ctx):
+    """Outcome tree of a menu action, up to the end of the day's action"""
+    if action == "explore":
+        if LOCATIONS[ctx.location] == "hermit_cave":
+            return _secret_node(ctx)
+        return _draw_node(LOCATIONS[ctx.location], ctx)
+    if action == "rest":
+        return ("leaf", REST)
+    if action == "forage":
+        return ("chance", ((FORAGE_ODDS, ("leaf", FORAGE)), (1 - FORAGE_ODDS, ("leaf", NO_CHANGE))))
+    if action == "eat":
+        return ("leaf", EAT if ctx.food else NO_CHANGE)
+    if action == "eat_raw":
+        if not ctx.raw:
+            return ("leaf", NO_CHANGE)
+        levels = {}
+        for amount in RAW_POISON:
+            low, rest = divmod(amount, POISON_STEP)
+            levels[low] = levels.get(low, 0) + (1 - rest / POISON_STEP) / len(RAW_POISON)
+            levels[low + 1] = levels.get(low + 1, 0) + rest / POISON_STEP / len(RAW_POISON)
+        return ("chance", tuple((p, ("leaf", EAT_RAW._replace(poison=k))) for k, p in levels.items() if p))
+    if action.startswith("travel:"):
+        return ("leaf", NO_CHANGE._replace(location=LOCATIONS.index(action[len("travel:"):])))
+    return ("leaf", NO_CHANGE)
+
+@lru_cache(maxsize=None)
+def menu_nodes(ctx):
+    return tuple(action_node(action, ctx) for action in ACTIONS)
+
+@lru_cache(maxsize=None)
+def turn_node(ctx):
+    """Outcome tree of the start of a turn, up to the menu"""
+    return _secret_node(ctx)
+
+def evaluate(node, leaf):
+    """Expected value of an outcome tree, with ``leaf(change)`` valuing each outcome"""
+    kind, body = node
+    if kind == "leaf":
+        return leaf(body)
+    if kind == "chance":
+        return sum(p * evaluate(child, leaf) for p, child in body)
+    return reduce(np.maximum, (evaluate(child, leaf) for child in body))
+
+
+# --- Solving over the whole grid ---
+
+def _spread(values, axis, deltas):
+    """Expected values after adding a delta drawn uniformly from ``deltas`` along a stat axis"""
+    weights = {}
+    for delta in deltas:
+        steps, rest = divmod(delta, STEP)
+        weights[steps] = weights.get(steps, 0) + (1 - rest / STEP) / len(deltas)
+        if rest:
+            weights[steps + 1] = weights.get(steps + 1, 0) + rest / STEP / len(deltas)
+    index = np.arange(LEVELS)
+    out = None
+    for steps, weight in weights.items():
+        term = np.take(values, np.clip(index + steps, 0, LEVELS - 1), axis=axis)
+        if weight != 1:
+            term = term * np.float32(weight)
+        out = term if out is None else out + term
+    return out
+
+def _axis_index(index):
+    """A slice when ``index`` is a run of consecutive positions, else the array itself"""
+    if len(index) == 1 or (np.diff(index) == 1).all():
+        return slice(int(index[0]), int(index[-1]) + 1)
+    return index
+
+def _gather(values, location, indices):
+    """values[:, :, location, *indices] with one index per remaining axis, slicing before any copies"""
+    indices = [_axis_index(np.asarray(index)) for index in indices]
+    value = values[(slice(None), slice(None), location) +
+                   tuple(i if isinstance(i, slice) else slice(None) for i in indices)]
+    for axis, index in enumerate(indices, 2):
+        if not isinstance(index, slice):
+            value = np.take(value, index, axis=axis)
+    return value
+
+def _grid_leaf(values, location, flags, sick, food, raw):
+    """Leaf valuation for one slice of the grid; identical changes are looked up once"""
+    poison = np.arange(POISON_LEVELS)
+    cache = {}
+
+    def leaf(change):
+        value = cache.get(change)
+        if value is None:
+            value = _gather(values, location if change.location is None else change.location, (
+                flags | change.flags,
+                sick if change.sick is None else [change.sick],
+                np.clip(poison + change.poison, 0, POISON_LEVELS - 1),
+                np.clip(food + change.food, 0, MAX_FOOD),
+                np.clip(raw + change.raw, 0, MAX_RAW),
+            ))
+            if change.health:
+                value = _spread(value, 0, (change.health,))
+            if change.hunger:
+                value = _spread(value, 1, (change.hunger,))
+            cache[change] = value
+        return value
+    return leaf
+
+def _slices(day, nodes):
+    """Split the grid into slices whose states share the outcome trees ``nodes(ctx)``"""
+    sick_splits = ([np.arange(1), np.arange(1, ILLNESS_DAYS + 1)] if day == ILLNESS_DAY
+                   else [np.arange(ILLNESS_DAYS + 1)])
+    for location in range(len(LOCATIONS)):
+        for sick in sick_splits:
+            for food in (np.arange(1), np.arange(1, MAX_FOOD + 1)):
+                for raw in (np.arange(1), np.arange(1, MAX_RAW + 1)):
+                    # Flags only matter through the conditions, so flags with identical trees share a slice
+                    groups = {}
+                    for flags in range(SHAPE[3]):
+                        trees = nodes(Context(location, flags, bool(food[0]), bool(raw[0]),
+                                              day == ILLNESS_DAY and not sick[0]))
+                        groups.setdefault(trees, []).append(flags)
+                    for trees, flags in groups.items():
+                        yield trees, location, np.array(flags), sick, food, raw
+
+def _best(values, day, nodes):
+    """Best expected value over the trees ``nodes(ctx)``, for every state of the grid"""
+    out = np.empty(SHAPE, np.float32)
+    poison = np.arange(POISON_LEVELS)
+    for trees, location, flags, sick, food, raw in _slices(day, nodes):
+        leaf = _grid_leaf(values, location, flags, sick, food, raw)
+        best = reduce(np.maximum, (evaluate(node, leaf) for node in trees))
+        out[(slice(None), slice(None), location) + np.ix_(flags, sick, poison, food, raw)] = best
+    return out
+
+def _dawn(values):
+    """Expected values at the next turn's start, taken over next_day's rolls"""
+    # next_day adds hunger, then the cold, then ticks effects, so expectations run in reverse
+    ticked = np.empty_like(values)
+    for sick in range(ILLNESS_DAYS + 1):
+        for level in range(POISON_LEVELS):
+            health = -(level * POISON_STEP // 2) - (ILLNESS_TICK if sick else 0)
+            hunger = ILLNESS_TICK if sick else 0
+            value = values[:, :, :, :, max(sick - 1, 0), max(level - 1, 0)]
+            if health:
+                value = _spread(value, 0, (health,))
+            if hunger:
+                value = _spread(value, 1, (hunger,))
+            ticked[:, :, :, :, sick, level] = value
+    warm = (np.arange(SHAPE[3]) & FLAG_BITS[WARMTH_FLAG]).astype(bool)
+    cold = _spread(ticked, 0, [-d for d in COLD_PER_NIGHT])
+    ticked = np.where(warm[None, None, None, :, None, None, None, None], ticked, cold)
+    return _spread(ticked, 1, HUNGER_PER_DAY)
+
+def _end_of_day(day, next_turn):
+    """Odds right after the day's action: check_end_conditions, then dawn and the next turn"""
+    values = _dawn(next_turn) if day < LAST_DAY else np.zeros(SHAPE, np.float32)
+    if day >= RESCUE_DAY:
+        rescue = (np.arange(SHAPE[3]) & FLAG_BITS["know_rescue"]).astype(bool)
+        values[:, :, VILLAGE, rescue] = 1
+    values[0] = 0
+    values[:, STARVING // STEP:] = 0
+    return values
+
+def solve():
+    """Odds after each day's action, as an array indexed [day - 1, *state]"""
+    after = np.empty((LAST_DAY,) + SHAPE, np.float32)
+    next_turn = None
+    for day in range(LAST_DAY, 0, -1):
+        after[day - 1] = _end_of_day(day, next_turn)
+        menu = _best(after[day - 1], day, menu_nodes)
+        next_turn = _best(menu, day, lambda ctx: (turn_node(ctx),))
+    return after
+
+
+# --- Looking up single states ---
+
+def _split(value, step, top):
+    """Neighbouring grid steps of ``value`` with their weights"""
+    value = min(max(value, 0), (top - 1) * step) / step
+    low = int(value)
+    rest = value - low
+    return [(low, 1 - rest), (low + 1, rest)] if rest else [(low, 1.0)]
+
+class State:
+    """One game's position in the abstract state space"""
+    def __init__(self, day, health, hunger, location, flags, sick=0, poison=0, food=0, raw=0, can_fall_ill=None):
+        self.day = day
+        self.health = health
+        self.hunger = hunger
+        self.location = location
+        self.flags = flags
+        self.sick = sick
+        self.poison = poison
+        self.food = min(food, MAX_FOOD)
+        self.raw = min(raw, MAX_RAW)
+        self.can_fall_ill = day == ILLNESS_DAY and sick == 0 if can_fall_ill is None else can_fall_ill
+
+    @classmethod
+    def of(cls, game):
+        illness = game.effects.active.get("illness")
+        food = game.inventory.category("food")
+        return cls(game.day, game.health, game.hunger, LOCATIONS.index(game.location),
+                   sum(bit for name, bit in FLAG_BITS.items() if name in game.events_triggered),
+                   illness.expires - illness.due + 1 if illness and illness.expires is not None else 0,
+                   game.poison_counter, sum(item != "raw_meat" for item in food),
+                   game.inventory.count("raw_meat"),
+                   game.day == ILLNESS_DAY and "secret_illness" not in game.events_triggered)
+
+    def context(self):
+        return Context(self.location, self.flags, self.food > 0, self.raw > 0, self.can_fall_ill)
+
+    def changed(self, change):
+        return State(self.day, max(0, min(100, self.health + change.health)),
+                     max(0, min(100, self.hunger + change.hunger)),
+                     self.location if change.location is None else change.location,
+                     self.flags | change.flags, self.sick if change.sick is None else change.sick,
+                     self.poison + change.poison * POISON_STEP,
+                     max(0, self.food + change.food), max(0, self.raw + change.raw),
+                     self.can_fall_ill and change.sick is None)
+
+    def lookup(self, values):
+        """Value of this state in a grid, split across neighbouring steps"""
+        total = 0.0
+        for h, wh in _split(self.health, STEP, LEVELS):
+            for g, wg in _split(self.hunger, STEP, LEVELS):
+                for p, wp in _split(self.poison, POISON_STEP, POISON_LEVELS):
+                    total += wh * wg * wp * float(values[h, g, self.location, self.flags, self.sick, p,
+                                                         self.food, self.raw])
+        return total
+
+class OddsTable:
+    """Solved odds, queried for live games"""
+    def __init__(self, after):
+        self.after = after
+
+    @classmethod
+    def build(cls):
+        return cls(solve())
+
+    @classmethod
+    def load(cls, path=TABLE_FILE):
+        with np.load(path) as data:
+            if tuple(data["shape"]) != SHAPE or int(data["step"]) != STEP:
+                raise ValueError(f"{path} was built for another state grid; rebuild it with: python solver.py build")
+            return cls(data["after"].astype(np.float32) / 65535)
+
+    def save(self, path=TABLE_FILE):
+        np.savez_compressed(path, after=np.round(self.after * 65535).astype(np.uint16),
+                            shape=np.array(SHAPE), step=STEP)
+
+    def action_values(self, state):
+        """Odds of each menu action at ``state``"""
+        values = self.after[state.day - 1]
+        ctx = state.context()
+        return {action: evaluate(action_node(action, ctx), lambda c: state.changed(c).lookup(values))
+                for action in ACTIONS}
+
+    def menu_value(self, state):
+        return max(self.action_values(state).values())
+
+    def choice_values(self, state, event_id, prompt="event"):
+        """Odds of each option of a pending event; turn events lead back to the menu"""
+        if prompt == "turn_event":
+            leaf = lambda c: self.menu_value(state.changed(c))
+        else:
+            leaf = lambda c: state.changed(c).lookup(self.after[state.day - 1])
+        return [evaluate(node, leaf) for node in _choice_nodes(event_id, state.context())]
+
+    def prompt_values(self, state, prompt):
+        """Odds of the abstract actions still open at ``prompt``.
+
+        Past the menu the day's action is already spent, so backing out of
+        a submenu (hiring, crafting, cancelling) counts as waiting.
+        """
+        values = self.action_values(state)
+        if prompt == "menu":
+            return values
+        if prompt == "travel":
+            return {action: value for action, value in values.items() if action.startswith("travel:")}
+        if prompt == "eat":
+            return {action: values[action] for action in ("eat", "eat_raw", "wait")}
+        return {"wait": values["wait"]}
+
+    def odds(self, game):
+        """Odds of rescue from the game's pending prompt, playing on at the solved best"""
+        if game.game_over:
+            return 1.0 if game.won else 0.0
+        state = State.of(game)
+        if game.prompt in ("event", "turn_event"):
+            return max(self.choice_values(state, game.context, game.prompt))
+        return max(self.prompt_values(state, game.prompt).values())
+
+    def choose(self, game, outcome):
+        """The engine action with the best odds at the pending prompt"""
+        prompt = outcome.prompt
+        state = State.of(game)
+        if prompt in ("event", "turn_event"):
+            values = self.choice_values(state, game.context, prompt)
+            return str(values.index(max(values)) + 1)
+        values = self.prompt_values(state, prompt)
+        best = max(values, key=values.get)
+        if prompt == "menu":
+            return ACTIONS[best]
+        if prompt == "travel":
+            return TRAVEL_KEYS[best[len("travel:"):]]
+        if best in ("eat", "eat_raw"):
+            for key, item in outcome.options[:-1]:
+                if (item == "raw_meat") == (best == "eat_raw"):
+                    return key
+        return outcome.options[-1][0]
+
+
+_table = None
+
+def table(path=TABLE_FILE):
+    """The shared odds table, loaded from ``path`` or solved if it is missing"""
+    global _table
+    if _table is None:
+        _table = OddsTable.load(path) if os.path.exists(path) else OddsTable.build()
+    return _table
+
+def solver_policy(engine, outcome, rng):
+    """Take the option with the best solved odds (use as --policy solver:solver_policy)"""
+    return table().choose(engine, outcome)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve the abstract game for exact rescue odds")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = commands.add_parser("build", help="solve every state and write the odds table")
+    build_cmd.add_argument("-o", "--output", default=TABLE_FILE)
+
+    odds_cmd = commands.add_parser("odds", help="odds and best action for one state at the menu")
+    odds_cmd.add_argument("-f", "--table", default=TABLE_FILE)
+    odds_cmd.add_argument("--day", type=int, default=1)
+    odds_cmd.add_argument("--health", type=int, default=100)
+    odds_cmd.add_argument("--hunger", type=int, default=50)
+    odds_cmd.add_argument("--location", default="forest", choices=LOCATIONS)
+    odds_cmd.add_argument("--flags", default="", help=f"comma-separated, from: {', '.join(FLAGS)}")
+    odds_cmd.add_argument("--sick", type=int, default=0, help="days of illness left")
+    odds_cmd.add_argument("--poison", type=int, default=0)
+    odds_cmd.add_argument("--food", type=int, default=0)
+    odds_cmd.add_argument("--raw", type=int, default=0)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        started = time.perf_counter()
+        odds = OddsTable.build()
+        elapsed = time.perf_counter() - started
+        odds.save(args.output)
+        print(f"Solved {odds.after.size:,} states in {elapsed:.2f}s -> {args.output} "
+              f"({os.path.getsize(args.output) / 1e6:.1f} MB)")
+        return
+
+    flags = sum(FLAG_BITS[name] for name in args.flags.split(",") if name)
+    state = State(args.day, args.health, args.hunger, LOCATIONS.index(args.location), flags,
+                  args.sick, args.poison, args.food, args.raw)
+    values = table(args.table).action_values(state)
+    for action, value in sorted(values.items(), key=lambda item: -item[1]):
+        print(f"{action:<20} {value:8.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Timed status effects (poison, illness, warmth, food buffs).
+
+Effects that tick are kept in a heap keyed by the day they are next due,
+so a day's tick only touches the effects that fire that day. Each tick
+function applies one tick and returns False once the effect has worn
+off; an effect also ends after its last scheduled day (``expires``).
+Effects without a tick function (warmth) are plain on/off flags.
+"""
+import heapq
+from itertools import count
+
+
+class Effect:
+    """One active effect: strength, next due day and last day (None = until it wears off)"""
+    __slots__ = ("name", "level", "due", "expires")
+
+    def __init__(self, name, level, due, expires=None):
+        self.name = name
+        self.level = level
+        self.due = due
+        self.expires = expires
+
+
+# --- Tick functions: fn(game, effect) -> False when the effect has worn off ---
+
+def _tick_poison(game, effect):
+    damage = int(effect.level * 0.5)
+    game.modify_stats(health=-damage)
+    effect.level = max(0, effect.level - 10)
+    if damage > 0:
+        game.say(f"⚠ Poison damage: {damage} health lost. Poison level: {effect.level}%")
+    return effect.level > 0
+
+def _tick_illness(game, effect):
+    game.modify_stats(health=-effect.level, hunger=effect.level)
+    game.say(f"⚠ The fever lingers. You lose {effect.level} health.")
+    return True
+
+def _tick_well_fed(game, effect):
+    game.modify_stats(health=effect.level)
+    game.say(f"A good meal keeps you going. (+{effect.level} health)")
+    return True
+
+TICKS = {
+    "poison": _tick_poison,
+    "illness": _tick_illness,
+    "well_fed": _tick_well_fed,
+}
+# Items that grant an effect for as long as they are held
+ITEM_EFFECTS = {"warm_bed": "warmth"}
+
+
+class StatusEffects:
+    """Active effects plus a heap of (due day, order, effect) for the ones that tick daily"""
+    def __init__(self):
+        self.active = {}
+        self.queue = []
+        self._order = count()
+
+    def add(self, name, level=0, start=None, duration=None):
+        """Start ``name`` (first tick on day ``start``), or stack ``level`` onto it if already active"""
+        effect = self.active.get(name)
+        expires = None if duration is None or start is None else start + duration - 1
+        if effect is not None:
+            effect.level += level
+            if expires is not None and effect.expires is not None:
+                effect.expires = max(effect.expires, expires)
+            return effect
+        effect = self.active[name] = Effect(name, level, start, expires)
+        if name in TICKS:
+            heapq.heappush(self.queue, (start, next(self._order), effect))
+        return effect
+
+    def restore(self, name, level, due, expires):
+        """Re-create a saved effect exactly, e.g. when loading a snapshot"""
+        effect = self.active[name] = Effect(name, level, due, expires)
+        if name in TICKS:
+            heapq.heappush(self.queue, (due, next(self._order), effect))
+        return effect
+
+    def clear(self):
+        self.active.clear()
+        self.queue.clear()
+
+    def remove(self, name):
+        # Its heap entry goes stale and is skipped when it comes due
+        return self.active.pop(name, None)
+
+    def has(self, name):
+        return name in self.active
+
+    def level(self, name):
+        effect = self.active.get(name)
+        return effect.level if effect else 0
+
+    def set_level(self, name, level, start):
+        if level <= 0:
+            self.remove(name)
+        elif name in self.active:
+            self.active[name].level = level
+        else:
+            self.add(name, level, start)
+
+    def tick(self, game, day):
+        """Apply every effect due on or before ``day``; each effect ticks at most once per day"""
+        queue = self.queue
+        while queue and queue[0][0] <= day:
+            due, _, effect = heapq.heappop(queue)
+            if self.active.get(effect.name) is not effect:
+                continue
+            keep = TICKS[effect.name](game, effect)
+            next_due = max(due, day) + 1
+            if keep and (effect.expires is None or next_due <= effect.expires):
+                effect.due = next_due
+                heapq.heappush(queue, (effect.due, next(self._order), effect))
+            else:
+                del self.active[effect.name]
+
+    def watch(self, inventory):
+        """Keep item-granted effects (ITEM_EFFECTS) in step with ``inventory``"""
+        inventory.listeners.append(self.on_item_change)
+        for item in ITEM_EFFECTS:
+            self.on_item_change(item, inventory.count(item))
+
+    def on_item_change(self, item, count):
+        name = ITEM_EFFECTS.get(item)
+        if name is None:
+            return
+        if count > 0:
+            self.add(name)
+        else:
+            self.remove(name)
+
+    def copy(self, inventory):
+        """Independent copy that watches ``inventory``; ticks stay in the same order as here"""
+        other = StatusEffects()
+        copies = {id(effect): Effect(effect.name, effect.level, effect.due, effect.expires)
+                  for effect in self.active.values()}
+        other.active = {name: copies[id(effect)] for name, effect in self.active.items()}
+        # Stale entries (effects removed or replaced since) are dropped along the way
+        other.queue = [(due, order, copies[id(effect)]) for due, order, effect in self.queue
+                       if self.active.get(effect.name) is effect]
+        heapq.heapify(other.queue)
+        other._order = count(next(self._order))
+        inventory.listeners.append(other.on_item_change)
+        return other
+
+    def __iter__(self):
+        return iter(list(self.active.values()))
+
+    def __len__(self):
+        return len(self.active)
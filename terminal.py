@@ -0,0 +1,50 @@
+"""Buffered terminal output for the text game.
+
+Everything the game shows goes into a buffer that reaches the terminal in
+one write, when the game is about to wait for input. On a TTY, clearing
+the screen drops whatever is still buffered and puts an ANSI clear at the
+front of the next write, so no shell is spawned. When the output is not a
+TTY (a pipe, a file, scripted.py's sinks) clears do nothing, so captured
+output is plain text with nothing lost.
+
+    screen = Screen()
+    screen.clear()
+    screen.write("DAY 1\\n")
+    screen.flush()
+"""
+import sys
+
+CLEAR = "\x1b[H\x1b[2J\x1b[3J"  # Cursor home, clear the screen, drop the scrollback
+
+
+class Screen:
+    """Text buffered until flush(), written to ``stream`` (default: sys.stdout at flush time)"""
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.parts = []
+        self.flushes = 0
+
+    def target(self):
+        return sys.stdout if self.stream is None else self.stream
+
+    def is_tty(self):
+        isatty = getattr(self.target(), "isatty", None)
+        return bool(isatty and isatty())
+
+    def write(self, text):
+        self.parts.append(text)
+
+    def clear(self):
+        """Clear the screen on the next flush; on a TTY, text not flushed yet is never shown"""
+        if self.is_tty():
+            self.parts = [CLEAR]
+
+    def flush(self):
+        """Send everything buffered in a single write"""
+        if not self.parts:
+            return
+        stream = self.target()
+        stream.write("".join(self.parts))
+        stream.flush()
+        self.parts = []
+        self.flushes += 1
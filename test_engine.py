@@ -0,0 +1,115 @@
+"""Fidelity checks for the headless engine: replay, snapshots, fork and undo.
+
+    python -m pytest -q
+"""
+import random
+
+import pytest
+
+import snapshot
+from engine import GameEngine
+from history import History
+from replay import Recording, verify
+from simulate import cautious_policy, random_policy
+
+# A cautious-policy game; bump replay.FORMAT_VERSION and re-record it when a rules change alters replays
+GOLDEN = '{"v":6,"seed":7,"name":"Bot","actions":["1","7","3","1","1","1","1","1","1","1"],"hash":"c481b54e199ffccd"}'
+SEEDS = range(40)
+
+
+def play(seed, policy=random_policy, steps=None):
+    """A game played by ``policy`` until it ends, or for ``steps`` actions; returns (engine, policy rng)"""
+    rng = random.Random(seed)
+    engine = GameEngine(seed=seed)
+    outcome = engine.start("Bot")
+    while not outcome.game_over and (steps is None or len(engine.actions) < steps):
+        outcome = engine.step(policy(engine, outcome, rng))
+    return engine, rng
+
+def finish(engine, rng, policy=random_policy):
+    """Play ``engine`` to the end; returns the actions taken"""
+    actions = []
+    outcome = engine.outcome()
+    while not outcome.game_over:
+        action = policy(engine, outcome, rng)
+        actions.append(action)
+        outcome = engine.step(action)
+    return actions
+
+def replay_actions(engine, actions):
+    """Step ``engine`` through ``actions``; returns the messages of every step"""
+    return [engine.step(action).messages for action in actions]
+
+
+def test_golden_recording_replays():
+    recording = Recording.from_line(GOLDEN)
+    assert verify(recording)
+
+@pytest.mark.parametrize("policy", [random_policy, cautious_policy])
+def test_recordings_replay_to_their_hash(policy):
+    for seed in SEEDS:
+        engine, _ = play(seed, policy)
+        assert engine.game_over
+        recording = Recording.from_line(Recording.from_engine(engine).to_line())
+        assert verify(recording), seed
+
+def test_snapshot_round_trip():
+    for seed in SEEDS:
+        engine, rng = play(seed, steps=seed % 8)
+        if engine.game_over:
+            continue
+        loaded = snapshot.load(snapshot.dump(engine), GameEngine())
+        assert loaded.state_hash() == engine.state_hash(), seed
+        assert loaded.rng.getstate() == engine.rng.getstate(), seed
+        actions = finish(engine, rng)
+        replay_actions(loaded, actions)
+        assert loaded.state_hash() == engine.state_hash(), seed
+
+def test_fork_replays_like_its_parent():
+    for seed in SEEDS:
+        engine, rng = play(seed, steps=seed % 8)
+        if engine.game_over:
+            continue
+        fork = engine.fork()
+        forked_at = fork.state_hash()
+        state = engine.rng.getstate()
+        actions = finish(engine, rng)
+        assert fork.state_hash() == forked_at, seed  # The parent's moves do not leak into the fork
+        assert fork.rng.getstate() == state, seed
+        messages = replay_actions(fork, actions)
+        assert fork.state_hash() == engine.state_hash(), seed
+        assert messages, seed
+
+def test_undo_redo_round_trip():
+    for seed in SEEDS:
+        rng = random.Random(seed)
+        engine = GameEngine(seed=seed)
+        outcome = engine.start("Bot")
+        history = History(engine)
+        hashes = [engine.state_hash()]
+        actions = []
+        while not outcome.game_over:
+            action = random_policy(engine, outcome, rng)
+            actions.append(action)
+            with history.track(action):
+                outcome = engine.step(action)
+            hashes.append(engine.state_hash())
+        final_rng = engine.rng.getstate()
+
+        for expected in reversed(hashes[:-1]):
+            assert history.undo() == 1, seed
+            assert engine.state_hash() == expected, seed
+        assert history.undo() == 0
+        assert engine.actions == []
+        for expected in hashes[1:]:
+            assert history.redo() == 1, seed
+            assert engine.state_hash() == expected, seed
+        assert engine.rng.getstate() == final_rng, seed
+
+        # Undoing and making the same choices again reproduces the same rolls
+        history.undo(len(actions))
+        for action in actions:
+            with history.track(action):
+                engine.step(action)
+        assert engine.state_hash() == hashes[-1], seed
+        assert engine.actions == actions, seed
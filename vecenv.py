@@ -0,0 +1,235 @@
+"""Gym-style vectorized environment: K headless games stepped in lockstep.
+
+``reset(seeds)`` starts every game and ``step(actions)`` takes one action
+index per game. The action space is fixed (ACTIONS): the day's menu as
+whole actions (explore, rest, forage, shelter, craft:<recipe>,
+move:<location>, hire:<role>, eat:<food>, wait), each of which walks
+every submenu it needs, plus choice:<i> for the options of story events.
+Observations, the legal-action mask, rewards and done flags live in
+buffers allocated once by the constructor; step() overwrites them in
+place and returns the same arrays every time.
+
+Games that end are reset at once with the next seed from the env's RNG:
+the done flag and reward belong to the finished game, the observation
+to the new one, and ``endings`` keeps the ENDINGS index the game ended
+with.
+
+    python vecenv.py -k 64 -n 100000      # random legal actions, reports env steps/s
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+import events
+from clock import HOURS_PER_DAY
+from crafting import RECIPES, USED_IN
+from engine import (CRAFT_MAP, ENDINGS, HIRE_COSTS, HIRE_MAP, LOCATIONS, MENU_WITHOUT_WAIT, TRAVEL_MAP,
+                    GameEngine)
+from inventory import is_food
+from workers import ROLES
+
+# Every item the game hands out, then anything else the recipes mention
+ITEMS = tuple(dict.fromkeys([
+    "berries", "foraged_berries", "canned_food", "cooked_meat", "fresh_fish", "fresh_food",
+    "hermit_bread", "raw_meat", "travelers_ration", "venison",
+    "clay", "dry_wood", "flint", "herbs", "honey", "leather", "shelter_materials", "fresh_water",
+    "bow", "spear", "medicine", "rope", "fire_kit", "shelter", "map", "warm_bed",
+    "cave_treasure", "fire_knowledge", "gift_from_stranger", "glowing_water", "hermit_wisdom",
+    "john_journal", "mysterious_stone", "ruined_statue",
+] + list(RECIPES) + list(USED_IN)))
+FOODS = tuple(item for item in ITEMS if is_food(item))
+FLAGS = (
+    "know_rescue", "met_hermit", "met_villagers", "heard_of_hermit", "found_village_smoke",
+    "cabin_explored", "cabin_treasure", "ruins_explored", "found_treasure", "found_honey",
+    "caught_fish", "hunted_deer", "fed_bear", "fed_wolf", "secret_illness", "secret_visitor",
+)
+MAX_CHOICES = max(len(event.labels) for event in events.BY_ID.values())
+
+ACTIONS = (
+    ["explore", "rest", "forage", "shelter", "wait"]
+    + ["craft:" + recipe for recipe in CRAFT_MAP.values()]
+    + ["move:" + location for location in LOCATIONS]
+    + ["hire:" + role for role in HIRE_MAP.values()]
+    + ["eat:" + food for food in FOODS]
+    + [f"choice:{i}" for i in range(MAX_CHOICES)]
+)
+ACTION_INDEX = {name: i for i, name in enumerate(ACTIONS)}
+FIRST_CHOICE = ACTION_INDEX["choice:0"]
+
+MENU_KEYS = {"explore": "1", "rest": "2", "forage": "3", "shelter": "5", "wait": "10"}
+CRAFT_KEYS = {recipe: key for key, recipe in CRAFT_MAP.items()}
+TRAVEL_KEYS = {location: key for key, location in TRAVEL_MAP.items()}
+HIRE_KEYS = {role: key for key, role in HIRE_MAP.items()}
+
+# Observation layout: stats, location one-hot, item counts, flags, workers per role, then
+# whether the game waits at the menu (otherwise at an event choice)
+STATS = ("day", "health", "hunger", "poison", "gold", "hour")
+LOCATION_AT = len(STATS)
+ITEMS_AT = LOCATION_AT + len(LOCATIONS)
+FLAGS_AT = ITEMS_AT + len(ITEMS)
+ROSTER_AT = FLAGS_AT + len(FLAGS)
+MENU_AT = ROSTER_AT + len(ROLES) + 1  # Workers per role, then their average morale
+OBS_SIZE = MENU_AT + 1
+
+LOCATION_SLOT = {location: LOCATION_AT + i for i, location in enumerate(LOCATIONS)}
+ITEM_SLOT = {item: ITEMS_AT + i for i, item in enumerate(ITEMS)}
+FLAG_SLOT = {flag: FLAGS_AT + i for i, flag in enumerate(FLAGS)}
+ROLE_SLOT = {role: ROSTER_AT + i for i, role in enumerate(ROLES)}
+
+# Menu actions that are always legal (moving is, except to where you are; waiting is, until the helicopter
+# has been), then the conditional ones
+ALWAYS = np.array([name in MENU_KEYS and name != "shelter" or name.startswith("move:") for name in ACTIONS])
+SHELTER = ACTION_INDEX["shelter"]
+WAIT = ACTION_INDEX["wait"]
+CRAFT_ACTIONS = {recipe: ACTION_INDEX["craft:" + recipe] for recipe in CRAFT_MAP.values()}
+HIRE_ACTIONS = [(ACTION_INDEX["hire:" + role], HIRE_COSTS[role]) for role in HIRE_MAP.values()]
+EAT_ACTIONS = {food: ACTION_INDEX["eat:" + food] for food in FOODS}
+
+
+def run_action(game, name):
+    """Feed the engine the keys for one action; it ends back at the menu or an event choice"""
+    kind, _, arg = name.partition(":")
+    if kind == "choice":
+        game.apply(game.options[int(arg)][0])
+    elif kind == "craft":
+        game.apply("6")
+        game.apply(CRAFT_KEYS[arg])
+    elif kind == "move":
+        game.apply("7")
+        game.apply(TRAVEL_KEYS[arg])
+    elif kind == "hire":
+        game.apply("8")
+        if game.prompt == "hire_roster":
+            game.apply(str(len(game.hired_npcs) + 1))  # "Hire new NPC"
+        game.apply(HIRE_KEYS[arg])
+        game.apply(game.options[-1][0])  # Back out of the roster menu, which ends the day
+    elif kind == "eat":
+        game.apply("9")
+        game.apply(str(game.context.index(arg) + 1))
+    else:
+        game.apply(MENU_KEYS[name])
+
+class VecEnv:
+    """K games behind one reset/step interface, with preallocated NumPy buffers"""
+    def __init__(self, num_envs, seed=None, player_name="Agent"):
+        self.num_envs = num_envs
+        self.player_name = player_name
+        self.rng = random.Random(seed)
+        self.games = [None] * num_envs
+        self.obs = np.zeros((num_envs, OBS_SIZE), np.float32)
+        self.mask = np.zeros((num_envs, len(ACTIONS)), bool)
+        self.rewards = np.zeros(num_envs, np.float32)
+        self.dones = np.zeros(num_envs, bool)
+        self.endings = np.full(num_envs, -1, np.int8)
+        self.steps = 0
+
+    def reset(self, seeds=None):
+        """Start a new game in every env (seeds: one per env, or None to draw them); returns obs"""
+        for i in range(self.num_envs):
+            self.reset_one(i, None if seeds is None else seeds[i])
+        self.rewards[:] = 0
+        self.dones[:] = False
+        self.endings[:] = -1
+        return self.obs
+
+    def reset_one(self, i, seed=None):
+        game = GameEngine(seed=self.rng.getrandbits(63) if seed is None else seed)
+        game.start(self.player_name)
+        self.games[i] = game
+        self.write(i)
+
+    def step(self, actions):
+        """Apply one action index per env; returns (obs, rewards, dones, mask), all reused buffers"""
+        self.rewards[:] = 0
+        self.dones[:] = False
+        for i, action in enumerate(actions):
+            game = self.games[i]
+            if not self.mask[i, action]:
+                raise ValueError(f"env {i}: action {ACTIONS[action]} is not legal at prompt {game.prompt}")
+            run_action(game, ACTIONS[action])
+            if game.game_over:
+                self.rewards[i] = 1.0 if game.won else 0.0
+                self.dones[i] = True
+                self.endings[i] = ENDINGS.index(game.ending_type)
+                self.reset_one(i)
+            else:
+                self.write(i)
+        self.steps += self.num_envs
+        return self.obs, self.rewards, self.dones, self.mask
+
+    def write(self, i):
+        """Overwrite row ``i`` of the observation and mask buffers from game ``i``"""
+        game = self.games[i]
+        row = self.obs[i]
+        row[:] = 0
+        row[:LOCATION_AT] = (game.day, game.health, game.hunger, game.poison_counter,
+                             game.available_gold, game.clock.now % HOURS_PER_DAY)
+        row[LOCATION_SLOT[game.location]] = 1
+        for item, count in game.inventory.counts.items():
+            slot = ITEM_SLOT.get(item)
+            if slot is not None:
+                row[slot] = count
+        for flag in game.events_triggered:
+            slot = FLAG_SLOT.get(flag)
+            if slot is not None:
+                row[slot] = 1
+        crew = game.hired_npcs
+        if len(crew):
+            for worker in crew:
+                row[ROLE_SLOT[worker.type]] += 1
+            row[MENU_AT - 1] = sum(worker.morale for worker in crew) / len(crew)
+
+        mask = self.mask[i]
+        if game.prompt != "menu":
+            mask[:] = False
+            mask[FIRST_CHOICE:FIRST_CHOICE + len(game.options)] = True
+            return
+        row[MENU_AT] = 1
+        mask[:] = ALWAYS
+        mask[ACTION_INDEX["move:" + game.location]] = False
+        if game.options is MENU_WITHOUT_WAIT:
+            mask[WAIT] = False
+        if game.has_item("shelter_materials"):
+            mask[SHELTER] = True
+        for recipe in game.crafting.craftable:
+            action = CRAFT_ACTIONS.get(recipe)
+            if action is not None:
+                mask[action] = True
+        for action, cost in HIRE_ACTIONS:
+            if game.available_gold >= cost:
+                mask[action] = True
+        for food in game.inventory.by_category["food"]:
+            action = EAT_ACTIONS.get(food)
+            if action is not None:
+                mask[action] = True
+
+def main():
+    parser = argparse.ArgumentParser(description="Step K games with random legal actions and report throughput")
+    parser.add_argument("-k", "--envs", type=int, default=64)
+    parser.add_argument("-n", "--steps", type=int, default=100000, help="total env steps")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    env = VecEnv(args.envs, seed=args.seed)
+    np_rng = np.random.default_rng(args.seed)
+    noise = np.empty(env.mask.shape)
+    actions = np.empty(args.envs, np.intp)
+    env.reset()
+    episodes = wins = 0
+    started = time.perf_counter()
+    while env.steps < args.steps:
+        np_rng.random(out=noise)
+        noise *= env.mask
+        np.argmax(noise, axis=1, out=actions)
+        _, rewards, dones, _ = env.step(actions)
+        episodes += int(dones.sum())
+        wins += int(rewards.sum())
+    elapsed = time.perf_counter() - started
+    print(f"{env.steps:,} env steps over {args.envs} envs in {elapsed:.2f}s: {env.steps / elapsed:,.0f} steps/s")
+    print(f"{episodes:,} episodes finished, {wins:,} won")
+
+
+if __name__ == "__main__":
+    main()
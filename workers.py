@@ -0,0 +1,85 @@
+"""Daily jobs for hired workers, resolved in one batched pass.
+
+Every night each worker does the job of their role. Success rolls use
+the same rate as hunt_with_hired (effectiveness, +10 when morale is 70
+or more, -10 below 40) and are drawn for the whole crew at once; for
+crews of VECTOR_MIN or more with NumPy installed, the rolls, rewards and
+morale changes are vectorized. The batch draws one seed from
+``game.rng``, so runs stay reproducible for a given seed (the NumPy and
+pure-Python paths draw different rolls).
+"""
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Role -> (min, max) amount earned per successful job: raw_meat for hunters,
+# berries for gatherers, gold for scouts, and raw_meat turned into cooked_meat for cooks
+JOBS = {
+    "hunter": (1, 1),
+    "gatherer": (1, 2),
+    "scout": (3, 12),
+    "cook": (1, 1),
+}
+MORALE_ON_SUCCESS = 5
+MORALE_ON_FAILURE = -5
+
+ROLES = list(JOBS)
+VECTOR_MIN = 64  # Smaller crews are faster in plain Python
+
+
+def success_rate(effectiveness, morale):
+    return effectiveness + (10 if morale >= 70 else -10 if morale < 40 else 0)
+
+def roll_crew(crew, seed):
+    """Roll the crew's jobs: returns (new morale per worker, {role: amount earned} for every role)"""
+    if np is not None and len(crew) >= VECTOR_MIN:
+        n = len(crew)
+        effectiveness = np.fromiter((w.effectiveness for w in crew), np.int16, n)
+        morale = np.fromiter((w.morale for w in crew), np.int16, n)
+        role = np.fromiter((ROLES.index(w.type) if w.type in JOBS else len(ROLES) for w in crew), np.int8, n)
+        low = np.array([JOBS[r][0] for r in ROLES] + [0])[role]
+        high = np.array([JOBS[r][1] for r in ROLES] + [0])[role]
+        rates = effectiveness + np.where(morale >= 70, 10, np.where(morale < 40, -10, 0))
+        rng = np.random.default_rng(seed)
+        succeeded = rng.integers(1, 101, n) <= rates
+        amounts = np.where(succeeded, rng.integers(low, high + 1), 0)
+        morale = np.clip(morale + np.where(succeeded, MORALE_ON_SUCCESS, MORALE_ON_FAILURE), 0, 100)
+        totals = np.bincount(role, weights=amounts, minlength=len(ROLES) + 1)
+        return morale.tolist(), {r: int(totals[i]) for i, r in enumerate(ROLES)}
+    rng = random.Random(seed)
+    morale, totals = [], dict.fromkeys(ROLES, 0)
+    for w in crew:
+        ok = rng.randint(1, 100) <= success_rate(w.effectiveness, w.morale)
+        if ok and w.type in JOBS:
+            low, high = JOBS[w.type]
+            totals[w.type] += rng.randint(low, high)
+        morale.append(max(0, min(100, w.morale + (MORALE_ON_SUCCESS if ok else MORALE_ON_FAILURE))))
+    return morale, totals
+
+def run_jobs(game):
+    """Give every hired worker their daily job, then apply rewards and morale in bulk"""
+    crew = list(game.hired_npcs)
+    if not crew:
+        return
+    morale, earned = roll_crew(crew, game.rng.getrandbits(64))
+    for worker, value in zip(crew, morale):
+        worker.morale = value
+
+    if earned["hunter"]:
+        game.inventory.add("raw_meat", earned["hunter"])
+        game.say(f"Your hunters bring back {earned['hunter']} raw meat.")
+    if earned["gatherer"]:
+        game.inventory.add("berries", earned["gatherer"])
+        game.say(f"Your gatherers collect {earned['gatherer']} berries.")
+    if earned["scout"]:
+        game.available_gold += earned["scout"]
+        game.say(f"Your scouts find {earned['scout']} gold. Total: {game.available_gold}")
+    cooked = min(earned["cook"], game.inventory.count("raw_meat"))
+    if cooked:
+        for _ in range(cooked):
+            game.inventory.remove("raw_meat")
+        game.inventory.add("cooked_meat", cooked)
+        game.say(f"Your cooks prepare {cooked} cooked meat.")